@@ -12,18 +12,317 @@ Melhorias implementadas:
 8. Melhor compatibilidade cross-platform
 """
 
+import asyncio
+import atexit
+import ipaddress
 import logging
+import os
 import subprocess
 import platform
 import time
 import json
 import socket
 import re
+import math
+import struct
+import sys
+import queue
+import threading
+import weakref
 from pathlib import Path
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from bisect import bisect_right
 from typing import Dict, List, Optional, Tuple, Any
 from datetime import datetime, timedelta
-from statistics import mean, stdev
-from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import icmplib  # Opcional: ping ICMP em processo, sem chamar o comando ping
+except ImportError:
+    icmplib = None
+
+
+# Padrões regex para output de ping (compilados uma única vez no carregamento).
+# Operam sobre bytes: o output do ping é ASCII, exceto acentos do Windows PT-BR,
+# e assim evitamos decodificar o texto a cada ping.
+_PING_RE_FLAGS = re.IGNORECASE | re.MULTILINE
+# Windows (PT-BR): "Média = 123ms" — "é" em UTF-8, cp850 ou latin-1
+_WINDOWS_PT_AVG_RE = re.compile(rb'M(?:e|\xc3\xa9|[\x82\xe9])dia\s*=\s*(\d+(?:\.\d+)?)ms', _PING_RE_FLAGS)
+# Windows (EN): "Average = 123ms"
+_WINDOWS_EN_AVG_RE = re.compile(rb'Average\s*=\s*(\d+(?:\.\d+)?)ms', _PING_RE_FLAGS)
+# Linux/macOS: "rtt min/avg/max/mdev = 12.3/45.6/78.9/10.2 ms"
+_UNIX_RTT_RE = re.compile(rb'rtt\s+min/avg/max/(?:mdev|stddev)\s*=\s*[\d.]+/([\d.]+)/[\d.]+/[\d.]+\s*ms', _PING_RE_FLAGS)
+# Alternativa Linux/macOS
+_UNIX_ROUND_TRIP_RE = re.compile(rb'round-trip\s+min/avg/max/(?:mdev|stddev)\s*=\s*[\d.]+/([\d.]+)/[\d.]+/[\d.]+\s*ms', _PING_RE_FLAGS)
+# Padrão genérico: "time=123ms" ou "time=123.45ms"
+_GENERIC_TIME_RE = re.compile(rb'time[=<]\s*(\d+(?:\.\d+)?)\s*ms', _PING_RE_FLAGS)
+
+# Padrões relevantes para cada SO, na ordem em que são tentados
+_PING_PATTERNS_BY_OS = {
+    'Windows': (_WINDOWS_PT_AVG_RE, _WINDOWS_EN_AVG_RE, _GENERIC_TIME_RE),
+    'Linux': (_UNIX_RTT_RE, _UNIX_ROUND_TRIP_RE, _GENERIC_TIME_RE),
+    'Darwin': (_UNIX_ROUND_TRIP_RE, _UNIX_RTT_RE, _GENERIC_TIME_RE),
+}
+# SO desconhecido: tentar todos
+_PING_PATTERNS = (
+    _WINDOWS_PT_AVG_RE, _WINDOWS_EN_AVG_RE, _UNIX_RTT_RE, _UNIX_ROUND_TRIP_RE, _GENERIC_TIME_RE
+)
+
+# Fallback: valor "=<número>ms" no fim da linha. Em outros idiomas isso pega
+# o RTT de cada resposta (Linux/macOS) ou a média do resumo (Windows), sem
+# casar com TTLs e contadores no meio das linhas.
+_MS_LINE_END_RE = re.compile(rb'[=<]\s*(\d+(?:\.\d+)?)\s*ms\s*$', re.MULTILINE)
+
+# RTT de cada resposta individual: "time=12.3 ms" (Linux/macOS/Windows EN)
+# ou "tempo=12ms" (Windows PT-BR)
+_PING_SAMPLE_RE = re.compile(rb'(?:time|tempo)[=<]\s*(\d+(?:\.\d+)?)\s*ms', re.IGNORECASE)
+
+# Intervalo entre pings de uma mesma invocação (segundos). 0.2s é o mínimo
+# aceito pelo ping de usuários sem privilégios na maioria dos sistemas.
+PING_INTERVAL = 0.2
+
+# Número máximo de métricas mantidas em memória
+MAX_METRICS = 1000
+
+# Intervalo mínimo entre gravações do histórico em disco (segundos)
+HISTORY_WRITE_INTERVAL = 1.0
+
+# Tempo máximo (segundos) de espera pela thread de gravação em close()
+HISTORY_CLOSE_TIMEOUT = 2.0
+
+# Validade dos resultados de teste de DNS em cache (segundos)
+DNS_CACHE_TTL = 30
+
+# Validade dos endereços resolvidos dos hosts de ping (segundos)
+ADDRESS_CACHE_TTL = 60
+
+# Validade do relatório de compute_report() sem novas métricas (segundos)
+REPORT_CACHE_TTL = 30
+
+# Cabeçalho do arquivo binário de histórico: assinatura + número de métricas
+_HISTORY_MAGIC = b'HTH1'
+_HISTORY_HEADER = struct.Struct('<4sI')
+
+
+# Faixas de pontuação por métrica: (limites crescentes, scores, alertas).
+# O valor cai na faixa i = número de limites <= valor (bisect_right), o que
+# equivale à cadeia "if valor < limite" original. Alertas usam str.format.
+_LATENCY_BUCKETS = (
+    (20, 50, 100, 200, 300),
+    (100, 90, 70, 50, 30, 10),
+    (None, None,
+     "Latência elevada: {:.1f}ms",
+     "⚠ Latência alta: {:.1f}ms",
+     "🔴 Latência crítica: {:.1f}ms",
+     "🔴 Latência severa: {:.1f}ms"),
+)
+_PACKET_LOSS_BUCKETS = (
+    (sys.float_info.min, 1, 5, 10, 20),  # primeira faixa: exatamente 0%
+    (100, 95, 80, 60, 40, 20),
+    (None, None,
+     "Perda de pacotes: {:.1f}%",
+     "⚠ Perda de pacotes significativa: {:.1f}%",
+     "🔴 Perda de pacotes alta: {:.1f}%",
+     "🔴 Perda de pacotes crítica: {:.1f}%"),
+)
+_JITTER_BUCKETS = (
+    (5, 10, 30, 50, 100),
+    (100, 90, 70, 50, 30, 10),
+    (None, None, None,
+     "Jitter elevado: {:.1f}ms",
+     "⚠ Jitter alto: {:.1f}ms",
+     "🔴 Jitter crítico: {:.1f}ms"),
+)
+_UPTIME_BUCKETS = (
+    (80, 90, 95, 99),
+    (30, 50, 70, 85, 100),
+    ("⚠ Uptime crítico: {:.1f}%",
+     "Uptime baixo: {:.1f}%",
+     None, None, None),
+)
+
+# Categorias do score final, pelo mesmo esquema de faixas (bisect_right)
+_CATEGORY_THRESHOLDS = (40, 60, 80)
+_CATEGORY_NAMES = ("Ruim", "Regular", "Bom", "Excelente")
+
+
+def _bucket_score(buckets: Tuple[tuple, tuple, tuple], value: float,
+                  alerts: Optional[List[str]] = None) -> int:
+    """
+    Retorna o score da faixa em que ``value`` cai, registrando o alerta da faixa.
+    
+    Args:
+        buckets (tuple): (limites, scores, alertas) — ver _LATENCY_BUCKETS
+        value (float): Valor medido
+        alerts (list): Lista onde o alerta (se houver) é adicionado;
+                       None para calcular apenas o score
+        
+    Returns:
+        int: Score da faixa
+    """
+    thresholds, scores, templates = buckets
+    i = bisect_right(thresholds, value)
+    if alerts is not None and templates[i]:
+        alerts.append(templates[i].format(value))
+    return scores[i]
+
+
+def _welford(samples: List[float]) -> Tuple[float, float]:
+    """
+    Calcula média e desvio padrão amostral em uma única passada (Welford).
+    
+    Args:
+        samples (list): Valores (ao menos um)
+        
+    Returns:
+        tuple: (média, desvio padrão) — desvio 0 se houver um só valor
+    """
+    n = 0
+    avg = 0.0
+    m2 = 0.0
+    for x in samples:
+        n += 1
+        delta = x - avg
+        avg += delta / n
+        m2 += delta * (x - avg)
+    return avg, math.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+
+
+# Trackers ainda abertos, fechados (com o histórico gravado) na saída do
+# interpretador; referências fracas para não manter instâncias vivas
+_open_trackers = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_trackers():
+    """Fecha os trackers ainda abertos ao encerrar o interpretador."""
+    for tracker in list(_open_trackers):
+        tracker.close()
+
+
+class PingInterrupted(Exception):
+    """Bateria de pings interrompida por ``stop_monitoring()`` antes de terminar."""
+
+
+class MetricsHistory:
+    """
+    Histórico de métricas em buffer circular com uma coluna por campo.
+    
+    Em vez de um dict por métrica, cada campo fica em um ``array.array`` de
+    tipo fixo (8 bytes por latência/timestamp, 1 byte por score), o que
+    reduz memória e permite calcular estatísticas sem acessar dicts.
+    Latência ``NaN`` representa um teste sem resposta.
+    
+    Attributes:
+        capacity (int): Número máximo de métricas mantidas
+    """
+    
+    def __init__(self, capacity: int = MAX_METRICS):
+        self.capacity = capacity
+        self._timestamps = array('d', bytes(8 * capacity))
+        self._latencies = array('d', bytes(8 * capacity))
+        self._scores = array('B', bytes(capacity))
+        self._next = 0  # Próxima posição de escrita
+        self._size = 0
+        self._connected = 0  # Métricas com resposta atualmente no buffer
+        self.version = 0  # Incrementado a cada append (invalida caches derivados)
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: float, latency: Optional[float], score: int):
+        """
+        Adiciona uma métrica, descartando a mais antiga se estiver cheio.
+        
+        Args:
+            timestamp (float): Momento do teste (epoch em segundos)
+            latency (float): Latência em ms, ou None se sem resposta
+            score (int): Score de saúde (0-100)
+        """
+        i = self._next
+        if self._size == self.capacity and self._latencies[i] == self._latencies[i]:
+            self._connected -= 1  # Sobrescrevendo uma métrica com resposta
+        if latency is not None:
+            self._connected += 1
+        self._timestamps[i] = timestamp
+        self._latencies[i] = math.nan if latency is None else latency
+        self._scores[i] = score
+        self._next = (i + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+        self.version += 1
+    
+    def _positions(self, count: Optional[int] = None) -> range:
+        """Posições físicas das últimas ``count`` métricas (mais antiga primeiro)."""
+        n = self._size if count is None else max(0, min(count, self._size))
+        first = self._next - n
+        return range(first, first + n)
+    
+    def latencies(self, count: Optional[int] = None) -> List[float]:
+        """Latências válidas (com resposta) das últimas ``count`` métricas."""
+        values = self._latencies
+        samples = (values[i] for i in self._positions(count))
+        return [v for v in samples if v == v]  # NaN != NaN
+    
+    def connected_count(self, count: Optional[int] = None) -> int:
+        """Quantas das últimas ``count`` métricas tiveram resposta."""
+        if count is None or count >= self._size:
+            return self._connected  # O(1) para o buffer inteiro
+        values = self._latencies
+        return sum(1 for i in self._positions(count) if values[i] == values[i])
+    
+    def to_bytes(self) -> bytes:
+        """
+        Serializa o histórico em formato binário compacto.
+        
+        Layout: cabeçalho ``_HISTORY_HEADER`` seguido das colunas de
+        timestamps, latências e scores, em little-endian e em ordem cronológica.
+        """
+        positions = self._positions()
+        columns = [
+            array(column.typecode, (column[i] for i in positions))
+            for column in (self._timestamps, self._latencies, self._scores)
+        ]
+        if sys.byteorder == 'big':
+            for column in columns:
+                column.byteswap()
+        header = _HISTORY_HEADER.pack(_HISTORY_MAGIC, len(positions))
+        return header + b''.join(column.tobytes() for column in columns)
+    
+    def load_bytes(self, data: bytes):
+        """
+        Adiciona métricas serializadas por ``to_bytes``.
+        
+        Raises:
+            ValueError: Se os dados não estiverem no formato esperado
+        """
+        magic, count = _HISTORY_HEADER.unpack_from(data)
+        if magic != _HISTORY_MAGIC:
+            raise ValueError("Formato de histórico desconhecido")
+        
+        columns = [array(typecode) for typecode in ('d', 'd', 'B')]
+        expected = _HISTORY_HEADER.size + count * sum(column.itemsize for column in columns)
+        if len(data) != expected:
+            raise ValueError("Arquivo de histórico truncado ou corrompido")
+        
+        offset = _HISTORY_HEADER.size
+        for column in columns:
+            size = count * column.itemsize
+            column.frombytes(data[offset:offset + size])
+            offset += size
+            if sys.byteorder == 'big':
+                column.byteswap()
+        
+        for timestamp, latency, score in zip(*columns):
+            self.append(timestamp, None if latency != latency else latency, score)
+    
+    def rows(self, count: Optional[int] = None) -> List[Tuple[float, Optional[float], int]]:
+        """Últimas ``count`` métricas como tuplas (timestamp, latência, score)."""
+        rows = []
+        for i in self._positions(count):
+            latency = self._latencies[i]
+            rows.append((self._timestamps[i], None if latency != latency else latency, self._scores[i]))
+        return rows
 
 
 class HealthTracker:
@@ -31,7 +330,7 @@ class HealthTracker:
     Classe responsável por monitorar a saúde da conexão de internet.
     
     Attributes:
-        metrics (list): Lista de métricas coletadas
+        metrics (MetricsHistory): Métricas coletadas (limitadas a MAX_METRICS)
         is_monitoring (bool): Indica se o monitoramento está ativo
         ping_host (str): Host usado para testes de ping
     """
@@ -44,11 +343,25 @@ class HealthTracker:
             ping_host (str): Host primário para testes de ping (default: Google DNS)
         """
         self.logger = logging.getLogger(__name__)
-        self.metrics = []
+        self.metrics = MetricsHistory()
         self.is_monitoring = False
         self.ping_host = ping_host
+        
+        # Sinaliza parada: interrompe esperas entre pings imediatamente. Cada
+        # stop_monitoring() troca o evento, então só as baterias em andamento param
+        self._stop_event = threading.Event()
         self.os_type = platform.system()
         
+        # Flags do ping resolvidas uma única vez (o SO não muda durante a execução):
+        # (flag de contagem, flag de timeout, multiplicador do timeout)
+        if self.os_type == "Windows":
+            self._ping_template = ('-n', '-w', 1000)  # timeout em ms
+        elif self.os_type == "Darwin":  # macOS
+            self._ping_template = ('-c', '-W', 1000)  # timeout em ms
+        else:  # Linux
+            self._ping_template = ('-c', '-W', 1)     # timeout em segundos
+        self._ping_patterns = _PING_PATTERNS_BY_OS.get(self.os_type, _PING_PATTERNS)
+        
         # Múltiplos hosts para redundância
         self.ping_hosts = [
             '8.8.8.8',      # Google DNS
@@ -75,24 +388,47 @@ class HealthTracker:
             'total_downtime': 0  # segundos
         }
         
-        # Cache para evitar testes redundantes
-        self.cache = {
-            'last_test_time': None,
-            'last_test_result': None,
-            'cache_duration': 2  # segundos
-        }
+        # Cache por host para evitar testes redundantes
+        self._cache: Dict[str, Tuple[float, Optional[float]]] = {}  # host -> (instante, latência)
+        self.cache_duration = 2  # segundos
+        self._dns_cache: Dict[str, Tuple[float, float]] = {}  # domínio -> (instante, tempo em ms)
+        self._report_cache: Optional[Tuple[float, int, Dict[str, Any]]] = None  # (instante, versão das métricas, relatório)
+        self._address_cache: Dict[str, Tuple[float, str]] = {}  # hostname -> (instante, IP)
         
         # Arquivo para salvar histórico
-        self.history_file = Path(__file__).parent / 'health_history.json'
+        self.history_file = Path(__file__).parent / 'health_history.bin'
         try:
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             self.logger.warning(f"Não foi possível criar diretório de logs: {e}")
-            self.history_file = Path.home() / '.health_tracker' / 'health_history.json'
+            self.history_file = Path.home() / '.health_tracker' / 'health_history.bin'
             self.history_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Gravação do histórico em thread própria, fora do caminho das medições
+        # (iniciada no primeiro snapshot; None na fila encerra a thread)
+        self._save_queue = queue.Queue(maxsize=4)
+        self._writer_thread: Optional[threading.Thread] = None
+        self._writer_lock = threading.Lock()
+        self._writer_stop = threading.Event()
+        self._closed = False
+        
+        # Ping em processo via icmplib (se instalado). Linux/macOS usam sockets
+        # ICMP sem privilégios; no Windows o modo privilegiado é necessário.
+        self._icmp_enabled = icmplib is not None
+        self._icmp_privileged = self.os_type == "Windows"
+        
+        # Event loop dos pings paralelos: criado uma vez e reutilizado em
+        # todas as chamadas (de qualquer thread) até close()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        _open_trackers.add(self)
+        
         self.logger.info(f"HealthTracker inicializado (OS: {self.os_type})")
         
+        # Resolver em segundo plano os hosts de ping informados por nome
+        self.warm_dns([self.ping_host] + self.ping_hosts)
+        
         # Carregar histórico se existir
         self._load_history()
     
@@ -104,8 +440,47 @@ class HealthTracker:
     def stop_monitoring(self):
         """Para o monitoramento contínuo."""
         self.is_monitoring = False
+        self._stop_event.set()
+        self._stop_event = threading.Event()
         self.logger.info("Monitoramento parado")
     
+    def close(self):
+        """
+        Encerra as threads em segundo plano da tracker.
+        
+        Grava o último snapshot pendente do histórico (aguardando a thread de
+        gravação) e para o event loop usado pelos pings paralelos.
+        """
+        self._close_writer()
+        _open_trackers.discard(self)
+        
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=2)
+            if not thread.is_alive():
+                loop.close()
+    
+    def _run_async(self, coro):
+        """
+        Executa uma corrotina no event loop da tracker e aguarda o resultado.
+        
+        O loop roda em uma thread daemon própria, criada na primeira chamada,
+        e pode ser usado simultaneamente por várias threads da GUI.
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name='HealthTrackerLoop', daemon=True
+                )
+                self._loop_thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coro, loop).result()
+    
     def ping_test(self, host: Optional[str] = None, count: int = 1, timeout: int = 5) -> Optional[float]:
         """
         Executa teste de ping e retorna latência.
@@ -121,26 +496,23 @@ class HealthTracker:
         host = host or self.ping_host
         
         # Verificar cache
-        if self._check_cache(host):
-            return self.cache['last_test_result']
+        cached = self._check_cache(host)
+        if cached is not None:
+            return cached[1]
+        
+        # Preferir ICMP em processo, sem criar um processo de ping
+        rtts = self._icmp_ping(host, count, timeout)
+        if rtts is not None:
+            return self._record_rtts(host, rtts)
         
         try:
-            # Comando ping varia por SO
-            if self.os_type == "Windows":
-                command = ['ping', '-n', str(count), '-w', str(timeout * 1000), host]
-            elif self.os_type == "Darwin":  # macOS
-                command = ['ping', '-c', str(count), '-W', str(timeout * 1000), host]
-            else:  # Linux
-                command = ['ping', '-c', str(count), '-W', str(timeout), host]
+            command = self._build_ping_command(self._resolve_target(host), count, timeout)
             
             # Executar ping com encoding apropriado
             result = subprocess.run(
                 command,
                 capture_output=True,
-                text=True,
-                timeout=timeout + 2,
-                encoding='utf-8',
-                errors='replace'
+                timeout=timeout + 2
             )
             
             if result.returncode != 0:
@@ -171,47 +543,356 @@ class HealthTracker:
             self.logger.error(f"Erro ao executar ping: {e}")
             return None
     
-    def _parse_ping_output(self, output: str) -> Optional[float]:
+    def _icmp_ping(self, host: str, count: int, timeout: int) -> Optional[List[float]]:
+        """
+        Envia pings ICMP diretamente pelo processo usando icmplib.
+        
+        Args:
+            host (str): Host para ping
+            count (int): Número de pings a enviar
+            timeout (int): Timeout por resposta em segundos
+            
+        Returns:
+            list: Latências em ms das respostas (vazia se nenhuma), ou None se
+                  icmplib não estiver disponível/permitido — nesse caso o
+                  chamador deve usar o comando ping
+        """
+        if not self._icmp_enabled:
+            return None
+        
+        try:
+            result = icmplib.ping(
+                self._resolve_target(host), count=count, interval=PING_INTERVAL,
+                timeout=timeout, privileged=self._icmp_privileged
+            )
+            return list(result.rtts)
+        except icmplib.SocketPermissionError:
+            self._disable_icmp()
+            return None
+        except icmplib.ICMPLibError as e:
+            self.logger.debug(f"Ping ICMP falhou para {host}: {e}")
+            return []
+        except Exception as e:
+            self.logger.debug(f"Erro no ping ICMP ({e}), usando comando ping")
+            return None
+    
+    async def _icmp_ping_async(self, host: str, count: int, timeout: int) -> Optional[List[float]]:
+        """Versão assíncrona de _icmp_ping (mesmo retorno)."""
+        if not self._icmp_enabled:
+            return None
+        
+        try:
+            result = await icmplib.async_ping(
+                await self._resolve_target_async(host), count=count, interval=PING_INTERVAL,
+                timeout=timeout, privileged=self._icmp_privileged
+            )
+            return list(result.rtts)
+        except icmplib.SocketPermissionError:
+            self._disable_icmp()
+            return None
+        except icmplib.ICMPLibError as e:
+            self.logger.debug(f"Ping ICMP falhou para {host}: {e}")
+            return []
+        except Exception as e:
+            self.logger.debug(f"Erro no ping ICMP ({e}), usando comando ping")
+            return None
+    
+    def _disable_icmp(self):
+        """Desativa o ping via icmplib após erro de permissão."""
+        if self._icmp_enabled:
+            self._icmp_enabled = False
+            self.logger.info("Sem permissão para sockets ICMP, usando comando ping")
+    
+    def _record_rtts(self, host: str, rtts: List[float]) -> Optional[float]:
+        """Calcula a latência média dos RTTs e atualiza o cache do host."""
+        latency = sum(rtts) / len(rtts) if rtts else None
+        if latency is not None:
+            self.logger.debug(f"Ping para {host}: {latency:.2f}ms")
+        else:
+            self.logger.debug(f"Ping falhou para {host} (sem respostas)")
+        self._update_cache(host, latency)
+        return latency
+    
+    def _build_ping_command(self, host: str, count: int, timeout: int) -> List[str]:
+        """Monta o comando ping a partir do template do SO."""
+        count_flag, wait_flag, wait_mult = self._ping_template
+        return ['ping', count_flag, str(count), wait_flag, str(timeout * wait_mult), host]
+    
+    def _cached_address(self, host: str) -> Optional[str]:
+        """
+        Retorna o IP a usar para ``host`` sem consultar o DNS.
+        
+        Args:
+            host (str): IP ou hostname
+            
+        Returns:
+            str: O próprio host se for um IP, o IP em cache se ainda válido, ou None
+        """
+        try:
+            ipaddress.ip_address(host)
+            return host
+        except ValueError:
+            pass
+        
+        cached = self._address_cache.get(host)
+        if cached is not None and time.monotonic() - cached[0] < ADDRESS_CACHE_TTL:
+            return cached[1]
+        return None
+    
+    def _store_address(self, host: str, infos: List[tuple]) -> str:
+        """Guarda o primeiro endereço retornado por getaddrinfo e o retorna."""
+        address = infos[0][4][0]
+        self._address_cache[host] = (time.monotonic(), address)
+        return address
+    
+    def _resolve_target(self, host: str) -> str:
+        """
+        Resolve o host de ping para um IP, reaproveitando resoluções recentes.
+        
+        Evita que cada ping (icmplib ou comando) consulte o resolver de novo.
+        Em caso de falha retorna o próprio host e deixa o ping reportar o erro.
+        
+        Args:
+            host (str): IP ou hostname
+            
+        Returns:
+            str: Endereço IP (ou o host original se a resolução falhar)
+        """
+        address = self._cached_address(host)
+        if address is not None:
+            return address
+        try:
+            return self._store_address(host, socket.getaddrinfo(host, None, type=socket.SOCK_STREAM))
+        except (socket.gaierror, IndexError) as e:
+            self.logger.debug(f"Não foi possível resolver {host}: {e}")
+            return host
+    
+    async def _resolve_target_async(self, host: str) -> str:
+        """Versão assíncrona de _resolve_target (não bloqueia o event loop)."""
+        address = self._cached_address(host)
+        if address is not None:
+            return address
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(host, None, type=socket.SOCK_STREAM)
+            return self._store_address(host, infos)
+        except (socket.gaierror, IndexError) as e:
+            self.logger.debug(f"Não foi possível resolver {host}: {e}")
+            return host
+    
+    def warm_dns(self, hosts: List[str]):
+        """
+        Pré-resolve, em uma thread em segundo plano, os hosts informados por nome.
+        
+        Args:
+            hosts (list): Hosts de ping (IPs são ignorados)
+        """
+        names = [host for host in dict.fromkeys(hosts) if self._cached_address(host) is None]
+        if not names:
+            return
+        
+        def warm():
+            for name in names:
+                self._resolve_target(name)
+        
+        threading.Thread(target=warm, name='HealthDNSWarmup', daemon=True).start()
+    
+    async def _ping_async(self, host: str, count: int = 1, timeout: int = 5) -> Optional[float]:
+        """
+        Versão assíncrona de ping_test, usada para testar vários hosts em paralelo.
+        
+        Args:
+            host (str): Host para ping
+            count (int): Número de pings a enviar
+            timeout (int): Timeout em segundos
+            
+        Returns:
+            float: Latência média em ms, ou None se falhar
+        """
+        cached = self._check_cache(host)
+        if cached is not None:
+            return cached[1]
+        
+        rtts = await self._icmp_ping_async(host, count, timeout)
+        if rtts is not None:
+            return self._record_rtts(host, rtts)
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self._build_ping_command(await self._resolve_target_async(host), count, timeout),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except FileNotFoundError:
+            self.logger.error("Comando 'ping' não encontrado no sistema")
+            return None
+        
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=timeout + 2)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"Timeout no ping para {host}")
+            self._update_cache(host, None)
+            return None
+        finally:
+            # Encerrar o processo se expirou ou se a tarefa foi cancelada
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        if proc.returncode != 0:
+            self.logger.debug(f"Ping falhou para {host} (returncode: {proc.returncode})")
+            self._update_cache(host, None)
+            return None
+        
+        latency = self._parse_ping_output(stdout)
+        if latency is not None:
+            self.logger.debug(f"Ping para {host}: {latency:.2f}ms")
+        else:
+            self.logger.warning(f"Não foi possível parsear output do ping para {host}")
+        self._update_cache(host, latency)
+        return latency
+    
+    async def _ping_hosts_async(self, hosts: List[str], count: int, timeout: float,
+                                first_only: bool = False) -> Tuple[Optional[str], float]:
+        """
+        Pinga vários hosts concorrentemente e retorna o mais rápido.
+        
+        Args:
+            hosts (list): Hosts a testar
+            count (int): Número de pings por host
+            timeout (float): Tempo máximo total em segundos
+            first_only (bool): Se True, retorna assim que algum host responder
+                               e cancela os pings pendentes
+            
+        Returns:
+            tuple: (host mais rápido ou None, latência em ms ou inf)
+        """
+        tasks = {asyncio.ensure_future(self._ping_async(host, count)): host for host in hosts}
+        pending = set(tasks)
+        best_host = None
+        best_latency = float('inf')
+        deadline = asyncio.get_running_loop().time() + timeout
+        
+        try:
+            while pending:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    break
+                done, pending = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    host = tasks[task]
+                    try:
+                        latency = task.result()
+                    except Exception as e:
+                        self.logger.debug(f"Erro ao testar {host}: {e}")
+                        continue
+                    if latency is not None and latency < best_latency:
+                        best_latency = latency
+                        best_host = host
+                
+                if first_only and best_host is not None:
+                    break
+        finally:
+            # Cancelar pings restantes e aguardar a limpeza dos processos
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        return best_host, best_latency
+    
+    def ping_test_multi(self, host: Optional[str] = None, count: int = 10, timeout: int = 5) -> List[float]:
+        """
+        Envia vários pings em uma única invocação do comando e retorna cada RTT.
+        
+        Evita criar um processo por ping: o próprio ``ping`` faz o espaçamento
+        entre as requisições (``-i``), e as latências individuais são extraídas
+        do output para cálculo de packet loss e jitter.
+        
+        Args:
+            host (str): Host para ping (usa self.ping_host se None)
+            count (int): Número de pings a enviar
+            timeout (int): Timeout por resposta em segundos
+            
+        Returns:
+            list: Latências em ms das respostas recebidas (vazia se nenhuma)
+        
+        Raises:
+            PingInterrupted: Se ``stop_monitoring()`` interromper a bateria; as
+                             respostas que faltam não são perda de pacotes
+        """
+        host = host or self.ping_host
+        
+        # Preferir ICMP em processo (também evita o espaçamento fixo do Windows)
+        rtts = self._icmp_ping(host, count, timeout)
+        if rtts is not None:
+            return rtts
+        
+        if self.os_type == "Windows":
+            # O ping do Windows não aceita intervalo customizado (espera ~1s
+            # entre requisições), então mantemos um processo por ping
+            stop = self._stop_event
+            pings = []
+            for i in range(count):
+                latency = self.ping_test(host, count=1, timeout=timeout)
+                if latency is not None:
+                    pings.append(latency)
+                # Espera interrompível: stop_monitoring() encerra o loop na hora
+                if i < count - 1 and stop.wait(0.05):
+                    raise PingInterrupted(f"Ping múltiplo interrompido após {i + 1}/{count} pings")
+            return pings
+        
+        count_flag, wait_flag, wait_mult = self._ping_template
+        command = ['ping', count_flag, str(count), '-i', str(PING_INTERVAL),
+                   wait_flag, str(timeout * wait_mult), self._resolve_target(host)]
+        
+        try:
+            # Não verificamos returncode: com perda parcial o ping pode
+            # retornar != 0 mesmo tendo respostas válidas
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                timeout=count * PING_INTERVAL + timeout + 2
+            )
+            
+            pings = [float(n) for n in _PING_SAMPLE_RE.findall(result.stdout)]
+            self.logger.debug(f"Ping múltiplo para {host}: {len(pings)}/{count} respostas")
+            return pings
+            
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Timeout no ping múltiplo para {host}")
+            return []
+        except FileNotFoundError:
+            self.logger.error("Comando 'ping' não encontrado no sistema")
+            return []
+        except Exception as e:
+            self.logger.error(f"Erro ao executar ping múltiplo: {e}")
+            return []
+    
+    def _parse_ping_output(self, output: bytes) -> Optional[float]:
         """
         Extrai latência média do output do ping usando regex.
         
         Args:
-            output (str): Output do comando ping
+            output (bytes): Output bruto (não decodificado) do comando ping
             
         Returns:
             float: Latência em ms, ou None se não conseguir parsear
         """
         try:
-            # Padrões regex para diferentes sistemas operacionais
-            patterns = [
-                # Windows (PT-BR): "Média = 123ms"
-                r'M[ée]dia\s*=\s*(\d+(?:\.\d+)?)ms',
-                # Windows (EN): "Average = 123ms"
-                r'Average\s*=\s*(\d+(?:\.\d+)?)ms',
-                # Linux/macOS: "rtt min/avg/max/mdev = 12.3/45.6/78.9/10.2 ms"
-                r'rtt\s+min/avg/max/(?:mdev|stddev)\s*=\s*[\d.]+/([\d.]+)/[\d.]+/[\d.]+\s*ms',
-                # Alternativa Linux/macOS
-                r'round-trip\s+min/avg/max/(?:mdev|stddev)\s*=\s*[\d.]+/([\d.]+)/[\d.]+/[\d.]+\s*ms',
-                # Padrão genérico: "time=123ms" ou "time=123.45ms"
-                r'time[=<]\s*(\d+(?:\.\d+)?)\s*ms'
-            ]
-            
-            # Tentar cada padrão
-            for pattern in patterns:
-                match = re.search(pattern, output, re.IGNORECASE | re.MULTILINE)
+            # Tentar apenas os padrões do SO atual
+            for pattern in self._ping_patterns:
+                match = pattern.search(output)
                 if match:
                     latency = float(match.group(1))
                     return latency
             
-            # Se nenhum padrão funcionou, tentar extrair qualquer número seguido de "ms"
-            numbers = re.findall(r'(\d+(?:\.\d+)?)\s*ms', output)
+            # Se nenhum padrão funcionou, usar valores "=Nms" no fim das linhas
+            numbers = _MS_LINE_END_RE.findall(output)
             if numbers:
                 # Pegar a média dos valores encontrados
                 values = [float(n) for n in numbers]
-                # Filtrar valores muito altos (provavelmente timeout)
-                valid_values = [v for v in values if v < 5000]
-                if valid_values:
-                    return mean(valid_values)
+                return sum(values) / len(values)
             
             self.logger.debug(f"Não foi possível parsear output: {output[:200]}")
             return None
@@ -220,18 +901,21 @@ class HealthTracker:
             self.logger.error(f"Erro ao parsear output ping: {e}")
             return None
     
-    def _check_cache(self, host: str) -> bool:
-        """Verifica se há resultado válido em cache."""
-        if self.cache['last_test_time'] is None:
-            return False
+    def _check_cache(self, host: str) -> Optional[Tuple[float, Optional[float]]]:
+        """
+        Retorna a entrada em cache do host, se ainda válida.
         
-        elapsed = time.time() - self.cache['last_test_time']
-        return elapsed < self.cache['cache_duration']
+        Returns:
+            tuple: (instante do teste, latência) ou None se expirado/ausente
+        """
+        entry = self._cache.get(host)
+        if entry is None or time.monotonic() - entry[0] >= self.cache_duration:
+            return None
+        return entry
     
     def _update_cache(self, host: str, result: Optional[float]):
-        """Atualiza o cache com novo resultado."""
-        self.cache['last_test_time'] = time.time()
-        self.cache['last_test_result'] = result
+        """Atualiza o cache do host com novo resultado."""
+        self._cache[host] = (time.monotonic(), result)
     
     def check_connectivity(self, hosts: Optional[List[str]] = None) -> Tuple[bool, Optional[str]]:
         """
@@ -246,25 +930,10 @@ class HealthTracker:
         if hosts is None:
             hosts = self.ping_hosts
         
-        fastest_latency = float('inf')
-        fastest_host = None
-        
-        # Testar hosts em paralelo para maior velocidade
-        with ThreadPoolExecutor(max_workers=len(hosts)) as executor:
-            future_to_host = {
-                executor.submit(self.ping_test, host, 1): host 
-                for host in hosts
-            }
-            
-            for future in as_completed(future_to_host, timeout=10):
-                host = future_to_host[future]
-                try:
-                    latency = future.result()
-                    if latency is not None and latency < fastest_latency:
-                        fastest_latency = latency
-                        fastest_host = host
-                except Exception as e:
-                    self.logger.debug(f"Erro ao testar {host}: {e}")
+        # Testar hosts em paralelo; o primeiro a responder já confirma a conexão
+        fastest_host, fastest_latency = self._run_async(
+            self._ping_hosts_async(hosts, count=1, timeout=10, first_only=True)
+        )
         
         is_connected = fastest_host is not None
         
@@ -304,18 +973,14 @@ class HealthTracker:
         
         Returns:
             dict ou int: Score e métricas detalhadas se detailed=True, ou int se False
+        
+        Raises:
+            PingInterrupted: Se ``stop_monitoring()`` interromper os pings; não há
+                             score, pois os pings não enviados não são perda
         """
-        # Fazer múltiplos pings para calcular packet loss e jitter
-        pings = []
+        # Fazer múltiplos pings (uma única invocação) para calcular packet loss e jitter
         ping_count = 10
-        
-        for i in range(ping_count):
-            latency = self.ping_test(count=1)
-            if latency is not None:
-                pings.append(latency)
-            # Pequeno delay entre pings, mas não muito longo
-            if i < ping_count - 1:  # Não esperar no último
-                time.sleep(0.05)
+        pings = self.ping_test_multi(count=ping_count)
         
         if not pings:
             result = {
@@ -330,92 +995,15 @@ class HealthTracker:
             return result if detailed else 0
         
         # Calcular métricas
-        avg_latency = mean(pings)
-        min_latency = min(pings)
-        max_latency = max(pings)
+        # Jitter = desvio padrão da latência (média e desvio em uma passada)
+        avg_latency, jitter = _welford(pings)
         packet_loss_pct = ((ping_count - len(pings)) / ping_count) * 100
         
-        # Calcular jitter (desvio padrão da latência)
-        jitter = stdev(pings) if len(pings) > 1 else 0
-        
-        # Alertas
-        alerts = []
+        # Alertas só são montados quando o resultado detalhado é pedido
+        alerts = [] if detailed else None
         
-        # 1. Score de Latência (40%)
-        if avg_latency < 20:
-            latency_score = 100
-        elif avg_latency < 50:
-            latency_score = 90
-        elif avg_latency < 100:
-            latency_score = 70
-            alerts.append(f"Latência elevada: {avg_latency:.1f}ms")
-        elif avg_latency < 200:
-            latency_score = 50
-            alerts.append(f"⚠ Latência alta: {avg_latency:.1f}ms")
-        elif avg_latency < 300:
-            latency_score = 30
-            alerts.append(f"🔴 Latência crítica: {avg_latency:.1f}ms")
-        else:
-            latency_score = 10
-            alerts.append(f"🔴 Latência severa: {avg_latency:.1f}ms")
-        
-        # 2. Score de Packet Loss (30%)
-        if packet_loss_pct == 0:
-            packet_loss_score = 100
-        elif packet_loss_pct < 1:
-            packet_loss_score = 95
-        elif packet_loss_pct < 5:
-            packet_loss_score = 80
-            alerts.append(f"Perda de pacotes: {packet_loss_pct:.1f}%")
-        elif packet_loss_pct < 10:
-            packet_loss_score = 60
-            alerts.append(f"⚠ Perda de pacotes significativa: {packet_loss_pct:.1f}%")
-        elif packet_loss_pct < 20:
-            packet_loss_score = 40
-            alerts.append(f"🔴 Perda de pacotes alta: {packet_loss_pct:.1f}%")
-        else:
-            packet_loss_score = 20
-            alerts.append(f"🔴 Perda de pacotes crítica: {packet_loss_pct:.1f}%")
-        
-        # 3. Score de Jitter (20%)
-        if jitter < 5:
-            jitter_score = 100
-        elif jitter < 10:
-            jitter_score = 90
-        elif jitter < 30:
-            jitter_score = 70
-        elif jitter < 50:
-            jitter_score = 50
-            alerts.append(f"Jitter elevado: {jitter:.1f}ms")
-        elif jitter < 100:
-            jitter_score = 30
-            alerts.append(f"⚠ Jitter alto: {jitter:.1f}ms")
-        else:
-            jitter_score = 10
-            alerts.append(f"🔴 Jitter crítico: {jitter:.1f}ms")
-        
-        # 4. Score de Uptime (10%)
-        if self.metrics:
-            recent_metrics = self.metrics[-100:]
-            successful_tests = len([m for m in recent_metrics if m.get('connected', False)])
-            total_tests = len(recent_metrics)
-            uptime_percent = (successful_tests / total_tests) * 100 if total_tests > 0 else 100
-            
-            if uptime_percent >= 99:
-                uptime_score = 100
-            elif uptime_percent >= 95:
-                uptime_score = 85
-            elif uptime_percent >= 90:
-                uptime_score = 70
-            elif uptime_percent >= 80:
-                uptime_score = 50
-                alerts.append(f"Uptime baixo: {uptime_percent:.1f}%")
-            else:
-                uptime_score = 30
-                alerts.append(f"⚠ Uptime crítico: {uptime_percent:.1f}%")
-        else:
-            uptime_percent = 100.0
-            uptime_score = 100
+        latency_score, packet_loss_score, jitter_score, uptime_score, uptime_percent = \
+            self._compute_subscores(avg_latency, packet_loss_pct, jitter, alerts)
         
         # Calcular score final ponderado
         final_score = int(
@@ -425,6 +1013,9 @@ class HealthTracker:
             (uptime_score * 0.1)
         )
         
+        if not detailed:
+            return final_score
+        
         # Determinar categoria
         category = self.get_health_category(final_score)
         
@@ -433,8 +1024,8 @@ class HealthTracker:
             'category': category,
             'latency': {
                 'avg': round(avg_latency, 2),
-                'min': round(min_latency, 2),
-                'max': round(max_latency, 2)
+                'min': round(min(pings), 2),
+                'max': round(max(pings), 2)
             },
             'packet_loss': round(packet_loss_pct, 2),
             'jitter': round(jitter, 2),
@@ -444,7 +1035,42 @@ class HealthTracker:
             'alerts': alerts
         }
         
-        return result if detailed else final_score
+        return result
+    
+    def _compute_subscores(self, avg_latency: float, packet_loss_pct: float, jitter: float,
+                           alerts: Optional[List[str]] = None) -> Tuple[int, int, int, int, float]:
+        """
+        Calcula o score de cada componente do health score.
+        
+        Args:
+            avg_latency (float): Latência média em ms
+            packet_loss_pct (float): Perda de pacotes em %
+            jitter (float): Jitter em ms
+            alerts (list): Recebe os alertas gerados; None para pular alertas
+            
+        Returns:
+            tuple: (latência, packet loss, jitter, uptime, uptime em %)
+        """
+        # 1. Score de Latência (40%)
+        latency_score = _bucket_score(_LATENCY_BUCKETS, avg_latency, alerts)
+        
+        # 2. Score de Packet Loss (30%)
+        packet_loss_score = _bucket_score(_PACKET_LOSS_BUCKETS, packet_loss_pct, alerts)
+        
+        # 3. Score de Jitter (20%)
+        jitter_score = _bucket_score(_JITTER_BUCKETS, jitter, alerts)
+        
+        # 4. Score de Uptime (10%)
+        if self.metrics:
+            total_tests = min(len(self.metrics), 100)
+            successful_tests = self.metrics.connected_count(100)
+            uptime_percent = (successful_tests / total_tests) * 100 if total_tests > 0 else 100
+            uptime_score = _bucket_score(_UPTIME_BUCKETS, uptime_percent, alerts)
+        else:
+            uptime_percent = 100.0
+            uptime_score = 100
+        
+        return latency_score, packet_loss_score, jitter_score, uptime_score, uptime_percent
     
     def get_health_category(self, score: int) -> str:
         """
@@ -456,42 +1082,24 @@ class HealthTracker:
         Returns:
             str: Categoria ('Excelente', 'Bom', 'Regular', 'Ruim')
         """
-        if score >= 80:
-            return "Excelente"
-        elif score >= 60:
-            return "Bom"
-        elif score >= 40:
-            return "Regular"
-        else:
-            return "Ruim"
+        return _CATEGORY_NAMES[bisect_right(_CATEGORY_THRESHOLDS, score)]
     
     def log_metrics(self):
         """
         Coleta e salva métricas atuais.
         """
-        timestamp = datetime.now().isoformat()
-        latency = self.ping_test()
-        connected = latency is not None
-        
-        # Usar versão não detalhada para evitar muitos pings
-        score_data = self.get_health_score(detailed=False)
-        score = score_data if isinstance(score_data, int) else score_data.get('score', 0)
-        
-        metric = {
-            'timestamp': timestamp,
-            'latency': latency,
-            'connected': connected,
-            'score': score,
-            'category': self.get_health_category(score)
-        }
+        timestamp = time.time()
         
-        self.metrics.append(metric)
+        # Uma única bateria de pings alimenta tanto a latência quanto o score
+        health = self.get_health_score(detailed=True)
+        latency = health['latency']['avg'] if health['latency'] else None
+        connected = latency is not None
+        score = health['score']
         
-        # Limitar a 1000 métricas em memória
-        if len(self.metrics) > 1000:
-            self.metrics = self.metrics[-1000:]
+        # Buffer circular descarta automaticamente as mais antigas além de MAX_METRICS
+        self.metrics.append(timestamp, latency, score)
         
-        self.logger.debug(f"Métrica registrada: {metric}")
+        self.logger.debug(f"Métrica registrada: latência={latency}, conectado={connected}, score={score}")
         
         # Salvar em arquivo periodicamente
         if len(self.metrics) % 10 == 0:
@@ -507,7 +1115,16 @@ class HealthTracker:
         Returns:
             list: Últimas N métricas
         """
-        return self.metrics[-count:] if self.metrics else []
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(timestamp).isoformat(),
+                'latency': latency,
+                'connected': latency is not None,
+                'score': score,
+                'category': self.get_health_category(score)
+            }
+            for timestamp, latency, score in self.metrics.rows(count)
+        ]
     
     def get_statistics(self) -> Dict[str, float]:
         """
@@ -519,7 +1136,7 @@ class HealthTracker:
         if not self.metrics:
             return {}
         
-        latencies = [m['latency'] for m in self.metrics if m['latency'] is not None]
+        latencies = self.metrics.latencies()
         
         if not latencies:
             return {
@@ -529,7 +1146,7 @@ class HealthTracker:
             }
         
         return {
-            'avg_latency': round(mean(latencies), 2),
+            'avg_latency': round(sum(latencies) / len(latencies), 2),
             'min_latency': round(min(latencies), 2),
             'max_latency': round(max(latencies), 2),
             'total_tests': len(self.metrics),
@@ -538,41 +1155,156 @@ class HealthTracker:
         }
     
     def _save_history(self):
-        """Salva histórico de métricas em arquivo JSON."""
+        """
+        Agenda a gravação do histórico de métricas em arquivo binário.
+        
+        Apenas enfileira um snapshot; a escrita em disco acontece na thread
+        de gravação para não atrasar as medições.
+        """
+        snapshot = self.metrics.to_bytes()
+        with self._writer_lock:
+            if self._closed:
+                # Após close() não há thread de gravação: gravar direto
+                self._write_history(snapshot)
+                return
+            if self._writer_thread is None:
+                self._writer_thread = threading.Thread(
+                    target=self._writer_loop, name='HealthHistoryWriter', daemon=True
+                )
+                self._writer_thread.start()
+            self._enqueue_snapshot(snapshot)
+    
+    def _enqueue_snapshot(self, item: Optional[bytes]):
+        """Enfileira um snapshot (ou None, para encerrar), descartando o mais antigo se a fila estiver cheia."""
+        while True:
+            try:
+                self._save_queue.put_nowait(item)
+                return
+            except queue.Full:
+                # Descartar o snapshot mais antigo, o novo o substitui
+                try:
+                    self._save_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _writer_loop(self):
+        """Loop da thread de gravação: grava no máximo um snapshot por intervalo."""
+        while True:
+            # Agrupar snapshots acumulados, mantendo apenas o mais recente
+            items = [self._save_queue.get()]
+            while True:
+                try:
+                    items.append(self._save_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            snapshots = [item for item in items if item is not None]
+            if snapshots:
+                self._write_history(snapshots[-1])
+            if len(snapshots) < len(items):
+                # Sentinela de close(): o último snapshot já foi gravado
+                return
+            
+            # Intervalo entre gravações, interrompido por close()
+            self._writer_stop.wait(HISTORY_WRITE_INTERVAL)
+    
+    def _close_writer(self):
+        """Grava o snapshot pendente e encerra a thread de gravação."""
+        with self._writer_lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._writer_thread
+            if thread is not None:
+                self._enqueue_snapshot(None)
+        
+        if thread is None:
+            return
+        self._writer_stop.set()
+        thread.join(HISTORY_CLOSE_TIMEOUT)
+        if thread.is_alive():
+            self.logger.warning("Thread de gravação do histórico não terminou a tempo")
+            return
+        
+        # Snapshot que tenha ficado na fila (ex.: a thread parou com erro)
+        latest = None
+        while True:
+            try:
+                item = self._save_queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                latest = item
+        if latest is not None:
+            self._write_history(latest)
+    
+    def _write_history(self, data: bytes):
+        """
+        Grava um snapshot serializado do histórico em disco.
+        
+        A escrita vai para um arquivo temporário, que substitui o histórico
+        com ``os.replace``: uma interrupção no meio da gravação nunca deixa o
+        arquivo truncado.
+        """
+        tmp_file = self.history_file.with_name(self.history_file.name + '.tmp')
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metrics, f, indent=2, ensure_ascii=False)
-            self.logger.debug(f"Histórico salvo: {len(self.metrics)} métricas")
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.history_file)
+            self.logger.debug(f"Histórico salvo: {len(data)} bytes")
         except Exception as e:
             self.logger.error(f"Erro ao salvar histórico: {e}")
     
     def _load_history(self):
-        """Carrega histórico de métricas do arquivo JSON."""
+        """Carrega histórico de métricas (binário, ou JSON de versões anteriores)."""
+        legacy_file = self.history_file.with_suffix('.json')
         try:
             if self.history_file.exists():
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.metrics = json.load(f)
+                self.metrics.load_bytes(self.history_file.read_bytes())
+                self.logger.info(f"Histórico carregado: {len(self.metrics)} métricas")
+            elif legacy_file.exists():
+                with open(legacy_file, 'r', encoding='utf-8') as f:
+                    saved = json.load(f)
+                for m in saved:
+                    self.metrics.append(
+                        datetime.fromisoformat(m['timestamp']).timestamp(),
+                        m.get('latency'),
+                        int(m.get('score', 0))
+                    )
                 self.logger.info(f"Histórico carregado: {len(self.metrics)} métricas")
         except Exception as e:
             self.logger.warning(f"Não foi possível carregar histórico: {e}")
-            self.metrics = []
+            self.metrics = MetricsHistory()
     
     def test_dns_resolution(self, domain: str = 'www.google.com') -> Optional[float]:
         """
         Testa o tempo de resolução DNS.
         
+        O resultado fica em cache por DNS_CACHE_TTL segundos, evitando uma
+        nova consulta a cada diagnóstico.
+        
         Args:
             domain (str): Domínio para resolver
             
         Returns:
             float: Tempo de resolução em ms, ou None se falhar
         """
+        cached = self._dns_cache.get(domain)
+        if cached is not None and time.monotonic() - cached[0] < DNS_CACHE_TTL:
+            return cached[1]
+        
         try:
-            start = time.time()
-            socket.gethostbyname(domain)
-            end = time.time()
+            # IPs literais não passam pelo resolver
+            try:
+                socket.getaddrinfo(domain, None, flags=socket.AI_NUMERICHOST)
+                return 0.0
+            except socket.gaierror:
+                pass
+            
+            start = time.perf_counter()
+            socket.getaddrinfo(domain, None, type=socket.SOCK_STREAM)
+            resolution_time = (time.perf_counter() - start) * 1000  # Converter para ms
             
-            resolution_time = (end - start) * 1000  # Converter para ms
+            self._dns_cache[domain] = (time.monotonic(), resolution_time)
             self.logger.debug(f"DNS resolution para {domain}: {resolution_time:.2f}ms")
             return resolution_time
             
@@ -605,10 +1337,9 @@ class HealthTracker:
         total_downtime = self.connection_state['total_downtime']
         
         # Calcular variabilidade da latência
-        latencies = [m.get('latency') for m in self.metrics[-100:] if m.get('latency')]
+        latencies = [v for v in self.metrics.latencies(100) if v > 0]
         if len(latencies) > 10:
-            latency_stdev = stdev(latencies)
-            latency_mean = mean(latencies)
+            latency_mean, latency_stdev = _welford(latencies)
             latency_cv = (latency_stdev / latency_mean) * 100 if latency_mean > 0 else 0
         else:
             latency_cv = 0
@@ -642,31 +1373,38 @@ class HealthTracker:
         Returns:
             str: Host com menor latência, ou None se nenhum responder
         """
-        best_host = None
-        best_latency = float('inf')
-        
         # Testar hosts em paralelo
-        with ThreadPoolExecutor(max_workers=len(self.ping_hosts)) as executor:
-            future_to_host = {
-                executor.submit(self.ping_test, host, 3): host 
-                for host in self.ping_hosts
-            }
-            
-            for future in as_completed(future_to_host, timeout=15):
-                host = future_to_host[future]
-                try:
-                    latency = future.result()
-                    if latency and latency < best_latency:
-                        best_latency = latency
-                        best_host = host
-                except Exception as e:
-                    self.logger.debug(f"Erro ao testar {host}: {e}")
+        best_host, best_latency = self._run_async(
+            self._ping_hosts_async(self.ping_hosts, count=3, timeout=15)
+        )
         
         if best_host:
             self.logger.info(f"Melhor host: {best_host} ({best_latency:.2f}ms)")
         
         return best_host
     
+    def compute_report(self) -> Dict[str, Any]:
+        """
+        Gera o relatório completo (diagnóstico + estatísticas) uma única vez.
+        
+        O resultado é reaproveitado enquanto nenhuma métrica nova for
+        registrada e por até REPORT_CACHE_TTL segundos.
+        
+        Returns:
+            dict: {'diagnosis': diagnose_connection(), 'stats': get_statistics()}
+        """
+        cached = self._report_cache
+        if (cached is not None and cached[1] == self.metrics.version
+                and time.monotonic() - cached[0] < REPORT_CACHE_TTL):
+            return cached[2]
+        
+        report = {
+            'diagnosis': self.diagnose_connection(),
+            'stats': self.get_statistics()
+        }
+        self._report_cache = (time.monotonic(), self.metrics.version, report)
+        return report
+    
     def diagnose_connection(self) -> Dict[str, Any]:
         """
         Executa diagnóstico completo da conexão.
@@ -679,17 +1417,17 @@ class HealthTracker:
         # 1. Verificar conectividade
         is_connected, best_host = self.check_connectivity()
         
-        # 2. Obter health score detalhado
-        health = self.get_health_score(detailed=True)
-        
-        # 3. Testar DNS
-        dns_time = self.test_dns_resolution() if is_connected else None
-        
-        # 4. Analisar estabilidade
-        stability = self.get_connection_stability()
-        
-        # 5. Identificar melhor host
-        optimal_host = self.get_best_ping_host() if is_connected else None
+        # 2-5. Health score, DNS e melhor host são independentes: rodam em
+        # paralelo enquanto a estabilidade (só CPU) é calculada nesta thread
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            health_future = executor.submit(self.get_health_score, True)
+            dns_future = executor.submit(self.test_dns_resolution) if is_connected else None
+            best_future = executor.submit(self.get_best_ping_host) if is_connected else None
+            
+            stability = self.get_connection_stability()
+            health = health_future.result()
+            dns_time = dns_future.result() if dns_future else None
+            optimal_host = best_future.result() if best_future else None
         
         # 6. Gerar recomendações
         recommendations = []
@@ -756,30 +1494,34 @@ if __name__ == "__main__":
     
     tracker = HealthTracker()
     
-    # 1. Teste de conectividade
-    print("\n1️⃣  Testando conectividade...")
+    # Todas as medições são feitas uma única vez; as seções abaixo só imprimem
     try:
-        connected, best_host = tracker.check_connectivity()
-        if connected:
-            print(f"   ✅ Conectado (host mais rápido: {best_host})")
-        else:
-            print(f"   ❌ Sem conexão")
+        report = tracker.compute_report()
     except Exception as e:
-        print(f"   ❌ Erro ao testar conectividade: {e}")
-        connected = False
+        print(f"   ❌ Erro ao gerar diagnóstico: {e}")
+        import traceback
+        traceback.print_exc()
+        import sys
+        sys.exit(1)
+    
+    diagnosis = report['diagnosis']
+    health = diagnosis['health_score']
+    
+    # 1. Conectividade
+    print("\n1️⃣  Testando conectividade...")
+    if diagnosis['connected']:
+        print(f"   ✅ Conectado (host mais rápido: {diagnosis['best_host']})")
+    else:
+        print(f"   ❌ Sem conexão")
     
-    # 2. Teste de latência
+    # 2. Latência
     print("\n2️⃣  Testando latência...")
-    try:
-        latency = tracker.ping_test()
-        if latency:
-            print(f"   📊 Latência: {latency:.2f}ms")
-        else:
-            print(f"   ❌ Falha no ping")
-    except Exception as e:
-        print(f"   ❌ Erro ao testar latência: {e}")
+    if health['latency']:
+        print(f"   📊 Latência: {health['latency']['avg']:.2f}ms")
+    else:
+        print(f"   ❌ Falha no ping")
     
-    if not connected:
+    if not diagnosis['connected']:
         print("\n" + "=" * 70)
         print("⚠️  Sem conexão com a internet. Diagnóstico limitado.".center(70))
         print("=" * 70)
@@ -788,103 +1530,81 @@ if __name__ == "__main__":
     
     # 3. Health Score detalhado
     print("\n3️⃣  Calculando Health Score...")
-    try:
-        health = tracker.get_health_score(detailed=True)
-        print(f"   📈 Score: {health['score']}/100 ({health['category']})")
-        
-        if health['latency']:
-            print(f"   📶 Latência: {health['latency']['avg']:.1f}ms (min: {health['latency']['min']:.1f}, max: {health['latency']['max']:.1f})")
-            print(f"   📉 Packet Loss: {health['packet_loss']:.1f}%")
-            print(f"   📊 Jitter: {health['jitter']:.1f}ms")
-            print(f"   ⏱️  Uptime: {health['uptime']:.1f}%")
-            print(f"   ✓  Pings bem-sucedidos: {health['pings_successful']}/{health['pings_total']}")
-        
-        if health['alerts']:
-            print(f"\n   ⚠️  Alertas:")
-            for alert in health['alerts']:
-                print(f"      • {alert}")
-    except Exception as e:
-        print(f"   ❌ Erro ao calcular health score: {e}")
+    print(f"   📈 Score: {health['score']}/100 ({health['category']})")
+    
+    if health['latency']:
+        print(f"   📶 Latência: {health['latency']['avg']:.1f}ms (min: {health['latency']['min']:.1f}, max: {health['latency']['max']:.1f})")
+        print(f"   📉 Packet Loss: {health['packet_loss']:.1f}%")
+        print(f"   📊 Jitter: {health['jitter']:.1f}ms")
+        print(f"   ⏱️  Uptime: {health['uptime']:.1f}%")
+        print(f"   ✓  Pings bem-sucedidos: {health['pings_successful']}/{health['pings_total']}")
+    
+    if health['alerts']:
+        print(f"\n   ⚠️  Alertas:")
+        for alert in health['alerts']:
+            print(f"      • {alert}")
     
     # 4. Teste DNS
     print("\n4️⃣  Testando resolução DNS...")
-    try:
-        dns_time = tracker.test_dns_resolution()
-        if dns_time:
-            print(f"   🌐 Tempo de DNS: {dns_time:.2f}ms")
-            if dns_time < 50:
-                print(f"   ✅ DNS excelente")
-            elif dns_time < 100:
-                print(f"   ✓  DNS bom")
-            else:
-                print(f"   ⚠️  DNS lento")
+    dns_time = diagnosis['dns_resolution_time']
+    if dns_time:
+        print(f"   🌐 Tempo de DNS: {dns_time:.2f}ms")
+        if dns_time < 50:
+            print(f"   ✅ DNS excelente")
+        elif dns_time < 100:
+            print(f"   ✓  DNS bom")
         else:
-            print(f"   ❌ Falha na resolução DNS")
-    except Exception as e:
-        print(f"   ❌ Erro ao testar DNS: {e}")
+            print(f"   ⚠️  DNS lento")
+    else:
+        print(f"   ❌ Falha na resolução DNS")
     
     # 5. Análise de estabilidade
     print("\n5️⃣  Analisando estabilidade...")
-    try:
-        stability = tracker.get_connection_stability()
-        print(f"   📊 Score de Estabilidade: {stability['stability_score']}/100")
-        print(f"   🔌 Desconexões: {stability['disconnect_events']}")
-        print(f"   ⏱️  Downtime total: {stability['total_downtime']:.1f}s")
-        print(f"   📈 Variabilidade da latência: {stability['latency_variability']:.1f}%")
-        print(f"   💡 Recomendação: {stability['recommendation']}")
-    except Exception as e:
-        print(f"   ❌ Erro ao analisar estabilidade: {e}")
+    stability = diagnosis['stability']
+    print(f"   📊 Score de Estabilidade: {stability['stability_score']}/100")
+    print(f"   🔌 Desconexões: {stability['disconnect_events']}")
+    print(f"   ⏱️  Downtime total: {stability['total_downtime']:.1f}s")
+    print(f"   📈 Variabilidade da latência: {stability['latency_variability']:.1f}%")
+    print(f"   💡 Recomendação: {stability['recommendation']}")
     
-    # 6. Encontrar melhor host
+    # 6. Melhor host
     print("\n6️⃣  Identificando melhor host...")
-    try:
-        best = tracker.get_best_ping_host()
-        if best:
-            print(f"   🎯 Melhor host: {best}")
-        else:
-            print(f"   ❌ Nenhum host respondeu")
-    except Exception as e:
-        print(f"   ❌ Erro ao identificar melhor host: {e}")
+    if diagnosis['optimal_host']:
+        print(f"   🎯 Melhor host: {diagnosis['optimal_host']}")
+    else:
+        print(f"   ❌ Nenhum host respondeu")
     
-    # 7. Diagnóstico completo
+    # 7. Relatório completo
     print("\n" + "=" * 70)
     print("📋 RELATÓRIO COMPLETO".center(70))
     print("=" * 70)
     
-    try:
-        diagnosis = tracker.diagnose_connection()
-        
-        print(f"\n🏆 Score Final: {diagnosis['health_score']['score']}/100")
-        print(f"🎯 Categoria: {diagnosis['health_score']['category']}")
-        print(f"🌐 Host recomendado: {diagnosis['optimal_host'] or 'N/A'}")
-        
-        if diagnosis['dns_resolution_time']:
-            print(f"🔍 Tempo de DNS: {diagnosis['dns_resolution_time']:.2f}ms")
-        
-        print(f"\n📊 Recomendações:")
-        for rec in diagnosis['recommendations']:
-            print(f"   {rec}")
-        
-        # 8. Estatísticas gerais
-        print(f"\n📈 Estatísticas:")
-        stats = tracker.get_statistics()
-        if stats:
-            print(f"   • Testes realizados: {stats.get('total_tests', 0)}")
-            print(f"   • Testes bem-sucedidos: {stats.get('successful_tests', 0)}")
-            print(f"   • Taxa de sucesso: {stats.get('success_rate', 0):.1f}%")
-            if 'avg_latency' in stats:
-                print(f"   • Latência média: {stats['avg_latency']:.2f}ms")
-                print(f"   • Latência mínima: {stats['min_latency']:.2f}ms")
-                print(f"   • Latência máxima: {stats['max_latency']:.2f}ms")
-        
-    except Exception as e:
-        print(f"   ❌ Erro ao gerar diagnóstico: {e}")
-        import traceback
-        traceback.print_exc()
+    print(f"\n🏆 Score Final: {health['score']}/100")
+    print(f"🎯 Categoria: {health['category']}")
+    print(f"🌐 Host recomendado: {diagnosis['optimal_host'] or 'N/A'}")
+    
+    if dns_time:
+        print(f"🔍 Tempo de DNS: {dns_time:.2f}ms")
+    
+    print(f"\n📊 Recomendações:")
+    for rec in diagnosis['recommendations']:
+        print(f"   {rec}")
+    
+    # 8. Estatísticas gerais
+    print(f"\n📈 Estatísticas:")
+    stats = report['stats']
+    if stats:
+        print(f"   • Testes realizados: {stats.get('total_tests', 0)}")
+        print(f"   • Testes bem-sucedidos: {stats.get('successful_tests', 0)}")
+        print(f"   • Taxa de sucesso: {stats.get('success_rate', 0):.1f}%")
+        if 'avg_latency' in stats:
+            print(f"   • Latência média: {stats['avg_latency']:.2f}ms")
+            print(f"   • Latência mínima: {stats['min_latency']:.2f}ms")
+            print(f"   • Latência máxima: {stats['max_latency']:.2f}ms")
     
     print("\n" + "=" * 70)
     print("✅ Diagnóstico concluído!".center(70))
     print("=" * 70)
     
     # Salvar histórico
-    print(f"\n💾 Histórico salvo em: {tracker.history_file}")
\ No newline at end of file
+    print(f"\n💾 Histórico salvo em: {tracker.history_file}")
@@ -6,9 +6,226 @@ Este módulo implementa scanning de dispositivos conectados usando:
 2. ARP scan com Scapy como alternativa
 """
 
+import asyncio
+import functools
+import ipaddress
 import logging
+import os
+import platform
+import selectors
 import socket
-from typing import List, Dict, Optional
+import struct
+import threading
+import time
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Tuple
+
+try:
+    import icmplib  # Opcional: ping ICMP em processo, sem chamar o comando ping
+except ImportError:
+    icmplib = None
+
+
+_IS_WINDOWS = platform.system().lower() == "windows"
+
+# Comando ping (um pacote, espera curta) sem o IP, montado uma vez por processo
+_PING_PREFIX = ('ping', '-n', '1', '-w', '500') if _IS_WINDOWS else ('ping', '-c', '1', '-W', '1')
+
+# Pings simultâneos: sockets ICMP (icmplib) são baratos; processos ping não
+ICMP_CONCURRENCY = 256
+PING_CONCURRENCY = 64
+
+# Espera por respostas ARP (segundos); em LAN as respostas chegam em milissegundos
+ARP_TIMEOUT = 1
+
+# Espera por respostas após o último envio na varredura com socket raw (segundos)
+RAW_ICMP_TIMEOUT = 1.0
+
+# Argumentos do nmap para descoberta de hosts
+NMAP_PING_SCAN_ARGS = '-sn -n -T4 --min-parallelism 64 --max-retries 1'
+
+# Cache de hostnames (PTR) compartilhado entre instâncias: ip -> (timestamp, hostname)
+HOSTNAME_CACHE_TTL = 3600       # segundos para nomes resolvidos
+HOSTNAME_NEGATIVE_TTL = 300     # segundos para IPs sem PTR
+HOSTNAME_CACHE_SIZE = 4096
+_hostname_cache: Dict[str, Tuple[float, Optional[str]]] = {}
+_hostname_cache_lock = threading.Lock()
+
+
+def _get_cached_hostname(ip: str) -> Tuple[bool, Optional[str]]:
+    """
+    Consulta o cache de hostnames, descartando entradas expiradas.
+    
+    Args:
+        ip (str): Endereço IP
+        
+    Returns:
+        tuple: (encontrado, hostname ou None)
+    """
+    with _hostname_cache_lock:
+        entry = _hostname_cache.get(ip)
+        if entry is None:
+            return False, None
+        timestamp, hostname = entry
+        ttl = HOSTNAME_CACHE_TTL if hostname else HOSTNAME_NEGATIVE_TTL
+        if time.monotonic() - timestamp >= ttl:
+            del _hostname_cache[ip]
+            return False, None
+        return True, hostname
+
+
+def _store_hostname(ip: str, hostname: Optional[str]):
+    """
+    Armazena o resultado de uma resolução (None = sem PTR) no cache.
+    
+    Args:
+        ip (str): Endereço IP
+        hostname (str): Hostname resolvido, ou None
+    """
+    with _hostname_cache_lock:
+        _hostname_cache.pop(ip, None)
+        if len(_hostname_cache) >= HOSTNAME_CACHE_SIZE:
+            # Remove a entrada mais antiga (dicts preservam ordem de inserção)
+            del _hostname_cache[next(iter(_hostname_cache))]
+        _hostname_cache[ip] = (time.monotonic(), hostname)
+
+
+def _iter_hosts(network_range: str) -> Iterator[str]:
+    """
+    Gera os IPs de host de um range como strings, na mesma ordem de
+    ``IPv4Network.hosts()``, sem criar um objeto ``IPv4Address`` por IP.
+    
+    Args:
+        network_range (str): Range no formato CIDR
+        
+    Yields:
+        str: Endereço IP
+    """
+    network = ipaddress.IPv4Network(network_range, strict=False)
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    if network.prefixlen < 31:
+        # Excluir endereço de rede e broadcast
+        first += 1
+        last -= 1
+    for i in range(first, last + 1):
+        yield f"{i >> 24}.{(i >> 16) & 255}.{(i >> 8) & 255}.{i & 255}"
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """Checksum da internet (RFC 1071) de um pacote ICMP."""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _icmp_echo_packet(identifier: int, sequence: int = 1) -> bytes:
+    """
+    Monta um pacote ICMP echo request (tipo 8) com payload fixo.
+    
+    Args:
+        identifier (int): Identificador do echo (16 bits)
+        sequence (int): Número de sequência (16 bits)
+        
+    Returns:
+        bytes: Pacote pronto para ``sendto``
+    """
+    payload = b'emb-inf-redes\x00\x00\x00'
+    header = struct.pack('!BBHHH', 8, 0, 0, identifier, sequence)
+    checksum = _icmp_checksum(header + payload)
+    return struct.pack('!BBHHH', 8, 0, checksum, identifier, sequence) + payload
+
+
+def _is_echo_reply(data: bytes, identifier: int) -> bool:
+    """
+    Verifica se um datagrama IPv4 recebido no socket raw é a resposta (tipo 0)
+    a um echo com o identificador informado.
+    
+    Args:
+        data (bytes): Datagrama completo, incluindo o cabeçalho IP
+        identifier (int): Identificador usado nos echo requests
+    """
+    if not data:
+        return False
+    offset = (data[0] & 0x0F) * 4  # Tamanho do cabeçalho IP
+    if len(data) < offset + 8:
+        return False
+    icmp_type, _, _, reply_id, _ = struct.unpack_from('!BBHHH', data, offset)
+    return icmp_type == 0 and reply_id == identifier
+
+
+def _open_raw_icmp_socket() -> Optional[socket.socket]:
+    """
+    Abre um socket ICMP raw não bloqueante, se o processo tiver permissão.
+    
+    Returns:
+        socket: Socket pronto para uso, ou None (sem root/CAP_NET_RAW ou no Windows)
+    """
+    if _IS_WINDOWS:
+        return None
+    try:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    except OSError:
+        return None
+    sock.setblocking(False)
+    try:
+        # Buffer maior: as respostas chegam em rajada enquanto ainda enviamos
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 20)
+    except OSError:
+        pass
+    return sock
+
+
+@functools.lru_cache(maxsize=1)
+def _load_scapy() -> Optional[tuple]:
+    """
+    Importa o Scapy na primeira chamada e memoriza o resultado.
+    
+    ``scapy.all`` é pesado para importar, então a importação só acontece no
+    primeiro scan ARP; scans seguintes (inclusive sem Scapy instalado) não
+    repetem a tentativa.
+    
+    Returns:
+        tuple: (ARP, Ether, srp), ou None se o Scapy não estiver instalado
+    """
+    try:
+        from scapy.all import ARP, Ether, srp
+    except ImportError:
+        return None
+    return ARP, Ether, srp
+
+
+@functools.lru_cache(maxsize=1)
+def _get_local_ip_cached() -> str:
+    """
+    Descobre o IP local (rota padrão) uma vez por processo.
+    
+    Falhas propagam a exceção e, portanto, não ficam em cache.
+    
+    Returns:
+        str: Endereço IP local
+    """
+    # Conecta a um servidor externo para descobrir IP local (UDP não envia pacotes)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.connect(("8.8.8.8", 80))
+        return s.getsockname()[0]
+
+
+@functools.lru_cache(maxsize=16)
+def _network_range_for(local_ip: str) -> str:
+    """
+    Calcula o range /24 que contém um IP.
+    
+    Args:
+        local_ip (str): Endereço IP local
+        
+    Returns:
+        str: Range no formato CIDR
+    """
+    return str(ipaddress.IPv4Network(f"{local_ip}/24", strict=False))
 
 
 class NetworkScanner:
@@ -20,15 +237,23 @@ class NetworkScanner:
         network_range (str): Range de IPs a escanear (ex: '192.168.1.0/24')
     """
     
-    def __init__(self, network_range: str = None):
+    def __init__(self, network_range: str = None, max_hosts: Optional[int] = None):
         """
         Inicializa o scanner de rede.
         
         Args:
             network_range (str): Range de IPs no formato CIDR (auto-detecta se None)
+            max_hosts (int): Limite de IPs no scan com ping (None = range inteiro)
         """
         self.logger = logging.getLogger(__name__)
         self.devices = []
+        self._by_ip = {}  # Índice ip -> dispositivo para get_device_info
+        self.max_hosts = max_hosts
+        
+        # Ping via socket ICMP quando icmplib está disponível (desligado se sem permissão).
+        # No Windows o icmplib sempre usa socket raw; nos demais começa sem privilégios
+        self._icmp_enabled = icmplib is not None
+        self._icmp_privileged = _IS_WINDOWS
         
         # Auto-detectar range se não especificado
         if network_range is None:
@@ -38,12 +263,16 @@ class NetworkScanner:
         
         self.logger.info(f"NetworkScanner inicializado com range: {network_range}")
     
-    def scan_devices(self, use_nmap: bool = True) -> List[Dict[str, any]]:
+    def scan_devices(self, use_nmap: bool = False, resolve_names: bool = True) -> List[Dict[str, any]]:
         """
         Escaneia dispositivos conectados na rede.
         
+        Por padrão usa ARP (Scapy), que varre um /24 em segundos, com ping
+        como fallback; o nmap fica como opção explícita.
+        
         Args:
             use_nmap (bool): Se True, tenta usar nmap. Se False ou falhar, usa ARP
+            resolve_names (bool): Se False, não faz consultas reversas (hostname fica vazio)
             
         Returns:
             list: Lista de dicionários com informações dos dispositivos
@@ -56,18 +285,21 @@ class NetworkScanner:
         
         try:
             if use_nmap:
-                return self._scan_with_nmap()
+                return self._scan_with_nmap(resolve_names=resolve_names)
             else:
-                return self._scan_with_arp()
+                return self._scan_with_arp(resolve_names=resolve_names)
                 
         except Exception as e:
             self.logger.exception("Erro ao escanear dispositivos")
             raise
     
-    def _scan_with_nmap(self) -> List[Dict[str, any]]:
+    def _scan_with_nmap(self, resolve_names: bool = True) -> List[Dict[str, any]]:
         """
         Escaneia rede usando python-nmap.
         
+        Args:
+            resolve_names (bool): Se True, resolve os hostnames dos dispositivos
+            
         Returns:
             list: Lista de dispositivos detectados
         """
@@ -79,8 +311,9 @@ class NetworkScanner:
             nm = nmap.PortScanner()
             self.logger.debug(f"Iniciando scan nmap em {self.network_range}")
             
-            # Ping scan (-sn) - rápido e não escaneia portas
-            nm.scan(hosts=self.network_range, arguments='-sn')
+            # Ping scan (-sn) sem DNS reverso do nmap (-n; resolvemos em lote),
+            # com paralelismo alto e sem retransmissões extras
+            nm.scan(hosts=self.network_range, arguments=NMAP_PING_SCAN_ARGS)
             
             devices = []
             for host in nm.all_hosts():
@@ -97,46 +330,54 @@ class NetworkScanner:
                         device['mac'] = nm[host]['addresses']['mac']
                     
                     # Tentar obter vendor (fabricante)
-                    if 'vendor' in nm[host] and nm[host]['vendor']:
-                        device['vendor'] = list(nm[host]['vendor'].values())[0] if nm[host]['vendor'] else None
+                    if nm[host].get('vendor'):
+                        device['vendor'] = next(iter(nm[host]['vendor'].values()), None)
                     
                     # Tentar obter hostname
-                    if 'hostnames' in nm[host] and nm[host]['hostnames']:
-                        hostnames = [h['name'] for h in nm[host]['hostnames'] if h['name']]
-                        if hostnames:
-                            device['hostname'] = hostnames[0]
-                    
-                    # Fallback para resolver hostname
-                    if not device['hostname']:
-                        device['hostname'] = self.resolve_hostname(host)
+                    if nm[host].get('hostnames'):
+                        device['hostname'] = next((h['name'] for h in nm[host]['hostnames'] if h['name']), None)
                     
                     devices.append(device)
-                    self.logger.debug(f"Dispositivo encontrado: {host}")
+                    self.logger.debug("Dispositivo encontrado: %s", host)
+            
+            # Fallback para resolver hostnames (em lote)
+            if resolve_names:
+                unnamed = [device for device in devices if not device['hostname']]
+                hostnames = self._resolve_hostnames([device['ip'] for device in unnamed])
+                for device in unnamed:
+                    device['hostname'] = hostnames.get(device['ip'])
             
-            self.devices = devices
+            self._set_devices(devices)
             self.logger.info(f"Scan nmap concluído: {len(devices)} dispositivos")
             return devices
             
         except ImportError:
             self.logger.warning("python-nmap não instalado, usando ARP")
-            return self._scan_with_arp()
+            return self._scan_with_arp(resolve_names=resolve_names)
         except Exception as e:
             self.logger.error(f"Erro no scan nmap: {e}")
             self.logger.warning("Tentando método alternativo...")
-            return self._scan_with_arp()
+            return self._scan_with_arp(resolve_names=resolve_names)
     
-    def _scan_with_arp(self) -> List[Dict[str, any]]:
+    def _scan_with_arp(self, resolve_names: bool = True) -> List[Dict[str, any]]:
         """
         Escaneia rede usando ARP (Scapy) ou fallback com ping.
         
+        Args:
+            resolve_names (bool): Se True, resolve os hostnames dos dispositivos
+            
         Returns:
             list: Lista de dispositivos detectados
         """
         self.logger.info("Executando scan com ARP (Scapy)...")
         
+        scapy = _load_scapy()
+        if scapy is None:
+            self.logger.error("Scapy não instalado. Use: pip install scapy")
+            return self._scan_with_ping(resolve_names=resolve_names)
+        ARP, Ether, srp = scapy
+        
         try:
-            from scapy.all import ARP, Ether, srp
-            
             # Criar pacote ARP
             arp = ARP(pdst=self.network_range)
             ether = Ether(dst="ff:ff:ff:ff:ff:ff")
@@ -144,44 +385,43 @@ class NetworkScanner:
             
             # Enviar pacote e receber respostas
             self.logger.debug(f"Enviando ARP requests para {self.network_range}")
-            result = srp(packet, timeout=3, verbose=0)[0]
+            result = srp(packet, timeout=ARP_TIMEOUT, verbose=0)[0]
             
             # Processar respostas
+            # Resolver hostnames de todos os respondentes em lote
+            hostnames = self._resolve_hostnames([received.psrc for sent, received in result]) if resolve_names else {}
+            
+            # Métodos em variáveis locais: evita lookups de atributo a cada resposta
             devices = []
+            append = devices.append
+            hostname_of = hostnames.get
+            debug = self.logger.debug
             for sent, received in result:
-                device = {
-                    'ip': received.psrc,
-                    'mac': received.hwsrc,
-                    'hostname': None,
+                ip = received.psrc
+                mac = received.hwsrc
+                append({
+                    'ip': ip,
+                    'mac': mac,
+                    'hostname': hostname_of(ip),
                     'vendor': None
-                }
-                
-                # Tentar resolver hostname
-                hostname = self.resolve_hostname(received.psrc)
-                if hostname:
-                    device['hostname'] = hostname
-                
-                devices.append(device)
-                self.logger.debug(f"Dispositivo encontrado: {received.psrc} ({received.hwsrc})")
+                })
+                debug("Dispositivo encontrado: %s (%s)", ip, mac)
             
-            self.devices = devices
+            self._set_devices(devices)
             self.logger.info(f"Scan ARP concluído: {len(devices)} dispositivos")
             return devices
             
-        except ImportError:
-            self.logger.error("Scapy não instalado. Use: pip install scapy")
-            return self._scan_with_ping()
         except RuntimeError as e:
             if "winpcap" in str(e).lower() or "npcap" in str(e).lower():
                 self.logger.warning("Npcap não instalado, usando método alternativo (ping)")
-                return self._scan_with_ping()
+                return self._scan_with_ping(resolve_names=resolve_names)
             raise
         except PermissionError:
             self.logger.error("Permissão negada. Execute como administrador!")
-            return self._scan_with_ping()
+            return self._scan_with_ping(resolve_names=resolve_names)
         except Exception as e:
             self.logger.exception(f"Erro no scan ARP: {e}")
-            return self._scan_with_ping()
+            return self._scan_with_ping(resolve_names=resolve_names)
     
     def get_device_info(self, ip: str) -> Optional[Dict[str, any]]:
         """
@@ -193,32 +433,109 @@ class NetworkScanner:
         Returns:
             dict: Informações do dispositivo, ou None se não encontrado
         """
-        for device in self.devices:
-            if device.get('ip') == ip:
-                return device
-        return None
+        return self._by_ip.get(ip)
+    
+    def _set_devices(self, devices: List[Dict[str, any]]):
+        """
+        Substitui a lista de dispositivos e reconstrói o índice por IP.
+        
+        Args:
+            devices (list): Dispositivos detectados
+        """
+        self.devices = devices
+        self._by_ip = {device['ip']: device for device in devices}
     
     def resolve_hostname(self, ip: str) -> Optional[str]:
         """
         Tenta resolver o hostname de um endereço IP.
         
+        Resultados (inclusive IPs sem PTR) ficam em cache para que scans
+        repetidos da mesma rede não refaçam as consultas reversas.
+        
         Args:
             ip (str): Endereço IP
             
         Returns:
             str: Hostname resolvido, ou None se falhar
         """
+        found, hostname = _get_cached_hostname(ip)
+        if found:
+            return hostname
+        
         try:
             hostname = socket.gethostbyaddr(ip)[0]
-            self.logger.debug(f"Hostname resolvido: {ip} -> {hostname}")
+            self.logger.debug("Hostname resolvido: %s -> %s", ip, hostname)
+            _store_hostname(ip, hostname)
             return hostname
         except socket.herror:
-            self.logger.debug(f"Não foi possível resolver hostname para {ip}")
+            self.logger.debug("Não foi possível resolver hostname para %s", ip)
+            _store_hostname(ip, None)
             return None
         except Exception as e:
             self.logger.error(f"Erro ao resolver hostname: {e}")
             return None
     
+    def _resolve_hostnames(self, ips: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Resolve os hostnames de vários IPs de uma vez.
+        
+        Args:
+            ips (list): Endereços IP
+            
+        Returns:
+            dict: IP -> hostname (None se não resolvido)
+        """
+        if not ips:
+            return {}
+        return asyncio.run(self._resolve_many(ips))
+    
+    async def _resolve_many(self, ips: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Consultas reversas (PTR) concorrentes via loop.getnameinfo.
+        
+        IPs presentes no cache não geram consulta; os demais são resolvidos
+        em paralelo e o resultado (inclusive a falta de PTR) vai para o cache.
+        
+        Args:
+            ips (list): Endereços IP
+            
+        Returns:
+            dict: IP -> hostname (None se não resolvido)
+        """
+        hostnames = {}
+        pending = []
+        for ip in ips:
+            found, hostname = _get_cached_hostname(ip)
+            if found:
+                hostnames[ip] = hostname
+            else:
+                pending.append(ip)
+        
+        if not pending:
+            return hostnames
+        
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *(loop.getnameinfo((ip, 0), socket.NI_NAMEREQD) for ip in pending),
+            return_exceptions=True
+        )
+        
+        for ip, result in zip(pending, results):
+            if isinstance(result, (socket.herror, socket.gaierror)):
+                self.logger.debug("Não foi possível resolver hostname para %s", ip)
+                _store_hostname(ip, None)
+                hostnames[ip] = None
+            elif isinstance(result, Exception):
+                self.logger.error(f"Erro ao resolver hostname: {result}")
+                hostnames[ip] = None
+            else:
+                hostname = result[0]
+                self.logger.debug("Hostname resolvido: %s -> %s", ip, hostname)
+                _store_hostname(ip, hostname)
+                hostnames[ip] = hostname
+        
+        return hostnames
+    
     def get_local_ip(self) -> str:
         """
         Obtém o IP local da máquina.
@@ -227,12 +544,7 @@ class NetworkScanner:
             str: Endereço IP local
         """
         try:
-            # Conecta a um servidor externo para descobrir IP local
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
-            return local_ip
+            return _get_local_ip_cached()
         except Exception as e:
             self.logger.error(f"Erro ao obter IP local: {e}")
             return "127.0.0.1"
@@ -245,14 +557,11 @@ class NetworkScanner:
             str: Range no formato CIDR
         """
         try:
-            import ipaddress
-            
             # Obter IP local
             local_ip = self.get_local_ip()
             
             # Criar range /24 baseado no IP local
-            ip_obj = ipaddress.IPv4Address(local_ip)
-            network = ipaddress.IPv4Network(f"{local_ip}/24", strict=False)
+            network = _network_range_for(local_ip)
             
             self.logger.info(f"Range detectado automaticamente: {network}")
             return str(network)
@@ -261,90 +570,79 @@ class NetworkScanner:
             self.logger.error(f"Erro ao detectar range: {e}")
             return "192.168.1.0/24"  # Fallback padrão
     
+    @classmethod
+    def invalidate_cache(cls):
+        """
+        Descarta o IP local e os hostnames em cache.
+        
+        Útil em processos de longa duração quando a interface ou a rede muda.
+        """
+        _get_local_ip_cached.cache_clear()
+        with _hostname_cache_lock:
+            _hostname_cache.clear()
+    
     def update_network_range(self, new_range: str):
         """
         Atualiza o range de rede para scanning.
         
+        Dispositivos do range anterior são descartados.
+        
         Args:
             new_range (str): Novo range no formato CIDR
         """
         self.network_range = new_range
+        self._set_devices([])
         self.logger.info(f"Range de rede atualizado para: {new_range}")
     
-    def _scan_with_ping(self) -> List[Dict[str, any]]:
+    def _scan_with_ping(self, resolve_names: bool = True) -> List[Dict[str, any]]:
         """
         Escaneia rede usando ping (fallback quando Scapy/ARP não funciona).
         
+        Args:
+            resolve_names (bool): Se True, resolve os hostnames dos dispositivos
+            
         Returns:
             list: Lista de dispositivos detectados
         """
         self.logger.info("Executando scan com ping (método alternativo)...")
-        import subprocess
-        import platform
-        import ipaddress
-        import concurrent.futures
         
         devices = []
         
         try:
-            # Extrair base IP do range
-            network = ipaddress.IPv4Network(self.network_range, strict=False)
+            # Gerar os IPs do range sob demanda (limite opcional via max_hosts)
+            ips_to_scan = islice(_iter_hosts(self.network_range), self.max_hosts)
+            self.logger.info(f"Escaneando IPs com ping no range {self.network_range}...")
             
-            # Função para pingar um IP
-            def ping_host(ip_str):
-                try:
-                    if platform.system().lower() == "windows":
-                        command = ['ping', '-n', '1', '-w', '500', str(ip_str)]
-                    else:
-                        command = ['ping', '-c', '1', '-W', '1', str(ip_str)]
-                    
-                    result = subprocess.run(
-                        command,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL,
-                        timeout=2
-                    )
-                    
-                    if result.returncode == 0:
-                        return str(ip_str)
-                    return None
-                except:
-                    return None
-            
-            # Limitar a 100 IPs para equilibrar velocidade e cobertura
-            ips_to_scan = list(network.hosts())[:100]
-            total_ips = len(ips_to_scan)
-            self.logger.info(f"Escaneando {total_ips} IPs com ping no range {self.network_range}...")
-            
-            # Usar ThreadPoolExecutor para pingar múltiplos IPs em paralelo
-            with concurrent.futures.ThreadPoolExecutor(max_workers=30) as executor:
-                results = list(executor.map(ping_host, ips_to_scan))
-                
-                # Processar resultados
-                found_count = 0
-                for ip in results:
-                    if ip:
-                        found_count += 1
-                        device = {
-                            'ip': ip,
-                            'mac': 'N/A',
-                            'hostname': 'Desconhecido',
-                            'vendor': 'N/A'
-                        }
-                        
-                        # Tentar resolver hostname
-                        hostname = self.resolve_hostname(ip)
-                        if hostname:
-                            device['hostname'] = hostname
-                        
-                        devices.append(device)
-                        self.logger.info(f"✓ Dispositivo {found_count} encontrado: {ip} ({device['hostname']})")
+            raw_sock = _open_raw_icmp_socket()
+            if raw_sock is not None:
+                # Caminho rápido (root): um único socket raw para todos os IPs
+                with raw_sock:
+                    alive_ips = self._raw_icmp_sweep(raw_sock, ips_to_scan)
+                hostnames = self._resolve_hostnames(alive_ips) if resolve_names else {}
+            else:
+                # Pingar todos os IPs e resolver hostnames no mesmo event loop
+                alive_ips, hostnames = asyncio.run(self._ping_and_resolve(ips_to_scan, resolve_names))
+            
+            # Processar resultados
+            found_count = 0
+            for ip in alive_ips:
+                found_count += 1
+                device = {
+                    'ip': ip,
+                    'mac': 'N/A',
+                    'hostname': hostnames.get(ip) or 'Desconhecido',
+                    'vendor': 'N/A'
+                }
                 
-                if found_count == 0:
-                    self.logger.warning(f"Nenhum dispositivo respondeu ao ping no range {self.network_range}")
-                    self.logger.info("Dicas: Verifique se você está conectado à rede e se o range está correto")
+                devices.append(device)
+                # Formatação adiada: só ocorre se o nível INFO estiver habilitado
+                self.logger.info("✓ Dispositivo %d encontrado: %s (%s)", found_count, ip, device['hostname'])
             
-            self.devices = devices
+            if found_count == 0:
+                self.logger.warning(f"Nenhum dispositivo respondeu ao ping no range {self.network_range}")
+                self.logger.info("Dicas: Verifique se você está conectado à rede e se o range está correto")
+            
+            self._set_devices(devices)
             self.logger.info(f"Scan com ping concluído: {len(devices)} dispositivos")
             return devices
             
@@ -352,6 +650,201 @@ class NetworkScanner:
             self.logger.exception(f"Erro no scan com ping: {e}")
             return []
     
+    def _raw_icmp_sweep(self, sock: socket.socket, hosts: Iterable[str],
+                        timeout: float = RAW_ICMP_TIMEOUT) -> List[str]:
+        """
+        Envia um echo request para cada host por um único socket raw e coleta
+        as respostas com um seletor (epoll/kqueue/select).
+        
+        Os envios não esperam respostas: o pacote é montado uma vez e as
+        respostas são lidas sempre que o socket fica legível, inclusive durante
+        os envios, até ``timeout`` segundos após o último.
+        
+        Args:
+            sock (socket.socket): Socket ICMP raw não bloqueante
+            hosts (iterable): IPs a testar
+            timeout (float): Espera por respostas após o último envio
+            
+        Returns:
+            list: IPs que responderam, na ordem de ``hosts``
+        """
+        identifier = os.getpid() & 0xFFFF
+        packet = _icmp_echo_packet(identifier)
+        targets = {}  # ip -> ordem de envio
+        alive = set()
+        
+        def drain():
+            while True:
+                try:
+                    data, address = sock.recvfrom(1024)
+                except (BlockingIOError, InterruptedError):
+                    return
+                ip = address[0]
+                if ip in targets and _is_echo_reply(data, identifier):
+                    alive.add(ip)
+        
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock, selectors.EVENT_READ)
+            
+            for ip in hosts:
+                targets[ip] = len(targets)
+                while True:
+                    try:
+                        sock.sendto(packet, (ip, 0))
+                        break
+                    except BlockingIOError:
+                        # Buffer de envio cheio: aproveitar para ler respostas
+                        selector.modify(sock, selectors.EVENT_READ | selectors.EVENT_WRITE)
+                        selector.select(0.01)
+                        selector.modify(sock, selectors.EVENT_READ)
+                        drain()
+                    except OSError as e:
+                        self.logger.debug("Falha ao enviar ICMP para %s: %s", ip, e)
+                        break
+                
+                if len(targets) % 16 == 0:
+                    drain()
+            
+            deadline = time.monotonic() + timeout
+            while len(alive) < len(targets):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if selector.select(remaining):
+                    drain()
+        
+        return sorted(alive, key=targets.__getitem__)
+    
+    async def _ping_and_resolve(self, hosts: Iterable[str],
+                                resolve_names: bool = True) -> Tuple[List[str], Dict[str, Optional[str]]]:
+        """
+        Varre os hosts com ping e resolve o hostname de cada um que responde.
+        
+        A consulta reversa de um IP começa assim que ele responde, em paralelo
+        com os pings ainda pendentes.
+        
+        Args:
+            hosts (iterable): IPs a testar
+            resolve_names (bool): Se False, apenas pinga (dict de hostnames vazio)
+            
+        Returns:
+            tuple: (IPs que responderam, dict IP -> hostname)
+        """
+        lookups = []
+        
+        def on_alive(ip):
+            lookups.append(asyncio.ensure_future(self._resolve_many([ip])))
+        
+        alive_ips = await self._async_ping_sweep(hosts, on_alive if resolve_names else None)
+        
+        hostnames = {}
+        for result in await asyncio.gather(*lookups):
+            hostnames.update(result)
+        return alive_ips, hostnames
+    
+    async def _async_ping_sweep(self, hosts: Iterable[str],
+                                on_alive: Optional[Callable[[str], None]] = None) -> List[str]:
+        """
+        Envia um ping para cada host concorrentemente.
+        
+        Um conjunto fixo de tarefas consome ``hosts`` sob demanda: até
+        ICMP_CONCURRENCY com icmplib, ou PING_CONCURRENCY processos ping.
+        
+        Args:
+            hosts (iterable): IPs a testar
+            on_alive (callable): Chamado com cada IP assim que ele responde
+            
+        Returns:
+            list: IPs que responderam, na ordem de ``hosts``
+        """
+        pending = enumerate(hosts)
+        alive = []
+        
+        async def worker():
+            # Iteradores são seguros aqui: as tarefas só alternam nos awaits
+            for index, ip in pending:
+                if await self._ping_host_async(ip):
+                    alive.append((index, ip))
+                    if on_alive is not None:
+                        on_alive(ip)
+        
+        concurrency = ICMP_CONCURRENCY if self._icmp_enabled else PING_CONCURRENCY
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return [ip for index, ip in sorted(alive)]
+    
+    async def _ping_host_async(self, ip: str) -> bool:
+        """
+        Pinga um IP sem bloquear o event loop.
+        
+        Usa socket ICMP (icmplib) quando possível; caso contrário, o comando
+        ping do sistema.
+        
+        Args:
+            ip (str): Endereço IP
+            
+        Returns:
+            bool: True se o host respondeu
+        """
+        if self._icmp_enabled:
+            privileged = self._icmp_privileged
+            try:
+                host = await icmplib.async_ping(ip, count=1, timeout=1, privileged=privileged)
+                return host.is_alive
+            except icmplib.SocketPermissionError:
+                if self._handle_icmp_permission_error(privileged):
+                    return await self._ping_host_async(ip)
+            except icmplib.ICMPLibError as e:
+                self.logger.debug("Erro no ping ICMP para %s: %s", ip, e)
+                return False
+        
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *_PING_PREFIX, ip,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+        except OSError as e:
+            self.logger.debug("Não foi possível executar ping para %s: %s", ip, e)
+            return False
+        
+        try:
+            return await asyncio.wait_for(proc.wait(), timeout=2) == 0
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            # Encerrar o processo se expirou ou se o scan foi cancelado (ex.: Ctrl+C)
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+    
+    def _handle_icmp_permission_error(self, privileged: bool) -> bool:
+        """
+        Trata a falta de permissão para abrir o socket ICMP.
+        
+        Sem privilégios (ex.: ping_group_range restrito no Linux), tenta o
+        socket raw se o processo roda como root; se também não der, desativa
+        o icmplib e os pings passam a usar o comando do sistema.
+        
+        Args:
+            privileged (bool): Modo usado na tentativa que falhou
+            
+        Returns:
+            bool: True se o ping deve ser repetido com o modo atual
+        """
+        if not self._icmp_enabled:
+            return False
+        if privileged != self._icmp_privileged:
+            # Outra tarefa já trocou o modo
+            return True
+        if not privileged and hasattr(os, "geteuid") and os.geteuid() == 0:
+            self._icmp_privileged = True
+            self.logger.info("Sockets ICMP sem privilégios indisponíveis, usando socket raw")
+            return True
+        
+        self._icmp_enabled = False
+        self.logger.info("Sem permissão para sockets ICMP, usando comando ping")
+        return False
+    
     def get_device_count(self) -> int:
         """
         Retorna o número de dispositivos detectados.
@@ -6,10 +6,204 @@ Este módulo implementa scanning de redes Wi-Fi usando:
 2. Scapy como alternativa (requer privilégios elevados)
 """
 
+import asyncio
+import ctypes
 import logging
+import os
+import re
 import subprocess
 import platform
-from typing import List, Dict, Optional
+import queue
+import threading
+import time
+from array import array
+from collections.abc import Mapping
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
+
+
+# Tempo (s) em que o último scan é reaproveitado; próximo do intervalo de scan do SO
+SCAN_CACHE_TTL = 10.0
+
+# Intervalo padrão (s) do scan em segundo plano e tamanho da fila de resultados
+BACKGROUND_SCAN_INTERVAL = 10.0
+BACKGROUND_QUEUE_SIZE = 2
+
+
+def _iter_lines(output) -> Iterable[str]:
+    """Aceita o output completo (str) ou um iterável de linhas (ex.: stdout do processo)."""
+    return output.splitlines() if isinstance(output, str) else output
+
+
+def _percent_to_rssi(signal_percent: int) -> int:
+    """Converte qualidade em % para RSSI aproximado (100% ≈ -30dBm, 0% ≈ -100dBm), só com inteiros."""
+    return -100 + signal_percent * 7 // 10
+
+
+def _rssi_to_percent(rssi: int) -> int:
+    """Converte RSSI em dBm para qualidade em %, limitada a 0-100."""
+    return max(0, min(100, (rssi + 100) * 2))
+
+
+# Tempo (s) em que o estado do rádio Wi-Fi (ligado/desligado) é reaproveitado
+RADIO_STATE_TTL = 5.0
+
+# WlanOpenHandle: versão do cliente WLAN e erro de serviço WLAN (wlansvc) parado
+_WLAN_CLIENT_VERSION = 2
+_ERROR_SERVICE_NOT_ACTIVE = 1062
+
+# Comando de estado do rádio no macOS
+_AIRPORT_POWER_ARGV = ('networksetup', '-getairportpower', 'en0')
+
+
+def _windows_wifi_enabled() -> bool:
+    """Verifica via wlanapi se o serviço WLAN está ativo (True se não der para saber)."""
+    try:
+        wlanapi = ctypes.windll.wlanapi
+        negotiated = ctypes.c_ulong()
+        handle = ctypes.c_void_p()
+        result = wlanapi.WlanOpenHandle(_WLAN_CLIENT_VERSION, None, ctypes.byref(negotiated), ctypes.byref(handle))
+    except (AttributeError, OSError):
+        return True
+    
+    if result == 0:
+        wlanapi.WlanCloseHandle(handle, None)
+    return result != _ERROR_SERVICE_NOT_ACTIVE
+
+
+def _linux_wifi_enabled(sys_class: str = '/sys/class') -> bool:
+    """
+    Verifica via sysfs se há interface wireless com rádio desbloqueado.
+    
+    Args:
+        sys_class (str): Raiz do sysfs (parametrizável para testes)
+        
+    Returns:
+        bool: False se não houver interface wireless ou se todo rádio WLAN
+              estiver bloqueado (rfkill); True se não der para saber
+    """
+    net_dir = os.path.join(sys_class, 'net')
+    try:
+        interfaces = os.listdir(net_dir)
+    except OSError:
+        return True
+    
+    if not any(os.path.isdir(os.path.join(net_dir, name, 'wireless')) or
+               os.path.exists(os.path.join(net_dir, name, 'phy80211'))
+               for name in interfaces):
+        return False
+    
+    rfkill_dir = os.path.join(sys_class, 'rfkill')
+    try:
+        switches = os.listdir(rfkill_dir)
+    except OSError:
+        return True
+    
+    wlan_seen = False
+    for name in switches:
+        switch = os.path.join(rfkill_dir, name)
+        try:
+            if _read_sysfs(switch, 'type') != 'wlan':
+                continue
+            wlan_seen = True
+            if _read_sysfs(switch, 'soft') == '0' and _read_sysfs(switch, 'hard') == '0':
+                return True
+        except OSError:
+            return True
+    return not wlan_seen
+
+
+def _read_sysfs(directory: str, attr: str) -> str:
+    """Lê um atributo de uma entrada do sysfs."""
+    with open(os.path.join(directory, attr)) as f:
+        return f.read().strip()
+
+
+def _macos_wifi_enabled() -> bool:
+    """Verifica com networksetup se o Wi-Fi está ligado (True se não der para saber)."""
+    try:
+        result = subprocess.run(_AIRPORT_POWER_ARGV, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                text=True, timeout=2)
+    except (OSError, subprocess.TimeoutExpired):
+        return True
+    return not result.stdout.rstrip().endswith(': Off')
+
+
+# Comandos de scan (argv pré-montados, sem shell)
+_NETSH_ARGV = ('netsh', 'wlan', 'show', 'networks', 'mode=bssid')
+_NMCLI_ARGV = ('nmcli', '-t', '-f', 'SSID,BSSID,CHAN,SIGNAL,SECURITY', 'dev', 'wifi')
+_IWLIST_ARGV = ('iwlist', 'scanning')
+_AIRPORT_ARGV = ('/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport', '-s')
+
+
+# Linhas relevantes do netsh (português ou inglês): "<Campo> [n] : <valor>".
+# O campo é identificado pela primeira palavra antes do ':', com uma busca no dict
+_NETSH_FIELDS = {
+    'SSID': 'ssid', 'BSSID': 'bssid',
+    'Sinal': 'signal', 'Signal': 'signal',
+    'Canal': 'channel', 'Channel': 'channel',
+    'Autenticação': 'security', 'Authentication': 'security',
+}
+
+# Linha do nmcli -t (SSID:BSSID:CHAN:SIGNAL:SECURITY); no modo terse os ':' dos
+# valores vêm escapados como '\:', então o BSSID serve de âncora para os campos
+_NMCLI_RE = re.compile(
+    r'^\s*(?P<ssid>(?:.*\S)?)\s*:(?P<bssid>(?:[0-9A-Fa-f]{2}\\:){5}[0-9A-Fa-f]{2}):(?P<channel>\d*):(?P<signal>\d*)'
+    r':(?P<security>.*?)\s*$'
+)
+_NMCLI_UNESCAPE_RE = re.compile(r'\\(.)')
+
+# Linhas relevantes do iwlist: uma alternativa (grupo nomeado) por campo
+_IWLIST_RE = re.compile(
+    r'^\s*(?:Cell\s+\d+\s+-\s+Address:\s*(?P<bssid>\S+)'
+    r'|ESSID:"?(?P<essid>.*?)"?\s*$'
+    r'|Channel:(?P<channel>\d+)'
+    r'|.*Signal level=(?P<signal>-?\d+)\s*dBm)'
+)
+
+# Linha do airport: SSID (pode conter espaços), BSSID, RSSI, CHANNEL, HT, CC, SECURITY
+_AIRPORT_RE = re.compile(
+    r'^\s*(?P<ssid>.*?)\s+(?P<bssid>(?:[0-9A-Fa-f]{2}:){5}[0-9A-Fa-f]{2})\s+(?P<rssi>-?\d+)'
+    r'\s+(?P<channel>\d+)\S*\s+\S+\s+\S+\s*(?P<security>.*?)\s*$'
+)
+
+
+class WifiNetwork(Mapping):
+    """
+    Rede Wi-Fi detectada em um scan.
+    
+    Usa ``__slots__`` (sem ``__dict__`` por instância, bem menor que um dict
+    de 6 chaves), mas continua legível como dicionário (``net['rssi']``,
+    ``net.get('ssid')``, comparação com dicts) para manter a API existente.
+    """
+    
+    __slots__ = ('ssid', 'bssid', 'rssi', 'signal_percent', 'channel', 'security')
+    
+    def __init__(self, ssid: str = '', bssid: str = '', rssi: int = -100, signal_percent: int = 0,
+                 channel: int = 0, security: str = 'Unknown'):
+        self.ssid = ssid
+        self.bssid = bssid
+        self.rssi = rssi
+        self.signal_percent = signal_percent
+        self.channel = channel
+        self.security = security
+    
+    def __getitem__(self, key: str):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self.__slots__)
+    
+    def __len__(self) -> int:
+        return len(self.__slots__)
+    
+    def __repr__(self) -> str:
+        return f"WifiNetwork({self.to_dict()!r})"
+    
+    def to_dict(self) -> Dict[str, any]:
+        """Retorna a rede como dicionário comum."""
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 class WifiScanner:
@@ -24,18 +218,79 @@ class WifiScanner:
     def __init__(self):
         """Inicializa o scanner Wi-Fi."""
         self.logger = logging.getLogger(__name__)
-        self.networks = []
+        self.networks = []  # também monta os índices _by_ssid/_by_security
         self.interface = None
         self.os_type = platform.system()
         
+        # SSIDs de interesse; None mantém todas as redes no parse
+        self.filter_ssids: Optional[Set[str]] = None
+        
+        # Estado do rádio Wi-Fi em cache: (timestamp monotônico, ligado)
+        self._radio_state = None
+        
+        # Scan periódico em segundo plano: resultados (timestamp, redes) na fila
+        self.result_q = queue.Queue(maxsize=BACKGROUND_QUEUE_SIZE)
+        self._stop = threading.Event()
+        self._paused = threading.Event()
+        self._background_thread = None
+        
+        # Um scan do SO por vez; _scan_seq conta os scans concluídos, para que
+        # quem esperou o lock reaproveite o resultado recém-obtido
+        self._scan_lock = threading.Lock()
+        self._scan_seq = 0
+        
+        # Cache do último scan bem-sucedido
+        self._last_scan_ts = 0.0
+        self._cache_ttl = SCAN_CACHE_TTL
+        # Assinatura do último scan; dois scans iguais seguidos dobram o TTL
+        self._fingerprint = 0
+        self._stable = False
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
         self.logger.info(f"WifiScanner inicializado para {self.os_type}")
     
-    def scan_networks(self, timeout: int = 10) -> List[Dict[str, any]]:
+    @property
+    def networks(self) -> List[Dict[str, any]]:
+        """Redes do último scan."""
+        return self._networks
+    
+    @networks.setter
+    def networks(self, networks: List[Dict[str, any]]):
+        self._set_networks(networks)
+    
+    def _set_networks(self, networks: List[Dict[str, any]]):
+        """
+        Substitui a lista de redes e reconstrói os índices de consulta.
+        
+        Args:
+            networks (list): Redes detectadas
+        """
+        by_ssid = {}
+        by_security = {}
+        for index, network in enumerate(networks):
+            # SSID repetido (vários APs): vale o primeiro, como na busca linear
+            by_ssid.setdefault(network.get('ssid'), network)
+            by_security.setdefault(network.get('security', '').casefold(), []).append(index)
+        
+        self._networks = networks
+        self._by_ssid = by_ssid
+        self._by_security = by_security
+        self._arrays = None
+    
+    def scan_networks(self, timeout: int = 10, force: bool = False) -> List[Dict[str, any]]:
         """
         Escaneia redes Wi-Fi disponíveis.
         
+        Enquanto o último scan tiver menos de ``SCAN_CACHE_TTL`` segundos, o
+        resultado anterior é devolvido sem executar o comando do sistema. Se
+        os dois últimos scans encontraram as mesmas redes (RSSI estável), o
+        prazo é dobrado. Chamadas simultâneas não executam scans em paralelo:
+        quem chega com um scan em andamento espera e recebe o mesmo resultado.
+        
         Args:
             timeout (int): Tempo máximo de scan em segundos. Default: 10
+            force (bool): Ignora o cache e força um novo scan. Default: False
             
         Returns:
             list: Lista de dicionários com informações das redes
@@ -46,15 +301,241 @@ class WifiScanner:
             PermissionError: Se não houver privilégios suficientes
             TimeoutError: Se o scan exceder o tempo limite
         """
+        if self._cache_is_warm(force):
+            return self.networks
+        
+        seq = self._scan_seq
+        with self._scan_lock:
+            if self._scan_seq != seq:
+                # Outro scan terminou enquanto esperávamos o lock
+                return self.networks
+            return self._store_scan(self._scan_platform(timeout))
+    
+    def scan_networks_diff(self, timeout: int = 10, force: bool = False) -> Tuple[List[Dict[str, any]], List[Dict[str, any]], List[Dict[str, any]]]:
+        """
+        Escaneia e retorna apenas o que mudou em relação ao scan anterior.
+        
+        Args:
+            timeout (int): Tempo máximo de scan em segundos. Default: 10
+            force (bool): Ignora o cache e força um novo scan. Default: False
+            
+        Returns:
+            tuple: (adicionadas, removidas, atualizadas), listas de redes comparadas
+                   por SSID; "atualizadas" são as redes cujo RSSI variou mais de 1 dBm
+        """
+        previous = self._by_ssid
+        self.scan_networks(timeout, force)
+        return self.diff_networks(previous, self._by_ssid)
+    
+    @staticmethod
+    def diff_networks(old: Dict[str, Dict[str, any]],
+                      new: Dict[str, Dict[str, any]]) -> Tuple[List[Dict[str, any]], List[Dict[str, any]], List[Dict[str, any]]]:
+        """
+        Compara dois índices SSID -> rede.
+        
+        Args:
+            old (dict): Índice do scan anterior
+            new (dict): Índice do scan atual
+            
+        Returns:
+            tuple: (adicionadas, removidas, atualizadas)
+        """
+        if new is old:
+            # Scan servido pelo cache: índice intacto, nada mudou
+            return [], [], []
+        
+        added = [net for ssid, net in new.items() if ssid not in old]
+        removed = [net for ssid, net in old.items() if ssid not in new]
+        updated = [net for ssid, net in new.items()
+                   if ssid in old and abs(net.get('rssi', -100) - old[ssid].get('rssi', -100)) > 1]
+        return added, removed, updated
+    
+    async def scan_networks_async(self, timeout: int = 10, force: bool = False) -> List[Dict[str, any]]:
+        """
+        Versão assíncrona de ``scan_networks``.
+        
+        No Linux, nmcli e iwlist são executados em paralelo, mas o resultado do
+        iwlist só é usado se o nmcli falhar (mesma preferência do scan
+        síncrono). Nos demais sistemas o scan síncrono roda em um executor para
+        não bloquear o event loop.
+        
+        Args:
+            timeout (int): Tempo máximo de scan em segundos. Default: 10
+            force (bool): Ignora o cache e força um novo scan. Default: False
+            
+        Returns:
+            list: Lista de redes detectadas (mesmo formato de ``scan_networks``)
+        """
+        if self._cache_is_warm(force):
+            return self.networks
+        
+        seq = self._scan_seq
+        await self._acquire_scan_lock()
+        try:
+            if self._scan_seq != seq:
+                # Outro scan terminou enquanto esperávamos o lock
+                return self.networks
+            if self.os_type == "Linux":
+                networks = await self._scan_linux_async(timeout)
+            else:
+                loop = asyncio.get_running_loop()
+                networks = await loop.run_in_executor(None, self._scan_platform, timeout)
+            return self._store_scan(networks)
+        finally:
+            self._scan_lock.release()
+    
+    async def _acquire_scan_lock(self):
+        """Aguarda o lock de scan sem bloquear o event loop."""
+        if self._scan_lock.acquire(blocking=False):
+            return
+        
+        loop = asyncio.get_running_loop()
+        acquired = loop.run_in_executor(None, self._scan_lock.acquire)
+        try:
+            await asyncio.shield(acquired)
+        except asyncio.CancelledError:
+            # O acquire segue na thread do executor: libera o lock quando ele concluir
+            acquired.add_done_callback(lambda _: self._scan_lock.release())
+            raise
+    
+    def start_background(self, interval: float = BACKGROUND_SCAN_INTERVAL):
+        """
+        Inicia o scan periódico em uma thread daemon.
+        
+        Cada resultado é colocado em ``result_q`` como ``(timestamp, redes)``.
+        A fila é limitada: se o consumidor atrasar, o resultado mais antigo é
+        descartado.
+        
+        Args:
+            interval (float): Intervalo entre scans em segundos
+        """
+        if self._background_thread is not None and self._background_thread.is_alive():
+            return
+        
+        self._stop.clear()
+        self._background_thread = threading.Thread(
+            target=self._background_loop, args=(interval,), name='WifiBackgroundScan', daemon=True
+        )
+        self._background_thread.start()
+        self.logger.info(f"Scan em segundo plano iniciado (intervalo: {interval}s)")
+    
+    def stop_background(self, timeout: Optional[float] = None):
+        """
+        Para o scan periódico.
+        
+        Args:
+            timeout (float): Tempo máximo de espera pela thread (None: não esperar)
+        """
+        self._stop.set()
+        if self._background_thread is not None and timeout is not None:
+            self._background_thread.join(timeout)
+    
+    def pause(self):
+        """Suspende o scan periódico (a thread continua viva, sem executar scans)."""
+        self._paused.set()
+    
+    def resume(self):
+        """Retoma o scan periódico suspenso por ``pause``."""
+        self._paused.clear()
+    
+    def _background_loop(self, interval: float):
+        """Loop da thread de scan periódico."""
+        while not self._stop.is_set():
+            if self._paused.is_set():
+                self._stop.wait(interval)
+                continue
+            try:
+                # Sem force: o cache (e o TTL estendido em ambiente estável) evita scans redundantes
+                networks = self.scan_networks()
+            except Exception:
+                self.logger.exception("Erro no scan em segundo plano")
+            else:
+                self._publish((time.time(), networks))
+            
+            self._stop.wait(interval)
+    
+    def _publish(self, item):
+        """Coloca um resultado na fila, descartando o mais antigo se estiver cheia."""
+        while True:
+            try:
+                self.result_q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self.result_q.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _wifi_enabled(self) -> bool:
+        """
+        Indica se o Wi-Fi está ligado, para evitar executar o comando de scan à toa.
+        
+        O resultado fica em cache por ``RADIO_STATE_TTL`` segundos.
+        
+        Returns:
+            bool: False apenas quando o sistema indica rádio/serviço desligado
+        """
+        now = time.monotonic()
+        if self._radio_state is not None and now - self._radio_state[0] < RADIO_STATE_TTL:
+            return self._radio_state[1]
+        
+        if self.os_type == "Windows":
+            enabled = _windows_wifi_enabled()
+        elif self.os_type == "Linux":
+            enabled = _linux_wifi_enabled()
+        elif self.os_type == "Darwin":
+            enabled = _macos_wifi_enabled()
+        else:
+            enabled = True
+        
+        self._radio_state = (now, enabled)
+        if not enabled:
+            self.logger.info("Wi-Fi desligado ou sem adaptador; scan ignorado")
+        return enabled
+    
+    def _cache_is_warm(self, force: bool = False) -> bool:
+        """Indica se o último scan ainda pode ser reaproveitado (e contabiliza hit/miss)."""
+        ttl = self._cache_ttl * 2 if self._stable else self._cache_ttl
+        if not force and self.networks and time.monotonic() - self._last_scan_ts < ttl:
+            self.cache_hits += 1
+            self.logger.debug("Usando resultado do scan em cache")
+            return True
+        self.cache_misses += 1
+        return False
+    
+    def _store_scan(self, networks: List[Dict[str, any]]) -> List[Dict[str, any]]:
+        """
+        Publica o resultado do scan em ``networks`` (e nos índices de consulta).
+        
+        Só um scan não vazio entra no cache: um resultado vazio limpa a lista,
+        mas nunca é reaproveitado como hit.
+        """
+        self._set_networks(networks)
+        if networks:
+            # Mesmos BSSIDs com RSSI na mesma faixa de 3 dB: ambiente estável
+            fingerprint = hash(tuple(sorted((n.get('bssid', ''), n.get('rssi', -100) // 3) for n in networks)))
+            self._stable = fingerprint == self._fingerprint
+            self._fingerprint = fingerprint
+            self._last_scan_ts = time.monotonic()
+        self._scan_seq += 1
+        return networks
+    
+    def _scan_platform(self, timeout: int = 10) -> List[Dict[str, any]]:
+        """
+        Executa o scan síncrono do sistema operacional atual.
+        
+        Args:
+            timeout (int): Tempo máximo de cada comando em segundos
+        """
         self.logger.info("Iniciando scan de redes Wi-Fi...")
         
         try:
             if self.os_type == "Windows":
-                return self._scan_windows()
+                return self._scan_windows(timeout)
             elif self.os_type == "Linux":
-                return self._scan_linux()
+                return self._scan_linux(timeout)
             elif self.os_type == "Darwin":  # macOS
-                return self._scan_macos()
+                return self._scan_macos(timeout)
             else:
                 self.logger.error(f"Sistema operacional não suportado: {self.os_type}")
                 return []
@@ -63,33 +544,66 @@ class WifiScanner:
             self.logger.exception("Erro ao escanear redes Wi-Fi")
             raise
     
-    def _scan_windows(self) -> List[Dict[str, any]]:
+    def invalidate_cache(self):
+        """Descarta o resultado em cache; o próximo scan executa o comando do sistema."""
+        self._last_scan_ts = 0.0
+        self._stable = False
+    
+    def set_ssid_filter(self, ssids: Optional[Iterable[str]]):
+        """
+        Restringe os scans às redes com os SSIDs informados.
+        
+        Redes fora do filtro são descartadas durante o parse, sem montar o
+        dicionário da rede. O cache é invalidado, pois foi montado com o
+        filtro anterior.
+        
+        Args:
+            ssids (iterable): SSIDs acompanhados, ou None para manter todas as redes
+        """
+        self.filter_ssids = frozenset(ssids) if ssids is not None else None
+        self.invalidate_cache()
+    
+    def _ssid_wanted(self, ssid: str) -> bool:
+        """Indica se a rede passa pelo filtro de SSIDs."""
+        return self.filter_ssids is None or ssid in self.filter_ssids
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Retorna contadores de uso do cache de scan.
+        
+        Returns:
+            dict: {'hits': int, 'misses': int}
+        """
+        return {'hits': self.cache_hits, 'misses': self.cache_misses}
+    
+    def _scan_windows(self, timeout: int = 10) -> List[Dict[str, any]]:
         """
         Escaneia redes Wi-Fi no Windows usando netsh.
         
+        Args:
+            timeout (int): Tempo máximo de cada comando em segundos
+            
         Returns:
             list: Lista de redes detectadas
         """
         self.logger.info("Executando scan Windows (netsh)...")
         
+        if not self._wifi_enabled():
+            return []
+        
         try:
-            # Executar comando netsh
-            result = subprocess.run(
-                ['netsh', 'wlan', 'show', 'networks', 'mode=bssid'],
-                capture_output=True,
-                text=True,
-                encoding='cp850',  # Encoding do Windows
-                timeout=10
+            # Executar netsh, fazendo o parse à medida que o output chega
+            returncode, networks = self._run_streaming(
+                _NETSH_ARGV,
+                self._parse_netsh_output,
+                timeout=timeout,
+                encoding='cp850'  # Encoding do Windows
             )
             
-            if result.returncode != 0:
-                self.logger.error(f"Erro ao executar netsh: {result.stderr}")
+            if returncode != 0:
+                self.logger.error(f"Erro ao executar netsh: {self._command_stderr(_NETSH_ARGV, 'cp850', timeout)}")
                 return []
             
-            # Parse do output
-            networks = self._parse_netsh_output(result.stdout)
-            self.networks = networks
-            
             self.logger.info(f"Scan concluído: {len(networks)} redes encontradas")
             return networks
             
@@ -100,114 +614,173 @@ class WifiScanner:
             self.logger.error("Comando netsh não encontrado")
             return []
     
-    def _parse_netsh_output(self, output: str) -> List[Dict[str, any]]:
+    def _run_streaming(self, command: Tuple[str, ...], parser: Callable[[Iterable[str]], List[Dict[str, any]]],
+                       timeout: int = 10, encoding: Optional[str] = None) -> Tuple[int, List[Dict[str, any]]]:
+        """
+        Executa um comando de scan e entrega o stdout ao parser linha a linha.
+        
+        O parse acontece enquanto o comando ainda escreve, sem acumular o
+        output inteiro em memória. O stderr é descartado; em caso de falha
+        use ``_command_stderr`` para obter a mensagem de erro.
+        
+        Args:
+            command (tuple): Comando e argumentos
+            parser (callable): Parser que recebe um iterável de linhas
+            timeout (int): Tempo máximo em segundos
+            encoding (str): Encoding do output (default do sistema se None)
+            
+        Returns:
+            tuple: (returncode, redes parseadas)
+            
+        Raises:
+            FileNotFoundError: Se o comando não existir
+            subprocess.TimeoutExpired: Se o comando exceder ``timeout``
+        """
+        timed_out = threading.Event()
+        
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                              text=True, encoding=encoding) as proc:
+            def kill():
+                timed_out.set()
+                proc.kill()
+            
+            # Encerrar o processo no timeout interrompe também a leitura do stdout
+            timer = threading.Timer(timeout, kill)
+            timer.start()
+            try:
+                networks = parser(proc.stdout)
+                proc.wait()
+            finally:
+                timer.cancel()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(command, timeout)
+        return proc.returncode, networks
+    
+    def _command_stderr(self, command: Tuple[str, ...], encoding: Optional[str] = None, timeout: int = 10) -> str:
+        """
+        Reexecuta um comando que falhou apenas para capturar o stderr.
+        
+        Args:
+            command (tuple): Comando e argumentos
+            encoding (str): Encoding do output (default do sistema se None)
+            timeout (int): Tempo máximo em segundos
+            
+        Returns:
+            str: Mensagem de erro do comando (vazia se não for possível obtê-la)
+        """
+        try:
+            result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                                    text=True, encoding=encoding, timeout=timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            return ''
+        return result.stderr.strip()
+    
+    def _parse_netsh_output(self, output: Iterable[str]) -> List[WifiNetwork]:
         """
         Faz parsing do output do comando netsh.
         
         Args:
-            output (str): Output do comando netsh
+            output (str): Output do comando netsh (texto ou iterável de linhas)
             
         Returns:
             list: Lista de redes parseadas
         """
-        networks = []
-        current_network = {}
+        networks = list(self._iter_netsh(output))
+        self.logger.debug("Parsing concluído: %d redes parseadas", len(networks))
+        return networks
+    
+    def _iter_netsh(self, output: Iterable[str]) -> Iterator[WifiNetwork]:
+        """
+        Gera as redes do output do netsh à medida que cada uma é concluída.
         
-        lines = output.split('\n')
+        Args:
+            output (str): Output do comando netsh (texto ou iterável de linhas)
+            
+        Yields:
+            WifiNetwork: Rede parseada
+        """
+        current_network = None
         
-        for line in lines:
-            line = line.strip()
+        for line in _iter_lines(output):
+            label, sep, value = line.partition(':')
+            if not sep:
+                continue
+            
+            words = label.split(None, 1)
+            field = _NETSH_FIELDS.get(words[0]) if words else None
+            if field is None:
+                continue
+            value = value.strip()
             
             # Detectar início de uma nova rede (SSID)
-            if 'SSID' in line and ':' in line and 'BSSID' not in line:
+            if field == 'ssid':
                 # Salvar rede anterior se existir
-                if current_network and current_network.get('ssid'):
-                    networks.append(current_network)
+                if current_network is not None and current_network.ssid:
+                    yield current_network
                 
-                # Iniciar nova rede
-                ssid = line.split(':', 1)[1].strip()
-                current_network = {
-                    'ssid': ssid,
-                    'bssid': '',
-                    'rssi': -100,
-                    'signal_percent': 0,
-                    'channel': 0,
-                    'security': 'Unknown'
-                }
+                # Iniciar nova rede (None se descartada pelo filtro)
+                current_network = WifiNetwork(value) if self._ssid_wanted(value) else None
+            
+            # Campos de uma rede descartada pelo filtro
+            elif current_network is None:
+                continue
             
             # BSSID / MAC Address
-            elif 'BSSID' in line and ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    current_network['bssid'] = parts[1].strip()
+            elif field == 'bssid':
+                current_network.bssid = value
             
             # Sinal (pode estar como "Sinal" ou "Signal")
-            elif ('Sinal' in line or 'Signal' in line) and ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    signal_str = parts[1].strip().replace('%', '')
-                    try:
-                        signal_percent = int(signal_str)
-                        current_network['signal_percent'] = signal_percent
-                        # Converter % para RSSI aproximado
-                        # 100% ≈ -30dBm, 0% ≈ -100dBm
-                        current_network['rssi'] = -100 + int(signal_percent * 0.7)
-                    except ValueError:
-                        pass
+            elif field == 'signal':
+                try:
+                    signal_percent = int(value.replace('%', ''))
+                    current_network.signal_percent = signal_percent
+                    current_network.rssi = _percent_to_rssi(signal_percent)
+                except ValueError:
+                    pass
             
             # Canal (pode estar como "Canal" ou "Channel")
-            elif ('Canal' in line or 'Channel' in line) and ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    try:
-                        current_network['channel'] = int(parts[1].strip())
-                    except ValueError:
-                        pass
+            elif field == 'channel':
+                try:
+                    current_network.channel = int(value)
+                except ValueError:
+                    pass
             
             # Tipo de autenticação/segurança
-            elif ('Autenticação' in line or 'Authentication' in line) and ':' in line:
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    current_network['security'] = parts[1].strip()
+            else:
+                current_network.security = value
         
         # Adicionar última rede
-        if current_network and current_network.get('ssid'):
-            networks.append(current_network)
-        
-        self.logger.debug(f"Parsing concluído: {len(networks)} redes parseadas")
-        return networks
+        if current_network is not None and current_network.ssid:
+            yield current_network
     
-    def _scan_linux(self) -> List[Dict[str, any]]:
+    def _scan_linux(self, timeout: int = 10) -> List[Dict[str, any]]:
         """
         Escaneia redes Wi-Fi no Linux usando iwlist ou nmcli.
         
+        Args:
+            timeout (int): Tempo máximo de cada comando em segundos
+            
         Returns:
             list: Lista de redes detectadas
         """
         self.logger.info("Executando scan Linux...")
         
+        if not self._wifi_enabled():
+            return []
+        
         try:
             # Tentar nmcli primeiro (mais moderno)
-            result = subprocess.run(
-                ['nmcli', '-t', '-f', 'SSID,BSSID,CHAN,SIGNAL,SECURITY', 'dev', 'wifi'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            returncode, networks = self._run_streaming(_NMCLI_ARGV, self._parse_nmcli_output, timeout)
             
-            if result.returncode == 0:
-                return self._parse_nmcli_output(result.stdout)
+            if returncode == 0:
+                return networks
             
             # Fallback para iwlist
-            result = subprocess.run(
-                ['iwlist', 'scanning'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            returncode, networks = self._run_streaming(_IWLIST_ARGV, self._parse_iwlist_output, timeout)
             
-            if result.returncode == 0:
-                return self._parse_iwlist_output(result.stdout)
+            if returncode == 0:
+                return networks
             
             self.logger.error("Nenhum comando de scan Wi-Fi disponível")
             return []
@@ -219,97 +792,180 @@ class WifiScanner:
             self.logger.exception(f"Erro no scan Linux: {e}")
             return []
     
-    def _parse_nmcli_output(self, output: str) -> List[Dict[str, any]]:
-        """Parse output do nmcli."""
-        networks = []
+    async def _scan_linux_async(self, timeout: int = 10) -> List[Dict[str, any]]:
+        """
+        Escaneia redes Wi-Fi no Linux disparando nmcli e iwlist em paralelo.
         
-        for line in output.strip().split('\n'):
-            if not line:
-                continue
+        O nmcli tem preferência, como em ``_scan_linux``: o iwlist (sem
+        privilégios ele costuma terminar na hora com resultado vazio ou
+        desatualizado) é apenas o fallback, já em andamento caso o nmcli falhe
+        ou exceda o tempo limite.
+        
+        Args:
+            timeout (int): Tempo máximo de cada comando em segundos
             
-            parts = line.split(':')
-            if len(parts) >= 5:
-                ssid = parts[0].strip()
-                if not ssid or ssid == '--':
+        Returns:
+            list: Redes do nmcli ou, se ele falhar, do iwlist
+        """
+        self.logger.info("Executando scan Linux (assíncrono)...")
+        
+        if not self._wifi_enabled():
+            return []
+        
+        commands = [
+            (_NMCLI_ARGV, self._parse_nmcli_output),
+            (_IWLIST_ARGV, self._parse_iwlist_output),
+        ]
+        tasks = [asyncio.ensure_future(self._run_async(command, parser, timeout))
+                 for command, parser in commands]
+        missing = 0
+        
+        try:
+            # Resultados consultados em ordem de preferência
+            for task in tasks:
+                try:
+                    returncode, networks = await task
+                except FileNotFoundError:
+                    missing += 1
                     continue
-                
-                signal = int(parts[3]) if parts[3].isdigit() else 0
-                
-                networks.append({
-                    'ssid': ssid,
-                    'bssid': parts[1].strip(),
-                    'rssi': -100 + int(signal * 0.7),
-                    'signal_percent': signal,
-                    'channel': int(parts[2]) if parts[2].isdigit() else 0,
-                    'security': parts[4].strip() if len(parts) > 4 else 'Unknown'
-                })
+                except Exception as error:
+                    self.logger.debug("Falha em comando de scan Linux: %s", error)
+                    continue
+                if returncode == 0:
+                    return networks
+        finally:
+            # O fallback ainda em andamento é cancelado (e morto) quando o nmcli resolve
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
         
-        return networks
+        if missing == len(commands):
+            self.logger.error("nmcli ou iwlist não encontrado. Instale network-manager ou wireless-tools")
+        else:
+            self.logger.error("Nenhum comando de scan Wi-Fi disponível")
+        return []
     
-    def _parse_iwlist_output(self, output: str) -> List[Dict[str, any]]:
-        """Parse output do iwlist."""
-        networks = []
-        current_network = {}
+    async def _run_async(self, command: Tuple[str, ...], parser: Callable[[Iterable[str]], List[Dict[str, any]]],
+                         timeout: int = 10, encoding: str = 'utf-8') -> Tuple[int, List[Dict[str, any]]]:
+        """
+        Executa um comando de scan com asyncio e faz o parse do stdout.
         
-        for line in output.split('\n'):
-            line = line.strip()
+        Args:
+            command (tuple): Comando e argumentos
+            parser (callable): Parser que recebe o output
+            timeout (int): Tempo máximo em segundos
+            encoding (str): Encoding do output
             
-            if 'Cell' in line and 'Address:' in line:
-                if current_network:
-                    networks.append(current_network)
-                current_network = {'bssid': line.split('Address:')[1].strip()}
+        Returns:
+            tuple: (returncode, redes parseadas)
             
-            elif 'ESSID:' in line:
-                essid = line.split('ESSID:')[1].strip().strip('"')
-                current_network['ssid'] = essid
+        Raises:
+            FileNotFoundError: Se o comando não existir
+            subprocess.TimeoutExpired: Se o comando exceder ``timeout``
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            raise subprocess.TimeoutExpired(command, timeout)
+        finally:
+            # Timeout ou cancelamento: não deixar o processo órfão
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+        
+        return proc.returncode, parser(stdout.decode(encoding, errors='replace'))
+    
+    def _parse_nmcli_output(self, output: Iterable[str]) -> List[WifiNetwork]:
+        """Parse output do nmcli (modo terse, com ':' escapados nos valores)."""
+        return list(self._iter_nmcli(output))
+    
+    def _iter_nmcli(self, output: Iterable[str]) -> Iterator[WifiNetwork]:
+        """Gera as redes do output do nmcli, uma por linha."""
+        for line in _iter_lines(output):
+            match = _NMCLI_RE.match(line)
+            if match is None:
+                continue
             
-            elif 'Signal level' in line:
-                signal = line.split('Signal level=')[1].split()[0]
-                try:
-                    signal_val = int(signal.replace('dBm', ''))
-                    current_network['rssi'] = signal_val
-                    current_network['signal_percent'] = min(100, max(0, (signal_val + 100) * 2))
-                except:
-                    pass
+            ssid = _NMCLI_UNESCAPE_RE.sub(r'\1', match.group('ssid'))
+            if not ssid or ssid == '--' or not self._ssid_wanted(ssid):
+                continue
             
-            elif 'Channel:' in line:
-                try:
-                    current_network['channel'] = int(line.split('Channel:')[1].strip())
-                except:
-                    pass
+            signal = int(match.group('signal') or 0)
+            
+            yield WifiNetwork(
+                ssid,
+                match.group('bssid').replace('\\:', ':'),
+                _percent_to_rssi(signal),
+                signal,
+                int(match.group('channel') or 0),
+                match.group('security') or 'Open'
+            )
+    
+    def _parse_iwlist_output(self, output: Iterable[str]) -> List[WifiNetwork]:
+        """Parse output do iwlist."""
+        return list(self._iter_iwlist(output))
+    
+    def _iter_iwlist(self, output: Iterable[str]) -> Iterator[WifiNetwork]:
+        """Gera as redes do output do iwlist, uma por célula."""
+        current_network = None
         
-        if current_network:
-            networks.append(current_network)
+        for line in _iter_lines(output):
+            match = _IWLIST_RE.match(line)
+            if match is None:
+                continue
+            
+            bssid, essid, channel, signal = match.group('bssid', 'essid', 'channel', 'signal')
+            if bssid is not None:
+                if current_network is not None:
+                    yield current_network
+                current_network = WifiNetwork(bssid=bssid)
+            
+            elif current_network is None:
+                # Antes da primeira célula ou célula descartada pelo filtro
+                continue
+            
+            elif essid is not None:
+                if self._ssid_wanted(essid):
+                    current_network.ssid = essid
+                else:
+                    current_network = None
+            
+            elif signal is not None:
+                signal_val = int(signal)
+                current_network.rssi = signal_val
+                current_network.signal_percent = _rssi_to_percent(signal_val)
+            
+            else:
+                current_network.channel = int(channel)
         
-        return networks
+        if current_network is not None:
+            yield current_network
     
-    def _scan_macos(self) -> List[Dict[str, any]]:
+    def _scan_macos(self, timeout: int = 10) -> List[Dict[str, any]]:
         """
         Escaneia redes Wi-Fi no macOS usando airport.
         
+        Args:
+            timeout (int): Tempo máximo de cada comando em segundos
+            
         Returns:
             list: Lista de redes detectadas
         """
         self.logger.info("Executando scan macOS...")
         
+        if not self._wifi_enabled():
+            return []
+        
         try:
-            # Caminho do utilitário airport
-            airport_path = '/System/Library/PrivateFrameworks/Apple80211.framework/Versions/Current/Resources/airport'
-            
-            result = subprocess.run(
-                [airport_path, '-s'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            returncode, networks = self._run_streaming(_AIRPORT_ARGV, self._parse_airport_output, timeout)
             
-            if result.returncode != 0:
-                self.logger.error(f"Erro ao executar airport: {result.stderr}")
+            if returncode != 0:
+                self.logger.error(f"Erro ao executar airport: {self._command_stderr(_AIRPORT_ARGV, timeout=timeout)}")
                 return []
             
-            networks = self._parse_airport_output(result.stdout)
-            self.networks = networks
-            
             self.logger.info(f"Scan macOS concluído: {len(networks)} redes encontradas")
             return networks
             
@@ -320,43 +976,57 @@ class WifiScanner:
             self.logger.exception(f"Erro no scan macOS: {e}")
             return []
     
-    def _parse_airport_output(self, output: str) -> List[Dict[str, any]]:
+    def _parse_airport_output(self, output: Iterable[str]) -> List[WifiNetwork]:
         """Parse output do airport."""
-        networks = []
-        lines = output.strip().split('\n')
-        
-        # Pular header
-        if len(lines) < 2:
-            return networks
-        
-        for line in lines[1:]:
-            parts = line.split()
-            if len(parts) < 3:
+        return list(self._iter_airport(output))
+    
+    def _iter_airport(self, output: Iterable[str]) -> Iterator[WifiNetwork]:
+        """Gera as redes do output do airport, uma por linha."""
+        # O header (sem BSSID) e linhas malformadas não casam com a regex
+        for line in _iter_lines(output):
+            match = _AIRPORT_RE.match(line)
+            if match is None:
+                self.logger.debug(f"Linha do airport ignorada: {line}")
                 continue
             
-            try:
-                ssid = parts[0]
-                bssid = parts[1]
-                rssi = int(parts[2])
-                channel = parts[3] if len(parts) > 3 else '0'
-                security = ' '.join(parts[6:]) if len(parts) > 6 else 'Open'
-                
-                # Converter RSSI para porcentagem
-                signal_percent = min(100, max(0, (rssi + 100) * 2))
-                
-                networks.append({
-                    'ssid': ssid,
-                    'bssid': bssid,
-                    'rssi': rssi,
-                    'signal_percent': signal_percent,
-                    'channel': int(channel.split(',')[0]) if channel.isdigit() else 0,
-                    'security': security
-                })
-            except Exception as e:
-                self.logger.debug(f"Erro ao parsear linha: {line} - {e}")
+            if not self._ssid_wanted(match.group('ssid')):
                 continue
+            
+            rssi = int(match.group('rssi'))
+            
+            yield WifiNetwork(
+                match.group('ssid'),
+                match.group('bssid'),
+                rssi,
+                _rssi_to_percent(rssi),
+                int(match.group('channel')),
+                match.group('security') or 'Open'
+            )
+    
+    def as_arrays(self) -> Dict[str, any]:
+        """
+        Retorna as redes do último scan em colunas (estrutura de arrays).
         
-        return networks
+        As colunas numéricas usam ``array.array`` de inteiros compactos, de
+        forma que agregações (máximo, soma, contagem) rodam em C sobre os
+        valores, sem acessar um dicionário por rede. O resultado é mantido
+        até o próximo scan.
+        
+        Returns:
+            dict: {'ssid': list, 'bssid': list, 'security': list,
+                   'rssi': array('h'), 'signal_percent': array('B'), 'channel': array('H')}
+        """
+        if self._arrays is None:
+            networks = self._networks
+            self._arrays = {
+                'ssid': [n.get('ssid', '') for n in networks],
+                'bssid': [n.get('bssid', '') for n in networks],
+                'security': [n.get('security', '') for n in networks],
+                'rssi': array('h', [n.get('rssi', -100) for n in networks]),
+                'signal_percent': array('B', [n.get('signal_percent', 0) for n in networks]),
+                'channel': array('H', [n.get('channel', 0) for n in networks]),
+            }
+        return self._arrays
     
     def get_signal_strength(self, ssid: str) -> Optional[int]:
         """
@@ -368,10 +1038,8 @@ class WifiScanner:
         Returns:
             int: Valor RSSI em dBm, ou None se não encontrado
         """
-        for network in self.networks:
-            if network.get('ssid') == ssid:
-                return network.get('rssi')
-        return None
+        network = self._by_ssid.get(ssid)
+        return network.get('rssi') if network is not None else None
     
     def get_network_info(self, ssid: str) -> Optional[Dict[str, any]]:
         """
@@ -383,22 +1051,28 @@ class WifiScanner:
         Returns:
             dict: Dicionário com informações da rede, ou None se não encontrado
         """
-        for network in self.networks:
-            if network.get('ssid') == ssid:
-                return network
-        return None
+        return self._by_ssid.get(ssid)
     
-    def get_strongest_network(self) -> Optional[Dict[str, any]]:
+    def get_strongest_network(self, networks: Optional[Iterable[Dict[str, any]]] = None) -> Optional[Dict[str, any]]:
         """
         Retorna a rede com melhor sinal.
         
+        Args:
+            networks (iterable): Redes a considerar, ex.: um gerador ``_iter_*``
+                consumido sem montar lista. Default: redes do último scan
+        
         Returns:
             dict: Rede com maior RSSI, ou None se não houver redes
         """
-        if not self.networks:
+        if networks is not None:
+            return max(networks, key=lambda x: x.get('rssi', -100), default=None)
+        
+        if not self._networks:
             return None
         
-        return max(self.networks, key=lambda x: x.get('rssi', -100))
+        # Máximo e busca em C sobre a coluna de RSSI; empate mantém a primeira rede
+        rssi = self.as_arrays()['rssi']
+        return self._networks[rssi.index(max(rssi))]
     
     def filter_by_security(self, security_type: str) -> List[Dict[str, any]]:
         """
@@ -410,7 +1084,11 @@ class WifiScanner:
         Returns:
             list: Lista de redes filtradas
         """
-        return [n for n in self.networks if security_type.lower() in n.get('security', '').lower()]
+        query = security_type.casefold()
+        
+        # Há poucos tipos distintos de segurança: a busca por substring percorre só as chaves
+        indexes = sorted(i for key, group in self._by_security.items() if query in key for i in group)
+        return [self._networks[i] for i in indexes]
 
 
 if __name__ == "__main__":
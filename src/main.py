@@ -7,16 +7,15 @@ Date: 29/10/2025
 """
 
 import sys
+import ctypes
+import functools
 import logging
+import os
+import platform
 from pathlib import Path
 
-# Adicionar src ao path para imports
-sys.path.insert(0, str(Path(__file__).parent))
-
-from core.wifi_scanner import WifiScanner
-from core.network_scanner import NetworkScanner
-from core.health_tracker import HealthTracker
-from ui.gui import MonitorGUI
+# Diretório src, necessário no path para os imports dos componentes
+SRC_DIR = str(Path(__file__).parent)
 
 
 def setup_logging():
@@ -35,24 +34,23 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def check_permissions():
     """
     Verifica se a aplicação tem permissões necessárias.
     
+    O resultado não muda durante a execução e fica em cache.
+    
     Returns:
         bool: True se tem permissões adequadas
     """
-    import platform
-    
     if platform.system() == "Windows":
         try:
-            import ctypes
             return ctypes.windll.shell32.IsUserAnAdmin() != 0
-        except:
+        except (AttributeError, OSError):
             return False
     else:
         # Linux/Mac: verificar se é root
-        import os
         return os.geteuid() == 0 if hasattr(os, 'geteuid') else True
 
 
@@ -68,22 +66,37 @@ def main():
         print("⚠️ AVISO: Execute como Administrador para funcionalidade completa")
     
     try:
+        # Imports dos componentes (e do Tkinter) só quando a aplicação sobe
+        if SRC_DIR not in sys.path:
+            sys.path.insert(0, SRC_DIR)
+        
         # Inicializar componentes core
         logger.info("Inicializando componentes...")
+        from core.wifi_scanner import WifiScanner
+        from core.network_scanner import NetworkScanner
+        from core.health_tracker import HealthTracker
         wifi_scanner = WifiScanner()
         network_scanner = NetworkScanner()
         health_tracker = HealthTracker()
         
         # Criar e executar GUI
         logger.info("Iniciando interface gráfica...")
+        from ui.gui import MonitorGUI
         app = MonitorGUI(
             wifi_scanner=wifi_scanner,
             network_scanner=network_scanner,
-            health_tracker=health_tracker
+            health_tracker=health_tracker,
+            wifi_results=wifi_scanner.result_q
         )
         
+        # Scan Wi-Fi periódico fora da thread da GUI
+        wifi_scanner.start_background()
+        
         # Iniciar aplicação
-        app.run()
+        try:
+            app.run()
+        finally:
+            wifi_scanner.stop_background()
         
     except KeyboardInterrupt:
         logger.info("Aplicação interrompida pelo usuário")
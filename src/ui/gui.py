@@ -4,12 +4,15 @@ MonitorGUI - Interface gráfica principal do Monitor Wi-Fi
 Interface minimalista usando Tkinter com tema escuro.
 """
 
+import asyncio
 import logging
+import queue
 import tkinter as tk
 from tkinter import ttk, messagebox
+import tkinter.font as tkfont
 import threading
+import time
 from typing import Optional
-from datetime import datetime
 from collections import deque
 
 
@@ -28,6 +31,87 @@ COLORS = {
 }
 
 
+# Pontos mantidos no histórico de saúde (60 = 5 minutos a 5s cada)
+HEALTH_HISTORY_SIZE = 60
+
+# Intervalo mínimo (segundos) entre verificações de saúde; igual ao período
+# do auto-refresh, para que cliques manuais não empilhem pings extras
+HEALTH_CHECK_MIN_INTERVAL = 5.0
+
+# Tempo máximo (segundos) de espera pelo worker de scans ao fechar a janela
+# e intervalo (ms) entre as verificações, feitas via after sem bloquear o Tk
+WORKER_JOIN_TIMEOUT = 1.0
+CLOSE_POLL_MS = 50
+
+# Geometria do gráfico de histórico de saúde (pixels)
+GRAPH_WIDTH = 320
+GRAPH_HEIGHT = 160
+GRAPH_PAD_LEFT = 40
+GRAPH_PAD_RIGHT = 15
+GRAPH_PAD_TOP = 20
+GRAPH_PAD_BOTTOM = 30
+
+# Pontos mínimos para desenhar a área preenchida sob a linha do gráfico
+GRAPH_MIN_FILL_POINTS = 4
+
+# Tabelas de faixa por valor 0-100 (índice = valor), montadas uma vez:
+# tag do sinal Wi-Fi (fraco < 40 <= médio < 70 <= forte) e
+# cor do score de saúde (ruim < 60 <= regular < 80 <= bom)
+_SIGNAL_TAGS = tuple(
+    'signal_low' if value < 40 else ('signal_medium' if value < 70 else 'signal_high')
+    for value in range(101)
+)
+_SCORE_COLORS = tuple(
+    COLORS['danger'] if value < 60 else (COLORS['warning'] if value < 80 else COLORS['success'])
+    for value in range(101)
+)
+
+
+def _score_color(score) -> str:
+    """
+    Retorna a cor correspondente a um score de saúde.
+    
+    Args:
+        score (int): Score de 0 a 100 (valores fora da faixa são limitados)
+        
+    Returns:
+        str: Cor hexadecimal
+    """
+    return _SCORE_COLORS[max(0, min(100, int(score)))]
+
+
+def _blend(color: str, background: str, alpha: float) -> str:
+    """
+    Mistura duas cores '#rrggbb', simulando ``color`` com opacidade ``alpha``.
+    
+    Args:
+        color (str): Cor da frente
+        background (str): Cor do fundo
+        alpha (float): Opacidade da cor da frente (0 a 1)
+        
+    Returns:
+        str: Cor resultante '#rrggbb'
+    """
+    channels = (
+        round(int(color[i:i + 2], 16) * alpha + int(background[i:i + 2], 16) * (1 - alpha))
+        for i in (1, 3, 5)
+    )
+    return '#' + ''.join(f'{channel:02x}' for channel in channels)
+
+
+# Textos do botão e do status para cada estado do auto-refresh
+AUTO_REFRESH_TEXTS = {
+    True: ("⏸️ Pausar Auto-Refresh", "Pronto • Auto-refresh: 5s"),
+    False: ("▶️ Retomar Auto-Refresh", "Pronto • Auto-refresh pausado"),
+}
+
+# Linhas ocupadas por item nas listas (título, info, espaçamento)
+LIST_ITEM_LINES = 3
+
+# Intervalo (ms) de leitura da fila de scans Wi-Fi em segundo plano
+WIFI_RESULTS_POLL_MS = 500
+
+
 class MonitorGUI:
     """
     Classe principal da interface gráfica.
@@ -39,7 +123,7 @@ class MonitorGUI:
         health_tracker: Instância do HealthTracker
     """
     
-    def __init__(self, wifi_scanner, network_scanner, health_tracker):
+    def __init__(self, wifi_scanner, network_scanner, health_tracker, wifi_results: Optional[queue.Queue] = None):
         """
         Inicializa a interface gráfica.
         
@@ -47,6 +131,8 @@ class MonitorGUI:
             wifi_scanner: Instância do WifiScanner
             network_scanner: Instância do NetworkScanner
             health_tracker: Instância do HealthTracker
+            wifi_results (queue.Queue): Fila de (timestamp, redes) do scan Wi-Fi em
+                segundo plano (opcional)
         """
         self.logger = logging.getLogger(__name__)
         
@@ -61,6 +147,18 @@ class MonitorGUI:
         self.root.geometry("1200x700")
         self.root.configure(bg=COLORS['background'])
         
+        # Itens exibidos em cada lista (por widget), para atualizar só o que mudou
+        self._list_items = {}
+        
+        # Mensagem de placeholder exibida em cada lista (por widget), se houver
+        self._placeholders = {}
+        
+        # Larguras pendentes das listas redimensionadas (aplicadas em after_idle)
+        self._pending_resize = {}
+        
+        # Bindings (widget, id) das listas, desfeitos ao fechar a janela
+        self._list_binds = []
+        
         # Configurar estilo
         self._setup_style()
         
@@ -72,15 +170,40 @@ class MonitorGUI:
         self.auto_refresh = True
         self.is_closing = False
         
-        # Dados do gráfico (últimos 60 pontos = 5 minutos a 5s cada)
-        self.health_history = deque(maxlen=60)
-        self.health_timestamps = deque(maxlen=60)
+        # Worker único para os scans: fila de tarefas e tarefas já enfileiradas
+        self._work_q = queue.Queue()
+        self._queued_jobs = set()
+        self._scan_lock = threading.Lock()
+        self._worker_thread = threading.Thread(target=self._worker, name='GUIWorker', daemon=True)
+        self._worker_thread.start()
         
-        # Canvas do gráfico
-        self.health_canvas = None
+        # Callbacks periódicos agendados com after (nome -> id), cancelados ao fechar
+        self._after_ids = {}
+        
+        # Instante (time.monotonic) da última verificação de saúde disparada
+        self._last_health_check = float('-inf')
+        
+        # Event loop dedicado aos scans assíncronos (criado sob demanda)
+        self._async_loop = None
+        
+        # Última lista de redes exibida
+        self._shown_networks = None
+        
+        # Resultados do scan Wi-Fi em segundo plano
+        self.wifi_results = wifi_results
+        
+        # Dados do gráfico: buffers circulares de tamanho fixo (instantes em
+        # time.monotonic(), usados só para o intervalo coberto no rodapé)
+        self.health_history = deque(maxlen=HEALTH_HISTORY_SIZE)
+        self.health_timestamps = deque(maxlen=HEALTH_HISTORY_SIZE)
+        
+        # Último score/categoria exibidos (evita reconfigurar labels iguais)
+        self._last_health = None
         
         # Iniciar atualização automática
         self._schedule_auto_refresh()
+        if self.wifi_results is not None:
+            self._poll_wifi_results()
         
         self.logger.info("GUI inicializada")
     
@@ -89,6 +212,21 @@ class MonitorGUI:
         style = ttk.Style()
         style.theme_use('clam')
         
+        # Fontes compartilhadas: resolvidas uma vez pelo Tk e reutilizadas por
+        # estilos, tags e itens de canvas (mantidas em self para não serem liberadas)
+        self.fonts = {
+            'title': tkfont.Font(family='Segoe UI', size=20, weight='bold'),
+            'header': tkfont.Font(family='Segoe UI', size=12, weight='bold'),
+            'bold': tkfont.Font(family='Segoe UI', size=10, weight='bold'),
+            'normal': tkfont.Font(family='Segoe UI', size=10),
+            'small': tkfont.Font(family='Segoe UI', size=9),
+            'tiny': tkfont.Font(family='Segoe UI', size=8),
+            'signal': tkfont.Font(family='Segoe UI', size=13, weight='bold'),
+            'large': tkfont.Font(family='Segoe UI', size=14),
+            'score': tkfont.Font(family='Segoe UI', size=60, weight='bold'),
+            'gap': tkfont.Font(family='Segoe UI', size=2),
+        }
+        
         # Frame style
         style.configure('Custom.TFrame',
                        background=COLORS['background'])
@@ -100,28 +238,28 @@ class MonitorGUI:
         style.configure('Title.TLabel',
                        background=COLORS['background'],
                        foreground=COLORS['primary'],
-                       font=('Segoe UI', 20, 'bold'))
+                       font=self.fonts['title'])
         
         style.configure('Header.TLabel',
                        background=COLORS['surface'],
                        foreground=COLORS['text'],
-                       font=('Segoe UI', 12, 'bold'))
+                       font=self.fonts['header'])
         
         style.configure('Normal.TLabel',
                        background=COLORS['surface'],
                        foreground=COLORS['text'],
-                       font=('Segoe UI', 10))
+                       font=self.fonts['normal'])
         
         style.configure('Secondary.TLabel',
                        background=COLORS['surface'],
                        foreground=COLORS['text_secondary'],
-                       font=('Segoe UI', 9))
+                       font=self.fonts['small'])
         
         # Button style
         style.configure('Primary.TButton',
                        background=COLORS['primary'],
                        foreground=COLORS['background'],
-                       font=('Segoe UI', 10, 'bold'),
+                       font=self.fonts['bold'],
                        borderwidth=0)
         
         style.map('Primary.TButton',
@@ -182,37 +320,9 @@ class MonitorGUI:
         self.wifi_header = ttk.Label(panel, text="Redes Wi-Fi", style='Header.TLabel')
         self.wifi_header.pack(pady=10, padx=10, anchor='w')
         
-        # Container com scroll
-        scroll_container = ttk.Frame(panel, style='Surface.TFrame')
-        scroll_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
-        
-        # Canvas para scroll
-        self.wifi_canvas = tk.Canvas(
-            scroll_container,
-            bg=COLORS['surface'],
-            highlightthickness=0
-        )
-        scrollbar = ttk.Scrollbar(scroll_container, orient="vertical", command=self.wifi_canvas.yview)
-        self.wifi_scrollable = ttk.Frame(self.wifi_canvas, style='Surface.TFrame')
-        
-        self.wifi_scrollable.bind(
-            "<Configure>",
-            lambda e: self.wifi_canvas.configure(scrollregion=self.wifi_canvas.bbox("all"))
-        )
-        
-        self.wifi_canvas.create_window((0, 0), window=self.wifi_scrollable, anchor="nw")
-        self.wifi_canvas.configure(yscrollcommand=scrollbar.set)
-        
-        self.wifi_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Placeholder inicial
-        placeholder = ttk.Label(
-            self.wifi_scrollable,
-            text="Clique em 'Escanear Wi-Fi' para começar",
-            style='Secondary.TLabel'
-        )
-        placeholder.pack(expand=True, pady=20)
+        # Lista em um único Text (linhas com tags), com scroll
+        self.wifi_text = self._create_list_text(panel)
+        self._show_placeholder(self.wifi_text, "Clique em 'Escanear Wi-Fi' para começar")
         
         return panel
     
@@ -232,39 +342,150 @@ class MonitorGUI:
         self.devices_header = ttk.Label(panel, text="Dispositivos Conectados", style='Header.TLabel')
         self.devices_header.pack(pady=10, padx=10, anchor='w')
         
-        # Container com scroll
-        scroll_container = ttk.Frame(panel, style='Surface.TFrame')
-        scroll_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        # Lista em um único Text (linhas com tags), com scroll
+        self.devices_text = self._create_list_text(panel)
+        self._show_placeholder(self.devices_text, "Clique em 'Escanear Rede' para começar")
         
-        # Canvas para scroll
-        self.devices_canvas = tk.Canvas(
-            scroll_container,
+        return panel
+    
+    def _create_list_text(self, panel) -> tk.Text:
+        """
+        Cria o Text somente leitura usado como lista de um painel.
+        
+        Cada item é um par de linhas formatadas por tags, então o painel tem
+        sempre os mesmos widgets, qualquer que seja o número de itens.
+        
+        Args:
+            panel: Frame do painel
+            
+        Returns:
+            tk.Text: Widget da lista
+        """
+        text = tk.Text(
+            panel,
+            state='disabled',
+            wrap='none',
             bg=COLORS['surface'],
-            highlightthickness=0
+            fg=COLORS['text'],
+            relief='flat',
+            borderwidth=0,
+            highlightthickness=0,
+            cursor='arrow',
+            padx=0,
+            pady=0
         )
-        scrollbar = ttk.Scrollbar(scroll_container, orient="vertical", command=self.devices_canvas.yview)
-        self.devices_scrollable = ttk.Frame(self.devices_canvas, style='Surface.TFrame')
+        scrollbar = ttk.Scrollbar(panel, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scrollbar.set)
+        
+        # Estilo de cada parte de um item
+        text.tag_configure('row', background=COLORS['surface_light'], lmargin1=8, lmargin2=8, rmargin=8)
+        text.tag_configure('title', font=self.fonts['bold'], foreground=COLORS['text'], spacing1=6)
+        text.tag_configure('info', font=self.fonts['tiny'], foreground=COLORS['text_secondary'], spacing3=6)
+        text.tag_configure('signal_high', font=self.fonts['signal'], foreground=COLORS['success'])
+        text.tag_configure('signal_medium', font=self.fonts['signal'], foreground=COLORS['warning'])
+        text.tag_configure('signal_low', font=self.fonts['signal'], foreground=COLORS['danger'])
+        text.tag_configure('online', font=self.fonts['large'], foreground=COLORS['success'])
+        text.tag_configure('gap', font=self.fonts['gap'])
+        text.tag_configure('placeholder', font=self.fonts['small'], foreground=COLORS['text_secondary'],
+                           justify='center', spacing1=20)
+        
+        # Coluna da direita (sinal/status) alinhada à borda do painel
+        self._list_binds.append((text, text.bind('<Configure>', self._on_list_resize)))
+        
+        # Empacotados direto no painel, sem frame intermediário
+        # (a barra primeiro, para não perder espaço quando o painel encolhe)
+        scrollbar.pack(side="right", fill="y", padx=(0, 10), pady=(0, 10))
+        text.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=(0, 10))
+        return text
+    
+    def _on_list_resize(self, event):
+        """
+        Agenda o reposicionamento da tabulação da coluna da direita.
         
-        self.devices_scrollable.bind(
-            "<Configure>",
-            lambda e: self.devices_canvas.configure(scrollregion=self.devices_canvas.bbox("all"))
-        )
+        Vários eventos <Configure> seguidos (ex.: arrastar a borda da janela)
+        resultam em um único relayout do Text, no próximo ciclo ocioso.
+        """
+        pending = self._pending_resize
+        if event.widget not in pending:
+            self.root.after_idle(self._apply_list_resize, event.widget)
+        pending[event.widget] = event.width
+    
+    def _apply_list_resize(self, text: tk.Text):
+        """
+        Aplica a última largura registrada para uma lista.
         
-        self.devices_canvas.create_window((0, 0), window=self.devices_scrollable, anchor="nw")
-        self.devices_canvas.configure(yscrollcommand=scrollbar.set)
+        Args:
+            text (tk.Text): Widget da lista
+        """
+        width = self._pending_resize.pop(text, None)
+        if width is not None:
+            text.configure(tabs=(max(width - 12, 1), 'right'))
+    
+    def _fill_text(self, text: tk.Text, chunks: list):
+        """
+        Substitui o conteúdo de uma lista em uma única chamada de insert.
         
-        self.devices_canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
+        Args:
+            text (tk.Text): Widget da lista
+            chunks (list): Pares alternados texto, tags (formato de ``Text.insert``)
+        """
+        text.configure(state='normal')
+        text.delete('1.0', 'end')
+        text.insert('end', *chunks)
+        text.configure(state='disabled')
+        self._list_items[str(text)] = None
+        self._placeholders.pop(str(text), None)
+    
+    def _show_placeholder(self, text: tk.Text, message: str):
+        """
+        Exibe uma mensagem no lugar dos itens, se ela ainda não estiver exibida.
         
-        # Placeholder inicial
-        placeholder = ttk.Label(
-            self.devices_scrollable,
-            text="Clique em 'Escanear Rede' para começar",
-            style='Secondary.TLabel'
-        )
-        placeholder.pack(expand=True, pady=20)
+        Args:
+            text (tk.Text): Widget da lista
+            message (str): Mensagem do placeholder
+        """
+        if self._placeholders.get(str(text)) == message:
+            # Refresh vazio repetido: o placeholder já está na tela
+            return
+        self._fill_text(text, [message, 'placeholder'])
+        self._placeholders[str(text)] = message
+    
+    def _update_list_items(self, text: tk.Text, items: list):
+        """
+        Atualiza uma lista reaproveitando as linhas dos itens que não mudaram.
         
-        return panel
+        Só os itens diferentes do que está exibido na mesma posição são
+        reescritos; itens excedentes são removidos e novos são acrescentados
+        ao final.
+        
+        Args:
+            text (tk.Text): Widget da lista
+            items (list): Chunks (pares texto, tags) de cada item, em ordem
+        """
+        shown = self._list_items.get(str(text))
+        if shown is None:
+            # Placeholder ou primeira exibição: montar tudo de uma vez
+            self._fill_text(text, [part for chunks in items for part in chunks])
+            self._list_items[str(text)] = items
+            return
+        if items == shown:
+            # Mesmo conteúdo do refresh anterior: nada a reescrever
+            return
+        
+        text.configure(state='normal')
+        for index, (old, new) in enumerate(zip(shown, items)):
+            if old != new:
+                first_line = index * LIST_ITEM_LINES + 1
+                text.delete(f'{first_line}.0', f'{first_line + LIST_ITEM_LINES}.0')
+                text.insert(f'{first_line}.0', *new)
+        
+        if len(items) < len(shown):
+            text.delete(f'{len(items) * LIST_ITEM_LINES + 1}.0', 'end')
+        elif len(items) > len(shown):
+            text.insert('end', *[part for chunks in items[len(shown):] for part in chunks])
+        text.configure(state='disabled')
+        
+        self._list_items[str(text)] = items
     
     def _create_health_panel(self, parent) -> ttk.Frame:
         """
@@ -286,22 +507,47 @@ class MonitorGUI:
         self.health_content = ttk.Frame(panel, style='Surface.TFrame')
         self.health_content.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
         
-        # Placeholder - Score
-        score_label = ttk.Label(
+        # Score e categoria (atualizados via config a cada verificação)
+        self.health_score_label = tk.Label(
             self.health_content,
             text="--",
-            font=('Segoe UI', 48, 'bold'),
-            foreground=COLORS['text_secondary'],
-            background=COLORS['surface']
+            font=self.fonts['score'],
+            fg=COLORS['text_secondary'],
+            bg=COLORS['surface'],
+            wraplength=280
         )
-        score_label.pack(expand=True, pady=(10, 0))
+        self.health_score_label.pack(pady=(15, 0))
         
-        category_label = ttk.Label(
+        self.health_category_label = tk.Label(
             self.health_content,
             text="Verificando...",
-            style='Secondary.TLabel'
+            font=self.fonts['large'],
+            fg=COLORS['text_secondary'],
+            bg=COLORS['surface']
         )
-        category_label.pack()
+        self.health_category_label.pack(pady=(0, 10))
+        
+        # Métricas detalhadas (centralizadas); exibidas só quando relevantes
+        metrics_frame = tk.Frame(self.health_content, bg=COLORS['surface'])
+        metrics_frame.pack(pady=(5, 0))
+        self.health_metric_labels = {
+            name: tk.Label(metrics_frame, font=self.fonts['small'], bg=COLORS['surface'])
+            for name in ('latency', 'packet_loss', 'jitter')
+        }
+        self._visible_metrics = ()
+        self._shown_metrics = {}
+        
+        # Separador visual
+        separator = tk.Frame(self.health_content, bg=COLORS['surface_light'], height=1)
+        separator.pack(fill=tk.X, pady=(20, 10), padx=30)
+        
+        # Gráfico de histórico (exibido a partir de 2 pontos)
+        self.health_canvas = self._create_health_graph(self.health_content)
+        self._graph_visible = False
+        self._graph_xs = []
+        self._graph_points = None
+        self._graph_last_point = None
+        self._graph_redraw_pending = False
         
         return panel
     
@@ -351,278 +597,352 @@ class MonitorGUI:
         )
         self.btn_auto_refresh.pack(side=tk.LEFT)
         
-        # Spacer
-        ttk.Frame(action_bar, style='Custom.TFrame').pack(side=tk.LEFT, expand=True)
-        
-        # Status label
+        # Status label (alinhado à direita pelo próprio pack)
+        self._status_var = tk.StringVar(value="Pronto • Auto-refresh: 5s")
         self.status_label = ttk.Label(
             action_bar,
-            text="Pronto • Auto-refresh: 5s",
+            textvariable=self._status_var,
             style='Secondary.TLabel'
         )
         self.status_label.pack(side=tk.RIGHT)
     
+    def _worker(self):
+        """Executa, em ordem, as tarefas de scan enfileiradas até receber None."""
+        while True:
+            job = self._work_q.get()
+            if job is None:
+                break
+            with self._scan_lock:
+                self._queued_jobs.discard(job)
+            try:
+                job()
+            except Exception:
+                self.logger.exception("Erro em tarefa de scan")
+    
+    def _enqueue(self, job) -> bool:
+        """
+        Enfileira uma tarefa para o worker, ignorando-a se já estiver na fila.
+        
+        Args:
+            job (callable): Tarefa sem argumentos
+            
+        Returns:
+            bool: True se a tarefa foi enfileirada
+        """
+        with self._scan_lock:
+            if job in self._queued_jobs:
+                return False
+            self._queued_jobs.add(job)
+        self._work_q.put(job)
+        return True
+    
+    def _begin_scan(self) -> bool:
+        """
+        Marca o início de um scan, se nenhum outro estiver em andamento.
+        
+        Returns:
+            bool: True se o scan pode começar
+        """
+        with self._scan_lock:
+            if self.is_scanning:
+                return False
+            self.is_scanning = True
+            return True
+    
     def _on_scan_wifi(self):
         """Handler para botão de scan Wi-Fi."""
-        if self.is_scanning:
+        if not self._begin_scan():
             self.logger.warning("Scan já em andamento")
             return
         
         self.logger.info("Iniciando scan Wi-Fi...")
-        self.status_label.config(text="Escaneando redes Wi-Fi...")
+        self._status_var.set("Escaneando redes Wi-Fi...")
+        
+        if hasattr(self.wifi_scanner, 'scan_networks_async'):
+            # Agendar no event loop dedicado (force: o clique sempre executa um scan real,
+            # mesmo com o cache mantido quente pelo scan em segundo plano)
+            future = asyncio.run_coroutine_threadsafe(
+                self.wifi_scanner.scan_networks_async(force=True), self._get_async_loop()
+            )
+            future.add_done_callback(lambda f: self._finish_wifi_scan(f.result))
+            return
         
-        # Executar em thread separada
-        thread = threading.Thread(target=self._scan_wifi_thread, daemon=True)
-        thread.start()
+        # Executar no worker
+        self._enqueue(self._scan_wifi_thread)
+    
+    def _get_async_loop(self) -> asyncio.AbstractEventLoop:
+        """Retorna o event loop dos scans assíncronos, iniciando sua thread na primeira chamada."""
+        if self._async_loop is None:
+            self._async_loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=self._async_loop.run_forever, name='GUIAsyncLoop', daemon=True)
+            thread.start()
+        return self._async_loop
     
     def _scan_wifi_thread(self):
-        """Thread para executar scan Wi-Fi."""
+        """Executa o scan Wi-Fi (na thread do worker)."""
+        self._finish_wifi_scan(lambda: self.wifi_scanner.scan_networks(force=True))
+    
+    def _finish_wifi_scan(self, get_networks):
+        """
+        Obtém o resultado do scan Wi-Fi e agenda a atualização da GUI.
+        
+        Args:
+            get_networks (callable): Retorna a lista de redes ou levanta o erro do scan
+        """
         try:
-            self.is_scanning = True
-            networks = self.wifi_scanner.scan_networks()
+            networks = get_networks()
+            
+            # Ordenar e formatar aqui, fora da thread do Tk
+            rows = None if networks is self._shown_networks else self._wifi_rows(networks)
             
             # Atualizar GUI na thread principal
-            self.root.after(0, self._update_wifi_display, networks)
+            self.root.after(0, self._update_wifi_display, networks, rows)
             
         except Exception as e:
             self.logger.exception("Erro ao escanear Wi-Fi")
+            self.root.after(0, self._status_var.set, "Pronto")
             self.root.after(0, self._show_error, f"Erro ao escanear Wi-Fi: {str(e)}")
         finally:
             self.is_scanning = False
-            self.root.after(0, lambda: self.status_label.config(text="Pronto"))
     
-    def _update_wifi_display(self, networks):
+    def _wifi_rows(self, networks) -> list:
+        """
+        Ordena as redes por sinal (melhor primeiro) e monta os itens da lista.
+        
+        Não toca em widgets, então pode rodar na thread do scan.
+        
+        Args:
+            networks (list): Lista de redes detectadas
+            
+        Returns:
+            list: Itens no formato de ``_wifi_item_chunks``
+        """
+        networks_sorted = sorted(networks, key=lambda x: x.get('signal_percent', 0), reverse=True)
+        return [self._wifi_item_chunks(net) for net in networks_sorted]
+    
+    def _update_wifi_display(self, networks, rows: Optional[list] = None):
         """
         Atualiza display de redes Wi-Fi no frame scrollável.
         
         Args:
             networks (list): Lista de redes detectadas
+            rows (list): Itens já ordenados e formatados por ``_wifi_rows``
+                (opcional; montados aqui se omitidos)
         """
+        if networks is self._shown_networks:
+            # Scan servido pelo cache do scanner: nenhuma mudança a redesenhar
+            self._status_var.set(f"Encontradas {len(networks)} redes")
+            return
+        self._shown_networks = networks
+        
         self.logger.info(f"Exibindo {len(networks)} redes")
         
         # Atualizar apenas o header fixo
         self.wifi_header.config(text=f"Redes Wi-Fi ({len(networks)})")
         
-        # Limpar apenas o conteúdo scrollável
-        for widget in self.wifi_scrollable.winfo_children():
-            widget.destroy()
-        
         if not networks:
-            placeholder = ttk.Label(
-                self.wifi_scrollable,
-                text="Nenhuma rede encontrada",
-                style='Secondary.TLabel'
-            )
-            placeholder.pack(expand=True, pady=20)
-            self.status_label.config(text="Nenhuma rede encontrada")
+            self._show_placeholder(self.wifi_text, "Nenhuma rede encontrada")
+            self._status_var.set("Nenhuma rede encontrada")
             return
         
-        # Ordenar por sinal (melhor primeiro)
-        networks_sorted = sorted(networks, key=lambda x: x.get('signal_percent', 0), reverse=True)
-        
-        # Exibir cada rede no frame scrollável
-        for net in networks_sorted:
-            self._create_wifi_item(self.wifi_scrollable, net)
+        if rows is None:
+            rows = self._wifi_rows(networks)
         
-        # Forçar atualização do canvas
-        self.wifi_scrollable.update_idletasks()
-        self.wifi_canvas.configure(scrollregion=self.wifi_canvas.bbox("all"))
+        # Reescrever só as linhas que mudaram
+        self._update_list_items(self.wifi_text, rows)
         
-        self.status_label.config(text=f"Encontradas {len(networks)} redes")
+        self._status_var.set(f"Encontradas {len(networks)} redes")
     
     def _on_scan_network(self):
         """Handler para botão de scan de rede."""
-        if self.is_scanning:
+        if not self._begin_scan():
             self.logger.warning("Scan já em andamento")
             return
         
         self.logger.info("Iniciando scan de rede...")
-        self.status_label.config(text="Escaneando dispositivos...")
+        self._status_var.set("Escaneando dispositivos...")
         
-        # Executar em thread separada
-        thread = threading.Thread(target=self._scan_network_thread, daemon=True)
-        thread.start()
+        # Executar no worker
+        self._enqueue(self._scan_network_thread)
     
     def _scan_network_thread(self):
-        """Thread para executar scan de rede."""
+        """Executa o scan de rede (na thread do worker)."""
         try:
-            self.is_scanning = True
             devices = self.network_scanner.scan_devices(use_nmap=False)
             
+            # Formatar aqui, fora da thread do Tk
+            rows = [self._device_item_chunks(device) for device in devices]
+            
             # Atualizar GUI na thread principal
-            self.root.after(0, self._update_devices_display, devices)
+            self.root.after(0, self._update_devices_display, devices, rows)
             
         except Exception as e:
             self.logger.exception("Erro ao escanear rede")
+            self.root.after(0, self._status_var.set, "Pronto")
             self.root.after(0, self._show_error, f"Erro ao escanear rede: {str(e)}")
         finally:
             self.is_scanning = False
-            self.root.after(0, lambda: self.status_label.config(text="Pronto"))
     
-    def _update_devices_display(self, devices):
+    def _update_devices_display(self, devices, rows: Optional[list] = None):
         """
         Atualiza display de dispositivos no frame scrollável.
         
         Args:
             devices (list): Lista de dispositivos detectados
+            rows (list): Itens já formatados por ``_device_item_chunks``
+                (opcional; montados aqui se omitidos)
         """
         self.logger.info(f"Exibindo {len(devices)} dispositivos")
         
         # Atualizar apenas o header fixo
         self.devices_header.config(text=f"Dispositivos Conectados ({len(devices)})")
         
-        # Limpar apenas o conteúdo scrollável
-        for widget in self.devices_scrollable.winfo_children():
-            widget.destroy()
-        
         if not devices:
-            placeholder = ttk.Label(
-                self.devices_scrollable,
-                text="Nenhum dispositivo encontrado",
-                style='Secondary.TLabel'
-            )
-            placeholder.pack(expand=True, pady=20)
-            self.status_label.config(text="Nenhum dispositivo encontrado")
+            self._show_placeholder(self.devices_text, "Nenhum dispositivo encontrado")
+            self._status_var.set("Nenhum dispositivo encontrado")
             return
         
-        # Exibir cada dispositivo no frame scrollável
-        for device in devices:
-            self._create_device_item(self.devices_scrollable, device)
+        if rows is None:
+            rows = [self._device_item_chunks(device) for device in devices]
         
-        # Forçar atualização do canvas
-        self.devices_scrollable.update_idletasks()
-        self.devices_canvas.configure(scrollregion=self.devices_canvas.bbox("all"))
+        # Reescrever só as linhas que mudaram
+        self._update_list_items(self.devices_text, rows)
         
-        self.status_label.config(text=f"Encontrados {len(devices)} dispositivos")
+        self._status_var.set(f"Encontrados {len(devices)} dispositivos")
     
     def _on_check_health(self):
-        """Handler para botão de verificar saúde."""
+        """
+        Handler para botão de verificar saúde.
+        
+        Pedidos mais próximos que HEALTH_CHECK_MIN_INTERVAL da verificação
+        anterior (ex.: clique logo após o auto-refresh) são adiados e
+        agrupados em uma única verificação ao fim do intervalo.
+        """
+        remaining = self._last_health_check + HEALTH_CHECK_MIN_INTERVAL - time.monotonic()
+        if remaining > 0:
+            if 'health_check' not in self._after_ids:
+                self._after_ids['health_check'] = self.root.after(
+                    int(remaining * 1000) + 1, self._run_deferred_health_check
+                )
+            return
+        self._last_health_check = time.monotonic()
+        
         self.logger.info("Verificando saúde da conexão...")
-        self.status_label.config(text="Verificando saúde...")
+        self._status_var.set("Verificando saúde...")
         
-        # Executar em thread separada
-        thread = threading.Thread(target=self._check_health_thread, daemon=True)
-        thread.start()
+        # Executar no worker (uma verificação pendente basta)
+        self._enqueue(self._check_health_thread)
+    
+    def _run_deferred_health_check(self):
+        """Executa a verificação de saúde adiada pelo limite de frequência."""
+        self._after_ids.pop('health_check', None)
+        if not self.is_closing:
+            self._on_check_health()
     
     def _check_health_thread(self):
-        """Thread para verificar saúde."""
+        """Verifica a saúde da conexão (na thread do worker)."""
         try:
             # Obter score detalhado
             health_data = self.health_tracker.get_health_score(detailed=True)
             
-            # Extrair score e categoria
+            # Extrair score, categoria e métricas (da mesma medição)
             if isinstance(health_data, dict):
                 score = health_data['score']
                 category = health_data['category']
+                metrics = self._health_metrics(health_data)
             else:
                 # Fallback para versão antiga
                 score = health_data
                 category = self.health_tracker.get_health_category(score)
+                metrics = {}
             
             # Atualizar GUI na thread principal
-            self.root.after(0, self._update_health_display, score, category)
+            self.root.after(0, self._update_health_display, score, category, metrics)
             
         except Exception as e:
+            if self.is_closing:
+                # Pings interrompidos pelo stop_monitoring() do fechamento
+                return
             self.logger.exception("Erro ao verificar saúde")
+            self.root.after(0, self._status_var.set, "Pronto")
             self.root.after(0, self._show_error, f"Erro ao verificar saúde: {str(e)}")
-        finally:
-            self.root.after(0, lambda: self.status_label.config(text="Pronto"))
     
-    def _create_wifi_item(self, parent, network):
+    def _health_metrics(self, health_data: dict) -> dict:
         """
-        Cria item visual melhorado para uma rede Wi-Fi.
+        Normaliza e formata as métricas detalhadas de saúde para exibição.
+        
+        Não toca em widgets, então roda na thread do worker.
+        
+        Args:
+            health_data (dict): Resultado de ``get_health_score(detailed=True)``
+            
+        Returns:
+            dict: nome -> (texto, cor) das métricas a exibir
+        """
+        def as_number(value):
+            # Valores ausentes ou não numéricos viram None
+            return value if isinstance(value, (int, float)) else None
+        
+        metrics = {}
+        
+        # Latência (o tracker informa {'avg', 'min', 'max'}; exibimos a média)
+        latency = health_data.get('latency')
+        if isinstance(latency, dict):
+            latency = latency.get('avg')
+        latency = as_number(latency)
+        if latency is not None and latency > 0:
+            latency_color = COLORS['success'] if latency < 50 else (COLORS['warning'] if latency < 100 else COLORS['danger'])
+            metrics['latency'] = (f"📡 {latency:.0f}ms", latency_color)
+        
+        # Perda de pacotes (apenas se houver perda > 0)
+        packet_loss = as_number(health_data.get('packet_loss'))
+        if packet_loss is not None and packet_loss > 0:
+            loss_color = COLORS['warning'] if packet_loss < 10 else COLORS['danger']
+            metrics['packet_loss'] = (f"⚠️ {packet_loss:.0f}% perda", loss_color)
+        
+        # Jitter (apenas se > 5ms para não poluir)
+        jitter = as_number(health_data.get('jitter'))
+        if jitter is not None and jitter > 5:
+            jitter_color = COLORS['warning'] if jitter < 30 else COLORS['danger']
+            metrics['jitter'] = (f"📈 {jitter:.0f}ms", jitter_color)
+        
+        return metrics
+    
+    def _wifi_item_chunks(self, network) -> list:
+        """
+        Monta as linhas de uma rede Wi-Fi para a lista.
         
         Args:
-            parent: Widget pai
             network (dict): Dados da rede
+            
+        Returns:
+            list: Pares texto, tags para ``Text.insert``
         """
-        # Container do item com borda arredondada e sombra sutil
-        item_frame = tk.Frame(
-            parent,
-            bg=COLORS['surface_light'],
-            highlightbackground=COLORS['background'],
-            highlightthickness=1,
-            bd=0,
-        )
-        # Remover margens laterais para ocupar toda largura
-        item_frame.pack(fill=tk.X, pady=1, padx=0)
-
         # Cor baseada no sinal
         signal = network.get('signal_percent', 0)
-        if signal >= 70:
-            signal_color = COLORS['success']
-        elif signal >= 40:
-            signal_color = COLORS['warning']
-        else:
-            signal_color = COLORS['danger']
-
-        # Layout horizontal super compacto
+        signal_tag = _SIGNAL_TAGS[max(0, min(100, int(signal)))]
+        
         ssid = network.get('ssid', 'Unknown')
         channel = network.get('channel', '?')
         security = network.get('security', 'Unknown')
-        info_text = f"Canal {channel} • {security}"
-
-        # Frame principal horizontal
-        row = tk.Frame(item_frame, bg=COLORS['surface_light'])
-        row.pack(fill=tk.X, expand=True, padx=0, pady=6)
-
-        # Coluna esquerda: SSID e info
-        left = tk.Frame(row, bg=COLORS['surface_light'])
-        left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ssid_label = tk.Label(
-            left,
-            text=f"📡 {ssid}",
-            font=('Segoe UI', 10, 'bold'),
-            fg=COLORS['text'],
-            bg=COLORS['surface_light'],
-            anchor='w',
-            padx=0, pady=0
-        )
-        ssid_label.pack(anchor='w')
-        info_label = tk.Label(
-            left,
-            text=info_text,
-            font=('Segoe UI', 8),
-            fg=COLORS['text_secondary'],
-            bg=COLORS['surface_light'],
-            anchor='w',
-            padx=0, pady=0
-        )
-        info_label.pack(anchor='w')
-
-        # Coluna direita: Sinal
-        right = tk.Frame(row, bg=COLORS['surface_light'])
-        right.pack(side=tk.RIGHT, padx=(6, 0))
-        signal_label = tk.Label(
-            right,
-            text=f"{signal}%",
-            font=('Segoe UI', 13, 'bold'),
-            fg=signal_color,
-            bg=COLORS['surface_light'],
-            padx=0, pady=0
-        )
-        signal_label.pack()
+        
+        return [
+            f"📡 {ssid}\t", ('row', 'title'),
+            f"{signal}%\n", ('row', 'title', signal_tag),
+            f"Canal {channel} • {security}\n", ('row', 'info'),
+            "\n", 'gap',
+        ]
     
-    def _create_device_item(self, parent, device):
+    def _device_item_chunks(self, device) -> list:
         """
-        Cria item visual melhorado para um dispositivo.
+        Monta as linhas de um dispositivo para a lista.
         
         Args:
-            parent: Widget pai
             device (dict): Dados do dispositivo
+            
+        Returns:
+            list: Pares texto, tags para ``Text.insert``
         """
-        # Container do item com borda arredondada e sombra sutil
-        item_frame = tk.Frame(
-            parent,
-            bg=COLORS['surface_light'],
-            highlightbackground=COLORS['background'],
-            highlightthickness=1,
-            bd=0,
-        )
-        # Remover margens laterais para ocupar toda largura
-        item_frame.pack(fill=tk.X, pady=2, padx=0)
-        
-        # Layout horizontal compacto
         ip = device.get('ip', 'Unknown')
         hostname = device.get('hostname', 'Unknown')
         mac = device.get('mac', 'Unknown')
@@ -631,312 +951,224 @@ class MonitorGUI:
         else:
             info_text = f"MAC: {mac}"
         
-        # Frame principal horizontal
-        row = tk.Frame(item_frame, bg=COLORS['surface_light'])
-        row.pack(fill=tk.X, expand=True, padx=0, pady=6)
-        
-        # Coluna esquerda: IP e info
-        left = tk.Frame(row, bg=COLORS['surface_light'])
-        left.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        ip_label = tk.Label(
-            left,
-            text=f"🖥️ {ip}",
-            font=('Segoe UI', 10, 'bold'),
-            fg=COLORS['text'],
-            bg=COLORS['surface_light'],
-            anchor='w'
-        )
-        ip_label.pack(anchor='w')
-        info_label = tk.Label(
-            left,
-            text=info_text,
-            font=('Segoe UI', 8),
-            fg=COLORS['text_secondary'],
-            bg=COLORS['surface_light'],
-            anchor='w'
-        )
-        info_label.pack(anchor='w', pady=(2, 0))
-        
-        # Coluna direita: Status
-        right = tk.Frame(row, bg=COLORS['surface_light'])
-        right.pack(side=tk.RIGHT, padx=(10, 0))
-        status_label = tk.Label(
-            right,
-            text="●",
-            font=('Segoe UI', 14),
-            fg=COLORS['success'],
-            bg=COLORS['surface_light']
-        )
-        status_label.pack()
+        return [
+            f"🖥️ {ip}\t", ('row', 'title'),
+            "●\n", ('row', 'title', 'online'),
+            f"{info_text}\n", ('row', 'info'),
+            "\n", 'gap',
+        ]
     
-    def _update_health_display(self, score, category):
+    def _update_health_display(self, score, category, metrics: Optional[dict] = None):
         """
         Atualiza display de saúde com gráfico em tempo real.
         
         Args:
             score (int): Score de saúde
             category (str): Categoria de saúde
+            metrics (dict): Métricas já formatadas por ``_health_metrics`` (opcional)
         """
         self.logger.info(f"Score: {score}, Categoria: {category}")
         
         # Adicionar ao histórico
-        now = datetime.now()
+        now = time.monotonic()
         self.health_history.append(score)
         self.health_timestamps.append(now)
         
-        # Limpar apenas o conteúdo (não o header)
-        for widget in self.health_content.winfo_children():
-            widget.destroy()
-        
         # Cor baseada no score
-        if score >= 80:
-            score_color = COLORS['success']
-        elif score >= 60:
-            score_color = COLORS['warning']
-        else:
-            score_color = COLORS['danger']
-        
-        # Score grande (com tamanho limitado para não sair da tela)
-        score_label = tk.Label(
-            self.health_content,
-            text=str(score),
-            font=('Segoe UI', 60, 'bold'),
-            fg=score_color,
-            bg=COLORS['surface'],
-            wraplength=280
-        )
-        score_label.pack(pady=(15, 0))
+        score_color = _score_color(score)
         
-        # Categoria
-        category_label = tk.Label(
-            self.health_content,
-            text=category,
-            font=('Segoe UI', 14),
-            fg=score_color,
-            bg=COLORS['surface']
-        )
-        category_label.pack(pady=(0, 10))
+        if (score, category) != self._last_health:
+            self.health_score_label.config(text=str(score), fg=score_color)
+            self.health_category_label.config(text=category, fg=score_color)
+            self._last_health = (score, category)
         
-        # Obter informações detalhadas
-        health_data = self.health_tracker.get_health_score(detailed=True)
+        self._show_health_metrics(metrics or {})
         
-        # Frame para métricas detalhadas (centralizado)
-        metrics_frame = tk.Frame(self.health_content, bg=COLORS['surface'])
-        metrics_frame.pack(pady=(5, 0))
-        
-        # Latência
-        latency = health_data.get('latency')
-        if latency is not None and isinstance(latency, (int, float)) and latency > 0:
-            latency_color = COLORS['success'] if latency < 50 else (COLORS['warning'] if latency < 100 else COLORS['danger'])
-            latency_label = tk.Label(
-                metrics_frame,
-                text=f"📡 {latency:.0f}ms",
-                font=('Segoe UI', 9),
-                fg=latency_color,
-                bg=COLORS['surface']
-            )
-            latency_label.pack(side=tk.LEFT, padx=8)
+        # Gráfico de histórico
+        if len(self.health_history) >= 2:
+            if not self._graph_visible:
+                self.health_canvas.pack(pady=(10, 15))
+                self._graph_visible = True
+            self._request_graph_redraw()
         
-        # Perda de pacotes (apenas se houver perda > 0)
-        packet_loss = health_data.get('packet_loss')
-        if packet_loss is not None and isinstance(packet_loss, (int, float)) and packet_loss > 0:
-            loss_color = COLORS['warning'] if packet_loss < 10 else COLORS['danger']
-            loss_label = tk.Label(
-                metrics_frame,
-                text=f"⚠️ {packet_loss:.0f}% perda",
-                font=('Segoe UI', 9),
-                fg=loss_color,
-                bg=COLORS['surface']
-            )
-            loss_label.pack(side=tk.LEFT, padx=8)
+        self._status_var.set(f"Saúde: {category} ({score}/100)")
+    
+    def _show_health_metrics(self, metrics: dict):
+        """
+        Atualiza os labels de métricas, reempacotando só se o conjunto visível mudar.
         
-        # Jitter (apenas se > 5ms para não poluir)
-        jitter = health_data.get('jitter')
-        if jitter is not None and isinstance(jitter, (int, float)) and jitter > 5:
-            jitter_color = COLORS['warning'] if jitter < 30 else COLORS['danger']
-            jitter_label = tk.Label(
-                metrics_frame,
-                text=f"📈 {jitter:.0f}ms",
-                font=('Segoe UI', 9),
-                fg=jitter_color,
-                bg=COLORS['surface']
-            )
-            jitter_label.pack(side=tk.LEFT, padx=8)
+        Args:
+            metrics (dict): nome -> (texto, cor) das métricas a exibir
+        """
+        if metrics == self._shown_metrics:
+            return
+        self._shown_metrics = metrics
         
-        # Separador visual
-        separator = tk.Frame(self.health_content, bg=COLORS['surface_light'], height=1)
-        separator.pack(fill=tk.X, pady=(20, 10), padx=30)
+        for name, (text, color) in metrics.items():
+            self.health_metric_labels[name].config(text=text, fg=color)
         
-        # Gráfico de histórico
-        if len(self.health_history) >= 2:
-            self._draw_health_graph(self.health_content)
+        visible = tuple(name for name in self.health_metric_labels if name in metrics)
+        if visible == self._visible_metrics:
+            return
         
-        self.status_label.config(text=f"Saúde: {category} ({score}/100)")
+        for label in self.health_metric_labels.values():
+            label.pack_forget()
+        for name in visible:
+            self.health_metric_labels[name].pack(side=tk.LEFT, padx=8)
+        self._visible_metrics = visible
     
-    def _draw_health_graph(self, parent):
+    def _create_health_graph(self, parent) -> tk.Canvas:
         """
-        Desenha gráfico minimalista e limpo de histórico de saúde.
+        Cria o canvas do gráfico de saúde com todos os seus itens.
+        
+        A camada estática (linhas de referência e rótulos) é desenhada uma
+        vez; linha, área, marcador do último ponto e rodapé são criados vazios
+        e depois apenas reposicionados por ``_draw_health_graph``.
         
         Args:
             parent: Widget pai
+            
+        Returns:
+            tk.Canvas: Canvas do gráfico (ainda não empacotado)
         """
-        # Dimensões do canvas (maior e mais espaçoso)
-        canvas_width = 320
-        canvas_height = 160
-        padding_left = 40
-        padding_right = 15
-        padding_top = 20
-        padding_bottom = 30
-        
-        self.health_canvas = tk.Canvas(
+        canvas = tk.Canvas(
             parent,
-            width=canvas_width,
-            height=canvas_height,
+            width=GRAPH_WIDTH,
+            height=GRAPH_HEIGHT,
             bg=COLORS['surface'],
             highlightthickness=0
         )
-        self.health_canvas.pack(pady=(10, 15))
         
-        # Área útil do gráfico
-        graph_width = canvas_width - padding_left - padding_right
-        graph_height = canvas_height - padding_top - padding_bottom
+        graph_height = GRAPH_HEIGHT - GRAPH_PAD_TOP - GRAPH_PAD_BOTTOM
         
-        # Desenhar linhas de referência sutis (apenas 3 linhas)
-        reference_values = [100, 50, 0]
-        for value in reference_values:
-            y = padding_top + graph_height - (graph_height * value / 100)
-            
-            # Linha tracejada
-            dash_length = 3
-            for x in range(padding_left, canvas_width - padding_right, dash_length * 2):
-                self.health_canvas.create_line(
-                    x, y, min(x + dash_length, canvas_width - padding_right), y,
-                    fill=COLORS['surface_light'], width=1
-                )
-            
-            # Label do valor
-            self.health_canvas.create_text(
-                padding_left - 8, y,
+        # Área preenchida: cor sólida pré-misturada com o fundo (25% da cor
+        # primária), mais barata de pintar que um stipple. Criada antes das
+        # linhas de referência para que elas continuem visíveis por cima
+        fill_id = canvas.create_polygon(
+            0, 0, 0, 0, 0, 0,
+            fill=_blend(COLORS['primary'], COLORS['surface'], 0.25), outline=''
+        )
+        
+        # Linhas de referência sutis (apenas 3), cada uma um único item tracejado
+        for value in (100, 50, 0):
+            y = GRAPH_PAD_TOP + graph_height - (graph_height * value / 100)
+            canvas.create_line(
+                GRAPH_PAD_LEFT, y, GRAPH_WIDTH - GRAPH_PAD_RIGHT, y,
+                fill=COLORS['surface_light'], width=1, dash=(3, 3)
+            )
+            canvas.create_text(
+                GRAPH_PAD_LEFT - 8, y,
                 text=str(value),
                 fill=COLORS['text_secondary'],
-                font=('Segoe UI', 9),
+                font=self.fonts['small'],
                 anchor='e'
             )
         
-        # Desenhar área preenchida sob a linha (gradiente visual)
-        if len(self.health_history) >= 2:
-            points = []
-            
-            # Calcular pontos da linha
-            for i, score in enumerate(self.health_history):
-                x = padding_left + (graph_width * i / (len(self.health_history) - 1))
-                y = padding_top + graph_height - (graph_height * score / 100)
-                points.append((x, y))
-            
-            # Desenhar área preenchida (polígono)
-            if len(points) >= 2:
-                poly_points = []
-                
-                # Começar do canto inferior esquerdo
-                poly_points.extend([points[0][0], padding_top + graph_height])
-                
-                # Adicionar todos os pontos da linha
-                for x, y in points:
-                    poly_points.extend([x, y])
-                
-                # Fechar no canto inferior direito
-                poly_points.extend([points[-1][0], padding_top + graph_height])
-                
-                # Criar polígono com transparência simulada
-                self.health_canvas.create_polygon(
-                    poly_points,
-                    fill=COLORS['primary'],
-                    outline='',
-                    stipple='gray25'  # Padrão pontilhado para simular transparência
-                )
-            
-            # Desenhar linha principal (mais grossa)
-            line_points = []
-            for x, y in points:
-                line_points.extend([x, y])
-            
-            self.health_canvas.create_line(
-                line_points,
-                fill=COLORS['primary'],
-                width=3,
-                smooth=True,
-                capstyle=tk.ROUND,
-                joinstyle=tk.ROUND
-            )
+        # Itens dinâmicos
+        self._graph_items = {
+            'fill': fill_id,
+            'line': canvas.create_line(0, 0, 0, 0, fill=COLORS['primary'], width=3, smooth=True,
+                                       capstyle=tk.ROUND, joinstyle=tk.ROUND),
+            # Marcador do último ponto: um único oval com contorno grosso
+            'marker': canvas.create_oval(0, 0, 0, 0, width=2),
+            'value': canvas.create_text(0, 0, font=self.fonts['bold']),
+            'footer': canvas.create_text(GRAPH_WIDTH / 2, GRAPH_HEIGHT - 12, fill=COLORS['text_secondary'],
+                                         font=self.fonts['tiny'], anchor='center'),
+        }
+        return canvas
+    
+    def _request_graph_redraw(self):
+        """Agenda um redesenho do gráfico para o próximo ciclo ocioso do Tk (vários pedidos viram um)."""
+        if not self._graph_redraw_pending:
+            self._graph_redraw_pending = True
+            self.root.after_idle(self._redraw_health_graph)
+    
+    def _redraw_health_graph(self):
+        """Executa o redesenho agendado por ``_request_graph_redraw``."""
+        # Limpar antes de desenhar: um pedido feito durante o desenho agenda outro
+        self._graph_redraw_pending = False
+        if not self.is_closing:
+            self._draw_health_graph()
+    
+    def _draw_health_graph(self):
+        """Atualiza o gráfico de histórico de saúde reposicionando os itens existentes."""
+        canvas = self.health_canvas
+        items = self._graph_items
+        
+        # Área útil do gráfico
+        graph_width = GRAPH_WIDTH - GRAPH_PAD_LEFT - GRAPH_PAD_RIGHT
+        graph_height = GRAPH_HEIGHT - GRAPH_PAD_TOP - GRAPH_PAD_BOTTOM
+        bottom = GRAPH_PAD_TOP + graph_height
+        
+        # Calcular pontos da linha: as posições X só dependem da quantidade de
+        # pontos, então são reaproveitadas enquanto ela não muda
+        count = len(self.health_history)
+        if len(self._graph_xs) != count:
+            step = graph_width / (count - 1)
+            self._graph_xs = [GRAPH_PAD_LEFT + step * i for i in range(count)]
+        scale = graph_height / 100
+        line_points = [
+            coord
+            for x, score in zip(self._graph_xs, self.health_history)
+            for coord in (x, bottom - score * scale)
+        ]
+        
+        # Linha e área só mudam se algum ponto mudou (ex.: histórico cheio e estável)
+        if line_points != self._graph_points:
+            self._graph_points = line_points
             
-            # Desenhar apenas o último ponto (mais destaque)
-            last_x, last_y = points[-1]
-            last_score = self.health_history[-1]
+            # Área preenchida: do canto inferior esquerdo, pela linha, até o canto inferior direito.
+            # Com poucos pontos (início do monitoramento) fica só a linha.
+            # A lista vai inteira como argumento (sem *), achatada pelo _flatten em C do Tkinter
+            if count >= GRAPH_MIN_FILL_POINTS:
+                canvas.coords(items['fill'], (line_points[0], bottom), line_points, (line_points[-2], bottom))
+            canvas.coords(items['line'], line_points)
+        
+        # Destaque do último ponto (só se posição ou valor mudaram)
+        last_x, last_y = line_points[-2], line_points[-1]
+        last_score = self.health_history[-1]
+        if (last_x, last_y, last_score) != self._graph_last_point:
+            self._graph_last_point = (last_x, last_y, last_score)
             
             # Cor do ponto baseada no score
-            if last_score >= 80:
-                point_color = COLORS['success']
-            elif last_score >= 60:
-                point_color = COLORS['warning']
-            else:
-                point_color = COLORS['danger']
+            point_color = _score_color(last_score)
             
-            # Círculo externo (halo)
-            self.health_canvas.create_oval(
-                last_x - 6, last_y - 6, last_x + 6, last_y + 6,
-                fill='',
-                outline=point_color,
-                width=2
-            )
-            
-            # Círculo interno (preenchido)
-            self.health_canvas.create_oval(
-                last_x - 3, last_y - 3, last_x + 3, last_y + 3,
-                fill=point_color,
-                outline=''
-            )
+            canvas.coords(items['marker'], last_x - 5, last_y - 5, last_x + 5, last_y + 5)
+            canvas.itemconfigure(items['marker'], fill=point_color, outline=point_color)
             
-            # Mostrar valor do último ponto (posicionado dinamicamente)
-            # Se o ponto está muito no topo, mostrar embaixo ao invés de em cima
-            text_y = last_y - 15 if last_y > 30 else last_y + 15
-            text_anchor = 's' if last_y > 30 else 'n'
-            
-            self.health_canvas.create_text(
-                last_x, text_y,
-                text=f"{last_score}",
-                fill=point_color,
-                font=('Segoe UI', 10, 'bold'),
-                anchor=text_anchor
-            )
+            # Valor do último ponto: se o ponto está muito no topo, mostrar embaixo
+            if last_y > 30:
+                canvas.coords(items['value'], last_x, last_y - 15)
+                canvas.itemconfigure(items['value'], text=f"{last_score}", fill=point_color, anchor='s')
+            else:
+                canvas.coords(items['value'], last_x, last_y + 15)
+                canvas.itemconfigure(items['value'], text=f"{last_score}", fill=point_color, anchor='n')
         
         # Informação de tempo no rodapé
-        if self.health_timestamps:
-            elapsed = (datetime.now() - self.health_timestamps[0]).total_seconds()
-            if elapsed < 60:
-                time_info = f"Últimos {int(elapsed)}s"
-            else:
-                time_info = f"Últimos {int(elapsed / 60)}min"
-            
-            self.health_canvas.create_text(
-                canvas_width / 2, canvas_height - 12,
-                text=f"{len(self.health_history)} pontos • {time_info}",
-                fill=COLORS['text_secondary'],
-                font=('Segoe UI', 8),
-                anchor='center'
-            )
+        elapsed = time.monotonic() - self.health_timestamps[0]
+        if elapsed < 60:
+            time_info = f"Últimos {int(elapsed)}s"
+        else:
+            time_info = f"Últimos {int(elapsed / 60)}min"
+        canvas.itemconfigure(items['footer'], text=f"{len(self.health_history)} pontos • {time_info}")
     
     def _toggle_auto_refresh(self):
         """Alterna o auto-refresh."""
         self.auto_refresh = not self.auto_refresh
         
+        # Com o auto-refresh pausado, o scan Wi-Fi em segundo plano também para
         if self.auto_refresh:
-            self.btn_auto_refresh.config(text="⏸️ Pausar Auto-Refresh")
-            self.status_label.config(text="Pronto • Auto-refresh: 5s")
-            self.logger.info("Auto-refresh ativado")
-        else:
-            self.btn_auto_refresh.config(text="▶️ Retomar Auto-Refresh")
-            self.status_label.config(text="Pronto • Auto-refresh pausado")
-            self.logger.info("Auto-refresh pausado")
+            if hasattr(self.wifi_scanner, 'resume'):
+                self.wifi_scanner.resume()
+        elif hasattr(self.wifi_scanner, 'pause'):
+            self.wifi_scanner.pause()
+        
+        # Botão e status atualizados juntos, no mesmo callback: o Tk adia o
+        # relayout para o ciclo ocioso, então as duas mudanças geram um só
+        button_text, status_text = AUTO_REFRESH_TEXTS[self.auto_refresh]
+        self.btn_auto_refresh.config(text=button_text)
+        self._status_var.set(status_text)
+        self.logger.info("Auto-refresh ativado" if self.auto_refresh else "Auto-refresh pausado")
     
     def _schedule_auto_refresh(self):
         """Agenda atualização automática a cada 5 segundos."""
@@ -948,7 +1180,25 @@ class MonitorGUI:
             self._on_check_health()
         
         # Agendar próxima atualização
-        self.root.after(5000, self._schedule_auto_refresh)  # 5 segundos
+        self._after_ids['auto_refresh'] = self.root.after(5000, self._schedule_auto_refresh)  # 5 segundos
+    
+    def _poll_wifi_results(self):
+        """Consome a fila do scan Wi-Fi em segundo plano e exibe o resultado mais recente."""
+        if self.is_closing:
+            return
+        
+        latest = None
+        while True:
+            try:
+                latest = self.wifi_results.get_nowait()
+            except queue.Empty:
+                break
+        
+        if latest is not None and self.auto_refresh and not self.is_scanning:
+            _, networks = latest
+            self._update_wifi_display(networks)
+        
+        self._after_ids['wifi_results'] = self.root.after(WIFI_RESULTS_POLL_MS, self._poll_wifi_results)
     
     def _show_error(self, message):
         """
@@ -971,6 +1221,8 @@ class MonitorGUI:
     
     def _on_closing(self):
         """Handler para fechamento da janela."""
+        if self.is_closing:
+            return
         self.logger.info("Fechando aplicação...")
         
         # Sinalizar que está fechando
@@ -981,7 +1233,36 @@ class MonitorGUI:
         if self.health_tracker.is_monitoring:
             self.health_tracker.stop_monitoring()
         
-        # Fechar janela
+        # Cancelar os callbacks periódicos ainda agendados
+        for after_id in self._after_ids.values():
+            self.root.after_cancel(after_id)
+        self._after_ids.clear()
+        
+        # Encerrar o worker após a tarefa atual
+        self._work_q.put(None)
+        
+        # Parar event loop dos scans assíncronos
+        if self._async_loop is not None:
+            self._async_loop.call_soon_threadsafe(self._async_loop.stop)
+        
+        # Liberar os comandos Tcl dos bindings antes de destruir os widgets
+        for widget, bind_id in self._list_binds:
+            widget.unbind('<Configure>', bind_id)
+        self._list_binds.clear()
+        
+        # Esconder a janela já; destruí-la quando o worker terminar (ou no prazo)
+        self.root.withdraw()
+        self._close_deadline = time.monotonic() + WORKER_JOIN_TIMEOUT
+        self._finish_closing()
+    
+    def _finish_closing(self):
+        """Destrói a janela assim que o worker terminar, sem bloquear o mainloop esperando por ele."""
+        if self._worker_thread.is_alive() and time.monotonic() < self._close_deadline:
+            self.root.after(CLOSE_POLL_MS, self._finish_closing)
+            return
+        
+        # Sair do mainloop e fechar janela
+        self.root.quit()
         self.root.destroy()
 
 
@@ -991,9 +1272,9 @@ if __name__ == "__main__":
     
     # Mock dos scanners para teste
     class MockScanner:
-        def scan_networks(self):
+        def scan_networks(self, timeout=10, force=False):
             return []
-        def scan_devices(self, use_nmap=True):
+        def scan_devices(self, use_nmap=False):
             return []
         def get_health_score(self):
             return 85
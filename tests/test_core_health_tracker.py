@@ -1,25 +1,232 @@
-from src.core.health_tracker import HealthTracker
+import asyncio
+import subprocess
+import time
+
+import pytest
+
+from src.core import health_tracker
+from src.core.health_tracker import HealthTracker, MetricsHistory, PingInterrupted
 
 
 def test_ping_test_and_check_connectivity(monkeypatch):
-    print("TEST: test_ping_test_and_check_connectivity — patch ping_test to return latency and call check_connectivity")
+    print("TEST: test_ping_test_and_check_connectivity — patch _ping_async to return latency and call check_connectivity")
     tracker = HealthTracker()
 
-    # Patch ping_test to return a small latency (ms)
-    monkeypatch.setattr(tracker, "ping_test", lambda host=None, count=1, timeout=5: 12.3)
+    # Patch the async ping to return a small latency (ms)
+    async def fake_ping(host, count=1, timeout=5):
+        return 12.3
+
+    monkeypatch.setattr(tracker, "_ping_async", fake_ping)
 
     ok, host = tracker.check_connectivity(hosts=["8.8.8.8"])  # should use our patched ping
     assert isinstance(ok, bool)
     assert ok is True
 
 
+def test_check_connectivity_returns_on_first_responder(monkeypatch):
+    print("TEST: test_check_connectivity_returns_on_first_responder — a slow host must not delay the result")
+    tracker = HealthTracker()
+
+    async def fake_ping(host, count=1, timeout=5):
+        if host == "slow":
+            await asyncio.sleep(5)
+            return 1.0
+        return 30.0
+
+    monkeypatch.setattr(tracker, "_ping_async", fake_ping)
+
+    start = time.monotonic()
+    ok, host = tracker.check_connectivity(hosts=["slow", "fast"])
+    assert (ok, host) == (True, "fast")
+    assert time.monotonic() - start < 2
+
+
 def test_get_health_score_returns_expected_structure(monkeypatch):
-    print("TEST: test_get_health_score_returns_expected_structure — patch ping_test and call get_health_score(detailed=True)")
+    print("TEST: test_get_health_score_returns_expected_structure — patch ping_test_multi and call get_health_score(detailed=True)")
     tracker = HealthTracker()
-    # Ensure ping_test returns a deterministic value
-    monkeypatch.setattr(tracker, "ping_test", lambda host=None, count=1, timeout=5: 20.0)
+    # Ensure ping_test_multi returns deterministic samples
+    monkeypatch.setattr(tracker, "ping_test_multi", lambda host=None, count=10, timeout=5: [20.0] * count)
 
     result = tracker.get_health_score(detailed=True)
     assert isinstance(result, dict)
     assert "score" in result
     assert isinstance(result["score"], int)
+
+
+def test_health_check_after_stop_monitoring_counts_every_ping(monkeypatch):
+    print("TEST: test_health_check_after_stop_monitoring_counts_every_ping — a past stop_monitoring() does not cut later checks short")
+    tracker = HealthTracker()
+    tracker.os_type = "Windows"
+    tracker._icmp_enabled = False  # force the per-ping Windows loop
+    calls = []
+
+    def fake_ping_test(host=None, count=1, timeout=5):
+        calls.append(host)
+        return 20.0
+
+    monkeypatch.setattr(tracker, "ping_test", fake_ping_test)
+
+    tracker.start_monitoring()
+    tracker.stop_monitoring()
+    result = tracker.get_health_score(detailed=True)
+
+    assert len(calls) == 10
+    assert result["packet_loss"] == 0.0
+    assert result["pings_successful"] == result["pings_total"] == 10
+
+
+def test_interrupted_health_check_is_not_scored_as_loss(monkeypatch):
+    print("TEST: test_interrupted_health_check_is_not_scored_as_loss — stop_monitoring() mid-run raises instead of inflating packet loss")
+    tracker = HealthTracker()
+    tracker.os_type = "Windows"
+    tracker._icmp_enabled = False
+    calls = []
+
+    def fake_ping_test(host=None, count=1, timeout=5):
+        calls.append(host)
+        if len(calls) == 3:
+            tracker.stop_monitoring()
+        return 20.0
+
+    monkeypatch.setattr(tracker, "ping_test", fake_ping_test)
+
+    with pytest.raises(PingInterrupted):
+        tracker.get_health_score(detailed=True)
+    assert len(calls) == 3
+
+
+def test_ping_test_multi_parses_every_sample(monkeypatch):
+    print("TEST: test_ping_test_multi_parses_every_sample — patch subprocess.run and check per-reply RTTs")
+    tracker = HealthTracker()
+    tracker.os_type = "Linux"
+    tracker._icmp_enabled = False  # force the subprocess path even if icmplib is installed
+    output = (
+        b"64 bytes from 8.8.8.8: icmp_seq=1 ttl=117 time=12.3 ms\n"
+        b"64 bytes from 8.8.8.8: icmp_seq=3 ttl=117 time=15 ms\n"
+    )
+    monkeypatch.setattr(
+        "src.core.health_tracker.subprocess.run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, stdout=output, stderr=b""),
+    )
+
+    assert tracker.ping_test_multi("8.8.8.8", count=3) == [12.3, 15.0]
+
+
+def test_metrics_history_wraps_and_skips_missing_latency():
+    print("TEST: test_metrics_history_wraps_and_skips_missing_latency — overflow the ring buffer and read columns back")
+    history = MetricsHistory(capacity=3)
+    for i, latency in enumerate([10.0, None, 30.0, 40.0]):
+        history.append(float(i), latency, 50 + i)
+
+    assert len(history) == 3
+    # The oldest sample (10.0) was overwritten; None is not a valid latency
+    assert history.latencies() == [30.0, 40.0]
+    assert history.rows(2) == [(2.0, 30.0, 52), (3.0, 40.0, 53)]
+    assert history.rows()[0] == (1.0, None, 51)
+    assert history.connected_count() == 2
+    assert history.connected_count(1) == 1
+
+    restored = MetricsHistory(capacity=3)
+    restored.load_bytes(history.to_bytes())
+    assert restored.rows() == history.rows()
+
+
+def test_compute_report_reuses_result_until_new_metric(monkeypatch):
+    print("TEST: test_compute_report_reuses_result_until_new_metric — diagnosis runs once per metrics version")
+    tracker = HealthTracker()
+    calls = []
+
+    def fake_diagnose():
+        calls.append(1)
+        return {'connected': True}
+
+    monkeypatch.setattr(tracker, "diagnose_connection", fake_diagnose)
+
+    first = tracker.compute_report()
+    assert tracker.compute_report() is first
+    assert len(calls) == 1
+
+    tracker.metrics.append(time.time(), 20.0, 90)
+    report = tracker.compute_report()
+    assert len(calls) == 2
+    assert report['stats']['successful_tests'] >= 1
+
+
+def test_diagnose_connection_runs_phases_concurrently(monkeypatch):
+    print("TEST: test_diagnose_connection_runs_phases_concurrently — health, DNS and best host overlap")
+    tracker = HealthTracker()
+
+    def slow(value):
+        def run(*args, **kwargs):
+            time.sleep(0.3)
+            return value
+        return run
+
+    health = {'score': 90, 'latency': {'avg': 20.0}, 'packet_loss': 0, 'jitter': 1.0}
+    monkeypatch.setattr(tracker, "check_connectivity", lambda: (True, "8.8.8.8"))
+    monkeypatch.setattr(tracker, "get_health_score", slow(health))
+    monkeypatch.setattr(tracker, "test_dns_resolution", slow(12.0))
+    monkeypatch.setattr(tracker, "get_best_ping_host", slow("1.1.1.1"))
+
+    start = time.perf_counter()
+    diagnosis = tracker.diagnose_connection()
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.8
+    assert diagnosis['health_score'] is health
+    assert diagnosis['dns_resolution_time'] == 12.0
+    assert diagnosis['optimal_host'] == "1.1.1.1"
+
+
+def test_ping_target_resolution_is_cached(monkeypatch):
+    print("TEST: test_ping_target_resolution_is_cached — hostnames resolve once per TTL, IPs never")
+    tracker = HealthTracker()
+    calls = []
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        calls.append(host)
+        return [(2, 3, 1, '', ('93.184.216.34', 0))]
+
+    monkeypatch.setattr(health_tracker.socket, "getaddrinfo", fake_getaddrinfo)
+
+    assert tracker._resolve_target('8.8.8.8') == '8.8.8.8'
+    assert tracker._resolve_target('example.com') == '93.184.216.34'
+    assert asyncio.run(tracker._resolve_target_async('example.com')) == '93.184.216.34'
+    assert calls == ['example.com']
+
+
+def test_health_category_boundaries():
+    print("TEST: test_health_category_boundaries — category table matches the >= 80/60/40 cutoffs")
+    tracker = HealthTracker()
+    scores = [0, 39.9, 40, 59, 60, 79.5, 80, 100]
+    assert [tracker.get_health_category(s) for s in scores] == [
+        "Ruim", "Ruim", "Regular", "Regular", "Bom", "Bom", "Excelente", "Excelente",
+    ]
+
+
+def test_close_persists_final_snapshot(tmp_path, monkeypatch):
+    print("TEST: test_close_persists_final_snapshot — close() flushes the pending snapshot and stops the writer")
+    monkeypatch.setattr(health_tracker, "HISTORY_WRITE_INTERVAL", 5.0)
+    tracker = HealthTracker()
+    tracker.history_file = tmp_path / "history.bin"
+
+    tracker.metrics.append(time.time(), 10.0, 90)
+    tracker._save_history()
+    deadline = time.monotonic() + 5
+    while not tracker.history_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tracker.history_file.exists()
+
+    # This snapshot lands while the writer is backing off
+    tracker.metrics.append(time.time(), 20.0, 80)
+    tracker._save_history()
+
+    start = time.perf_counter()
+    tracker.close()
+    assert time.perf_counter() - start < 1.0
+    assert not tracker._writer_thread.is_alive()
+
+    saved = MetricsHistory()
+    saved.load_bytes(tracker.history_file.read_bytes())
+    assert saved.rows() == tracker.metrics.rows()
+    assert not (tmp_path / "history.bin.tmp").exists()
@@ -1,16 +1,29 @@
+import asyncio
+import socket
+import struct
+
+import pytest
+
+from src.core import network_scanner
 from src.core.network_scanner import NetworkScanner
 
 
 SAMPLE_DEVICES = [{"ip": "192.168.1.2", "mac": "AA:BB:CC", "hostname": "device1"}]
 
 
+@pytest.fixture(autouse=True)
+def no_raw_icmp(monkeypatch):
+    """Keep ping-scan tests on the patched async path even when run as root."""
+    monkeypatch.setattr(network_scanner, "_open_raw_icmp_socket", lambda: None)
+
+
 def test_scan_devices_uses_arp_when_requested(monkeypatch):
     """When caller disables nmap, scan_devices should call the ARP method."""
     print("TEST: test_scan_devices_uses_arp_when_requested — patch _scan_with_arp and call scan_devices(use_nmap=False)")
     scanner = NetworkScanner()
 
     # Patch ARP scanner to return our sample devices
-    monkeypatch.setattr(scanner, "_scan_with_arp", lambda: SAMPLE_DEVICES)
+    monkeypatch.setattr(scanner, "_scan_with_arp", lambda resolve_names=True: SAMPLE_DEVICES)
 
     devices = scanner.scan_devices(use_nmap=False)
     assert isinstance(devices, list)
@@ -27,3 +40,305 @@ def test_local_ip_and_detect_range(monkeypatch):
     assert isinstance(detected, str)
     # basic sanity: network should contain the first three octets
     assert "172.16.5." in detected or detected.startswith("172.16.5")
+
+
+def test_resolve_hostname_caches_results(monkeypatch):
+    print("TEST: test_resolve_hostname_caches_results — repeated lookups (hits and misses) query DNS once per IP")
+    monkeypatch.setattr(network_scanner, "_hostname_cache", {})
+    calls = []
+
+    def fake_gethostbyaddr(ip):
+        calls.append(ip)
+        if ip == "10.0.0.1":
+            return ("router.lan", [], [ip])
+        raise socket.herror(1, "Unknown host")
+
+    monkeypatch.setattr(network_scanner.socket, "gethostbyaddr", fake_gethostbyaddr)
+    scanner = NetworkScanner("10.0.0.0/24")
+
+    for _ in range(3):
+        assert scanner.resolve_hostname("10.0.0.1") == "router.lan"
+        assert scanner.resolve_hostname("10.0.0.2") is None
+
+    assert calls == ["10.0.0.1", "10.0.0.2"]
+
+
+def test_resolve_hostnames_batches_uncached_ips(monkeypatch):
+    print("TEST: test_resolve_hostnames_batches_uncached_ips — cached IPs skip getnameinfo, misses are cached")
+    monkeypatch.setattr(network_scanner, "_hostname_cache", {})
+    network_scanner._store_hostname("10.0.0.1", "router.lan")
+    calls = []
+
+    def fake_getnameinfo(sockaddr, flags):
+        calls.append(sockaddr[0])
+        if sockaddr[0] == "10.0.0.2":
+            return ("printer.lan", "0")
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    monkeypatch.setattr(network_scanner.socket, "getnameinfo", fake_getnameinfo)
+    scanner = NetworkScanner("10.0.0.0/24")
+
+    hostnames = scanner._resolve_hostnames(["10.0.0.1", "10.0.0.2", "10.0.0.3"])
+    assert hostnames == {"10.0.0.1": "router.lan", "10.0.0.2": "printer.lan", "10.0.0.3": None}
+    assert sorted(calls) == ["10.0.0.2", "10.0.0.3"]
+
+    # Second round is served entirely from the cache, including the IP without PTR
+    assert scanner._resolve_hostnames(["10.0.0.2", "10.0.0.3"]) == {"10.0.0.2": "printer.lan", "10.0.0.3": None}
+    assert len(calls) == 2
+
+
+def test_scan_devices_defaults_to_arp(monkeypatch):
+    print("TEST: test_scan_devices_defaults_to_arp — scan_devices() without arguments skips nmap")
+    scanner = NetworkScanner("10.0.0.0/24")
+    monkeypatch.setattr(scanner, "_scan_with_arp", lambda resolve_names=True: SAMPLE_DEVICES)
+
+    def fail_nmap():
+        raise AssertionError("nmap should not run by default")
+
+    monkeypatch.setattr(scanner, "_scan_with_nmap", fail_nmap)
+    assert scanner.scan_devices() == SAMPLE_DEVICES
+
+
+def test_local_ip_is_cached_until_invalidated(monkeypatch):
+    print("TEST: test_local_ip_is_cached_until_invalidated — one UDP socket per process until invalidate_cache()")
+    NetworkScanner.invalidate_cache()
+    created = []
+
+    class FakeSocket:
+        def __init__(self, *args):
+            created.append(self)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def connect(self, address):
+            pass
+
+        def getsockname(self):
+            return ("192.168.50.7", 40000)
+
+    monkeypatch.setattr(network_scanner.socket, "socket", FakeSocket)
+
+    assert NetworkScanner().network_range == "192.168.50.0/24"
+    assert NetworkScanner().get_local_ip() == "192.168.50.7"
+    assert len(created) == 1
+
+    NetworkScanner.invalidate_cache()
+    assert NetworkScanner("10.0.0.0/24").get_local_ip() == "192.168.50.7"
+    assert len(created) == 2
+    NetworkScanner.invalidate_cache()
+
+
+def test_ping_scan_covers_whole_range(monkeypatch):
+    print("TEST: test_ping_scan_covers_whole_range — every host of a /24 is pinged unless max_hosts is set")
+    monkeypatch.setattr(network_scanner, "icmplib", None)
+    pinged = []
+
+    async def fake_ping(ip):
+        pinged.append(ip)
+        return ip in ("10.0.0.5", "10.0.0.200")
+
+    async def no_names(ips):
+        return {ip: None for ip in ips}
+
+    scanner = NetworkScanner("10.0.0.0/24")
+    monkeypatch.setattr(scanner, "_ping_host_async", fake_ping)
+    monkeypatch.setattr(scanner, "_resolve_many", no_names)
+
+    devices = scanner._scan_with_ping()
+    assert len(pinged) == 254
+    assert [d["ip"] for d in devices] == ["10.0.0.5", "10.0.0.200"]
+
+    pinged.clear()
+    scanner.max_hosts = 100
+    devices = scanner._scan_with_ping()
+    assert len(pinged) == 100
+    assert [d["ip"] for d in devices] == ["10.0.0.5"]
+
+
+def test_ping_scan_resolves_while_sweep_runs(monkeypatch):
+    print("TEST: test_ping_scan_resolves_while_sweep_runs — PTR lookup starts as soon as a host replies")
+    monkeypatch.setattr(network_scanner, "icmplib", None)
+    first_resolved = asyncio.Event()
+
+    async def fake_ping(ip):
+        if ip == "10.0.0.2":
+            # The last host only answers after the first one has been resolved
+            await asyncio.wait_for(first_resolved.wait(), timeout=2)
+        return ip in ("10.0.0.1", "10.0.0.2")
+
+    async def fake_resolve(ips):
+        first_resolved.set()
+        return {ip: "host-" + ip.rsplit(".", 1)[1] for ip in ips}
+
+    scanner = NetworkScanner("10.0.0.0/30")
+    monkeypatch.setattr(scanner, "_ping_host_async", fake_ping)
+    monkeypatch.setattr(scanner, "_resolve_many", fake_resolve)
+
+    devices = scanner._scan_with_ping()
+    assert [(d["ip"], d["hostname"]) for d in devices] == [("10.0.0.1", "host-1"), ("10.0.0.2", "host-2")]
+
+
+def test_get_device_info_uses_last_scan(monkeypatch):
+    print("TEST: test_get_device_info_uses_last_scan — lookup by IP after a scan, cleared when the range changes")
+    monkeypatch.setattr(network_scanner, "icmplib", None)
+
+    async def fake_ping(ip):
+        return ip == "10.0.0.7"
+
+    async def fake_resolve(ips):
+        return {ip: "nas.lan" for ip in ips}
+
+    scanner = NetworkScanner("10.0.0.0/28")
+    monkeypatch.setattr(scanner, "_ping_host_async", fake_ping)
+    monkeypatch.setattr(scanner, "_resolve_many", fake_resolve)
+    scanner._scan_with_ping()
+
+    assert scanner.get_device_info("10.0.0.7")["hostname"] == "nas.lan"
+    assert scanner.get_device_info("10.0.0.8") is None
+
+    scanner.update_network_range("10.0.1.0/28")
+    assert scanner.get_device_info("10.0.0.7") is None
+    assert scanner.get_device_count() == 0
+
+
+class _FakeICMPLib:
+    """Minimal icmplib stand-in where unprivileged sockets are not allowed."""
+
+    class ICMPLibError(Exception):
+        pass
+
+    class SocketPermissionError(ICMPLibError):
+        pass
+
+    def __init__(self):
+        self.calls = []
+
+    async def async_ping(self, address, count, timeout, privileged):
+        self.calls.append((address, privileged))
+        if not privileged:
+            raise self.SocketPermissionError("unprivileged ICMP not allowed")
+
+        class Host:
+            is_alive = address == "10.0.0.1"
+
+        return Host()
+
+
+def test_icmp_ping_switches_to_raw_socket_as_root(monkeypatch):
+    print("TEST: test_icmp_ping_switches_to_raw_socket_as_root — permission error retries privileged when root")
+    fake = _FakeICMPLib()
+    monkeypatch.setattr(network_scanner, "icmplib", fake)
+    monkeypatch.setattr(network_scanner.os, "geteuid", lambda: 0, raising=False)
+
+    scanner = NetworkScanner("10.0.0.0/30")
+    scanner._icmp_privileged = False
+    alive = asyncio.run(scanner._async_ping_sweep(["10.0.0.1", "10.0.0.2"]))
+
+    assert alive == ["10.0.0.1"]
+    assert scanner._icmp_enabled and scanner._icmp_privileged
+    assert ("10.0.0.1", True) in fake.calls and ("10.0.0.2", True) in fake.calls
+
+
+def test_icmp_ping_falls_back_to_command_without_root(monkeypatch):
+    print("TEST: test_icmp_ping_falls_back_to_command_without_root — permission error disables icmplib")
+    fake = _FakeICMPLib()
+    monkeypatch.setattr(network_scanner, "icmplib", fake)
+    monkeypatch.setattr(network_scanner.os, "geteuid", lambda: 1000, raising=False)
+
+    scanner = NetworkScanner("10.0.0.0/30")
+    scanner._icmp_privileged = False
+    assert scanner._handle_icmp_permission_error(False) is False
+    assert not scanner._icmp_enabled
+
+
+def test_cancelled_ping_kills_process(monkeypatch):
+    print("TEST: test_cancelled_ping_kills_process — cancelling the sweep does not leave ping processes behind")
+    killed = []
+
+    class FakeProcess:
+        returncode = None
+
+        async def wait(self):
+            if self.returncode is None:
+                await asyncio.sleep(10)
+            return self.returncode
+
+        def kill(self):
+            killed.append(True)
+            self.returncode = -9
+
+    async def fake_exec(*args, **kwargs):
+        return FakeProcess()
+
+    monkeypatch.setattr(network_scanner.asyncio, "create_subprocess_exec", fake_exec)
+    scanner = NetworkScanner("10.0.0.0/30")
+    scanner._icmp_enabled = False
+
+    async def run():
+        task = asyncio.ensure_future(scanner._ping_host_async("10.0.0.1"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    asyncio.run(run())
+    assert killed == [True]
+
+
+def test_ping_scan_can_skip_name_resolution(monkeypatch):
+    print("TEST: test_ping_scan_can_skip_name_resolution — resolve_names=False makes no PTR lookups")
+    monkeypatch.setattr(network_scanner, "icmplib", None)
+
+    async def fake_ping(ip):
+        return ip == "10.0.0.3"
+
+    async def fail_resolve(ips):
+        raise AssertionError("no reverse lookups expected")
+
+    scanner = NetworkScanner("10.0.0.0/29")
+    monkeypatch.setattr(scanner, "_ping_host_async", fake_ping)
+    monkeypatch.setattr(scanner, "_resolve_many", fail_resolve)
+
+    devices = scanner._scan_with_ping(resolve_names=False)
+    assert devices == [{'ip': "10.0.0.3", 'mac': 'N/A', 'hostname': 'Desconhecido', 'vendor': 'N/A'}]
+
+
+def test_arp_scan_without_scapy_falls_back_to_ping(monkeypatch):
+    print("TEST: test_arp_scan_without_scapy_falls_back_to_ping — missing Scapy is detected once and ping is used")
+    monkeypatch.setattr(network_scanner, "_load_scapy", lambda: None)
+    scanner = NetworkScanner("10.0.0.0/24")
+    monkeypatch.setattr(scanner, "_scan_with_ping", lambda resolve_names=True: SAMPLE_DEVICES)
+
+    assert scanner._scan_with_arp() == SAMPLE_DEVICES
+
+
+def test_iter_hosts_matches_ipaddress_hosts():
+    print("TEST: test_iter_hosts_matches_ipaddress_hosts — integer generator yields the same IPs as hosts()")
+    import ipaddress
+
+    for cidr in ("192.168.1.0/24", "10.1.2.3/30", "172.16.0.0/22", "10.0.0.0/31", "10.0.0.9/32"):
+        network = ipaddress.IPv4Network(cidr, strict=False)
+        expected = [str(ip) for ip in network.hosts()] or [str(network.network_address)]
+        assert list(network_scanner._iter_hosts(cidr)) == expected
+
+
+def test_icmp_echo_packet_and_reply_parsing():
+    print("TEST: test_icmp_echo_packet_and_reply_parsing — echo checksum is valid and replies are matched by id")
+    packet = network_scanner._icmp_echo_packet(0x1234)
+    assert packet[0] == 8
+    assert network_scanner._icmp_checksum(packet) == 0
+
+    ip_header = bytes([0x45]) + bytes(19)
+    reply = bytearray(packet)
+    reply[0] = 0
+    assert network_scanner._is_echo_reply(ip_header + bytes(reply), 0x1234)
+    assert not network_scanner._is_echo_reply(ip_header + bytes(reply), 0x4321)
+    # Our own echo request looped back must not count as a reply
+    assert not network_scanner._is_echo_reply(ip_header + packet, 0x1234)
+    assert not network_scanner._is_echo_reply(ip_header + struct.pack("!BB", 0, 0), 0x1234)
@@ -1,26 +1,33 @@
+import asyncio
+import sys
+import threading
+import time
+
 from src.core.wifi_scanner import WifiScanner
 
 
-SAMPLE_NETWORKS = [
+# Shared read-only sample; tests that hand it to code returning a list use list(...)
+SAMPLE_NETWORKS = (
     {"ssid": "Net1", "bssid": "AA:BB:CC", "rssi": -40, "channel": 6, "security": "WPA2"},
     {"ssid": "Net2", "bssid": "DD:EE:FF", "rssi": -80, "channel": 11, "security": "Open"},
-]
+)
 
 
 def test_scan_networks_uses_internal_scan(monkeypatch):
     print("TEST: test_scan_networks_uses_internal_scan — patching platform scanner and calling scan_networks")
     scanner = WifiScanner()
     # Patch the platform-specific scanner to return our sample networks
-    monkeypatch.setattr(scanner, "_scan_macos", lambda: SAMPLE_NETWORKS)
+    monkeypatch.setattr(scanner, "_scan_macos", lambda timeout=10: list(SAMPLE_NETWORKS))
     networks = scanner.scan_networks()
     assert isinstance(networks, list)
-    assert networks == SAMPLE_NETWORKS
+    assert networks == list(SAMPLE_NETWORKS)
 
 
 def test_get_strongest_network_and_signal():
     print("TEST: test_get_strongest_network_and_signal — populating networks and checking strongest/signal APIs")
     scanner = WifiScanner()
-    scanner.networks = SAMPLE_NETWORKS.copy()
+    # Lookups only read the networks, so the shared tuple needs no copy
+    scanner.networks = SAMPLE_NETWORKS
 
     strongest = scanner.get_strongest_network()
     assert strongest is not None
@@ -30,3 +37,581 @@ def test_get_strongest_network_and_signal():
     assert scanner.get_signal_strength("Net2") == -80
     # unknown SSID -> None
     assert scanner.get_signal_strength("Unknown") is None
+
+
+NETSH_OUTPUT = """
+Nome da interface : Wi-Fi
+Há 2 redes visíveis no momento.
+
+SSID 1 : Casa: 5G
+    Tipo de rede            : Infraestrutura
+    Autenticação            : WPA2-Pessoal
+    Criptografia            : CCMP
+    BSSID 1                 : aa:bb:cc:dd:ee:01
+         Sinal             : 80%
+         Tipo de rádio     : 802.11ac
+         Canal             : 36
+
+SSID 2 : Office
+    Network type            : Infrastructure
+    Authentication          : Open
+    BSSID 1                 : aa:bb:cc:dd:ee:02
+         Signal             : 40%
+         Channel            : 6
+         Channel Utilization: 20 (7 %)
+"""
+
+
+def test_parse_netsh_output_portuguese_and_english():
+    print("TEST: test_parse_netsh_output_portuguese_and_english — netsh fields are parsed in both languages")
+    networks = WifiScanner()._parse_netsh_output(NETSH_OUTPUT)
+
+    assert networks == [
+        {"ssid": "Casa: 5G", "bssid": "aa:bb:cc:dd:ee:01", "rssi": -44, "signal_percent": 80,
+         "channel": 36, "security": "WPA2-Pessoal"},
+        {"ssid": "Office", "bssid": "aa:bb:cc:dd:ee:02", "rssi": -72, "signal_percent": 40,
+         "channel": 6, "security": "Open"},
+    ]
+
+
+def test_parse_iwlist_and_airport_output():
+    print("TEST: test_parse_iwlist_and_airport_output — iwlist cells and airport rows (SSID with spaces)")
+    scanner = WifiScanner()
+
+    iwlist = """wlan0     Scan completed :
+          Cell 01 - Address: AA:BB:CC:DD:EE:01
+                    Channel:11
+                    Frequency:2.462 GHz (Channel 11)
+                    Quality=60/70  Signal level=-50 dBm
+                    ESSID:"Home"
+"""
+    assert scanner._parse_iwlist_output(iwlist) == [
+        {"bssid": "AA:BB:CC:DD:EE:01", "channel": 11, "rssi": -50, "signal_percent": 100, "ssid": "Home",
+         "security": "Unknown"}
+    ]
+
+    airport = """                            SSID BSSID             RSSI CHANNEL HT CC SECURITY (auth/unicast/group)
+                    Coffee Shop aa:bb:cc:dd:ee:03 -67  36,+1   Y  BR NONE
+                           Lab5 aa:bb:cc:dd:ee:04 -80  6       Y  -- WPA2(PSK/AES/AES)
+"""
+    networks = scanner._parse_airport_output(airport)
+    assert [(n["ssid"], n["rssi"], n["channel"], n["security"]) for n in networks] == [
+        ("Coffee Shop", -67, 36, "NONE"),
+        ("Lab5", -80, 6, "WPA2(PSK/AES/AES)"),
+    ]
+
+
+def test_parse_nmcli_output_handles_escaped_colons():
+    print("TEST: test_parse_nmcli_output_handles_escaped_colons — BSSID and SSID colons are escaped in terse mode")
+    output = (
+        "Home:AA\\:BB\\:CC\\:DD\\:EE\\:01:6:75:WPA2\n"
+        "Cafe\\: Free:AA\\:BB\\:CC\\:DD\\:EE\\:02:11:30:\n"
+        "--:AA\\:BB\\:CC\\:DD\\:EE\\:03:1:10:WPA1 WPA2\n"
+    )
+    networks = WifiScanner()._parse_nmcli_output(output)
+
+    assert networks == [
+        {"ssid": "Home", "bssid": "AA:BB:CC:DD:EE:01", "rssi": -48, "signal_percent": 75,
+         "channel": 6, "security": "WPA2"},
+        {"ssid": "Cafe: Free", "bssid": "AA:BB:CC:DD:EE:02", "rssi": -79, "signal_percent": 30,
+         "channel": 11, "security": "Open"},
+    ]
+
+
+def test_run_streaming_parses_process_output_line_by_line():
+    print("TEST: test_run_streaming_parses_process_output_line_by_line — parser consumes the live stdout pipe")
+    script = "import sys; print('Home:AA\\\\:BB\\\\:CC\\\\:DD\\\\:EE\\\\:01:6:75:WPA2'); sys.stderr.write('warn'); sys.exit(3)"
+    scanner = WifiScanner()
+
+    command = (sys.executable, "-c", script)
+    returncode, networks = scanner._run_streaming(command, scanner._parse_nmcli_output)
+
+    assert returncode == 3
+    assert [n["bssid"] for n in networks] == ["AA:BB:CC:DD:EE:01"]
+    # stderr is discarded while streaming and only fetched again on failure
+    assert scanner._command_stderr(command) == "warn"
+
+
+def test_scan_timeout_reaches_the_os_command(monkeypatch):
+    print("TEST: test_scan_timeout_reaches_the_os_command — scan_networks(timeout) bounds every platform command")
+    timeouts = []
+
+    def fake_run_streaming(command, parser, timeout=10, encoding=None):
+        timeouts.append(timeout)
+        return 0, list(SAMPLE_NETWORKS)
+
+    for os_type in ("Windows", "Linux", "Darwin"):
+        scanner = WifiScanner()
+        scanner.os_type = os_type
+        monkeypatch.setattr(scanner, "_wifi_enabled", lambda: True)
+        monkeypatch.setattr(scanner, "_run_streaming", fake_run_streaming)
+        assert scanner.scan_networks(timeout=3) == list(SAMPLE_NETWORKS)
+
+    assert timeouts == [3, 3, 3]
+
+
+def test_scan_networks_reuses_cached_result(monkeypatch):
+    print("TEST: test_scan_networks_reuses_cached_result — warm cache skips the OS scan unless forced")
+    scanner = WifiScanner()
+    calls = []
+
+    def fake_scan(timeout=10):
+        calls.append(1)
+        return list(SAMPLE_NETWORKS)
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+
+    first = scanner.scan_networks()
+    second = scanner.scan_networks()
+    assert second == first == list(SAMPLE_NETWORKS)
+    assert len(calls) == 1
+
+    scanner.scan_networks(force=True)
+    assert len(calls) == 2
+
+    scanner.invalidate_cache()
+    scanner.scan_networks()
+    assert len(calls) == 3
+    assert scanner.get_cache_stats() == {"hits": 1, "misses": 3}
+
+
+def test_empty_scan_clears_networks_without_warming_cache(monkeypatch):
+    print("TEST: test_empty_scan_clears_networks_without_warming_cache — an empty result replaces the list but is never a cache hit")
+    scanner = WifiScanner()
+    results = [list(SAMPLE_NETWORKS), []]
+
+    def fake_scan(timeout=10):
+        return results.pop(0) if results else []
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+
+    scanner.scan_networks()
+    assert scanner.get_network_info("Net1") is not None
+
+    assert scanner.scan_networks(force=True) == []
+    assert scanner.networks == []
+    assert scanner.get_network_info("Net1") is None
+    assert scanner.filter_by_security("WPA2") == []
+
+    scanner.scan_networks()
+    assert scanner.get_cache_stats() == {"hits": 0, "misses": 3}
+
+
+def test_scan_linux_async_prefers_nmcli_over_faster_iwlist(monkeypatch):
+    print("TEST: test_scan_linux_async_prefers_nmcli_over_faster_iwlist — an instant iwlist result never beats nmcli")
+    scanner = WifiScanner()
+    cancelled = []
+    nmcli_networks = [dict(n, security="WPA2") for n in SAMPLE_NETWORKS]
+
+    async def fake_run_async(command, parser, timeout=10):
+        if command[0] == "nmcli":
+            await asyncio.sleep(0.2)
+            return 0, nmcli_networks
+        # Unprivileged iwlist: exits 0 at once with an empty result
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(command[0])
+            raise
+        return 0, []
+
+    monkeypatch.setattr(scanner, "_run_async", fake_run_async)
+    monkeypatch.setattr(scanner, "_wifi_enabled", lambda: True)
+
+    start = time.monotonic()
+    networks = asyncio.run(scanner._scan_linux_async())
+
+    assert networks == nmcli_networks
+    assert time.monotonic() - start < 1
+    # The still-running fallback is cancelled once nmcli answers
+    assert cancelled == ["iwlist"]
+
+
+def test_scan_linux_async_prefers_nmcli_even_if_iwlist_finishes_first(monkeypatch):
+    print("TEST: test_scan_linux_async_prefers_nmcli_even_if_iwlist_finishes_first — finishing order does not pick the winner")
+    scanner = WifiScanner()
+
+    async def fake_run_async(command, parser, timeout=10):
+        if command[0] == "nmcli":
+            await asyncio.sleep(0.1)
+            return 0, list(SAMPLE_NETWORKS)
+        return 0, []
+
+    monkeypatch.setattr(scanner, "_run_async", fake_run_async)
+    monkeypatch.setattr(scanner, "_wifi_enabled", lambda: True)
+
+    assert asyncio.run(scanner._scan_linux_async()) == list(SAMPLE_NETWORKS)
+
+
+def test_scan_linux_async_falls_back_to_iwlist_when_nmcli_fails(monkeypatch):
+    print("TEST: test_scan_linux_async_falls_back_to_iwlist_when_nmcli_fails — iwlist runs in parallel and is used only on nmcli failure")
+    scanner = WifiScanner()
+    iwlist_networks = [dict(n, security="Unknown") for n in SAMPLE_NETWORKS]
+
+    async def fake_run_async(command, parser, timeout=10):
+        if command[0] == "nmcli":
+            await asyncio.sleep(0.3)
+            return 8, []  # NetworkManager not running
+        await asyncio.sleep(0.3)
+        return 0, iwlist_networks
+
+    monkeypatch.setattr(scanner, "_run_async", fake_run_async)
+    monkeypatch.setattr(scanner, "_wifi_enabled", lambda: True)
+
+    start = time.monotonic()
+    assert asyncio.run(scanner._scan_linux_async()) == iwlist_networks
+    # Both commands ran concurrently, not one after the other
+    assert time.monotonic() - start < 0.5
+
+
+def test_network_indexes_follow_assignment():
+    print("TEST: test_network_indexes_follow_assignment — SSID/security lookups use indexes rebuilt on assignment")
+    scanner = WifiScanner()
+    scanner.networks = [
+        {"ssid": "Lab", "rssi": -40, "security": "WPA2-Personal"},
+        {"ssid": "Guest", "rssi": -70, "security": "Open"},
+        {"ssid": "Lab", "rssi": -80, "security": "WPA3"},
+        {"ssid": "Office", "rssi": -55, "security": "WPA2-Enterprise"},
+    ]
+
+    assert scanner.get_signal_strength("Lab") == -40
+    assert scanner.get_network_info("Office")["rssi"] == -55
+    assert scanner.get_network_info("Missing") is None
+    assert [n["rssi"] for n in scanner.filter_by_security("wpa")] == [-40, -80, -55]
+    assert [n["ssid"] for n in scanner.filter_by_security("OPEN")] == ["Guest"]
+
+    scanner.networks = []
+    assert scanner.get_signal_strength("Lab") is None
+    assert scanner.filter_by_security("wpa") == []
+
+
+def test_ssid_filter_drops_untracked_networks_while_parsing():
+    print("TEST: test_ssid_filter_drops_untracked_networks_while_parsing — only tracked SSIDs survive each parser")
+    scanner = WifiScanner()
+    scanner.set_ssid_filter({"Office", "Lab"})
+
+    assert [n["ssid"] for n in scanner._parse_netsh_output(NETSH_OUTPUT)] == ["Office"]
+
+    iwlist = """wlan0     Scan completed :
+          Cell 01 - Address: AA:BB:CC:DD:EE:01
+                    Channel:11
+                    Quality=60/70  Signal level=-50 dBm
+                    ESSID:"Home"
+          Cell 02 - Address: AA:BB:CC:DD:EE:02
+                    Channel:1
+                    Quality=40/70  Signal level=-70 dBm
+                    ESSID:"Lab"
+"""
+    assert [n["bssid"] for n in scanner._parse_iwlist_output(iwlist)] == ["AA:BB:CC:DD:EE:02"]
+
+    nmcli = "Home:AA\\:BB\\:CC\\:DD\\:EE\\:01:6:75:WPA2\nLab:AA\\:BB\\:CC\\:DD\\:EE\\:02:1:40:WPA2\n"
+    assert [n["ssid"] for n in scanner._parse_nmcli_output(nmcli)] == ["Lab"]
+
+    scanner.set_ssid_filter(None)
+    assert len(scanner._parse_netsh_output(NETSH_OUTPUT)) == 2
+
+
+def test_get_strongest_network_consumes_parser_stream():
+    print("TEST: test_get_strongest_network_consumes_parser_stream — max() runs straight over the netsh generator")
+    scanner = WifiScanner()
+
+    strongest = scanner.get_strongest_network(scanner._iter_netsh(NETSH_OUTPUT))
+
+    assert strongest["ssid"] == "Casa: 5G"
+    assert scanner.networks == []
+    assert scanner.get_strongest_network(iter(())) is None
+
+
+def test_as_arrays_exposes_columns_rebuilt_per_scan():
+    print("TEST: test_as_arrays_exposes_columns_rebuilt_per_scan — column view follows the current networks")
+    scanner = WifiScanner()
+    scanner.networks = SAMPLE_NETWORKS
+
+    columns = scanner.as_arrays()
+    assert list(columns["rssi"]) == [n["rssi"] for n in SAMPLE_NETWORKS]
+    assert columns["ssid"] == [n["ssid"] for n in SAMPLE_NETWORKS]
+    assert scanner.as_arrays() is columns
+
+    scanner.networks = [{"ssid": "Solo", "rssi": -20, "signal_percent": 100, "channel": 149}]
+    assert list(scanner.as_arrays()["channel"]) == [149]
+    assert scanner.get_strongest_network()["ssid"] == "Solo"
+
+
+def test_signal_conversions_use_exact_integer_steps():
+    print("TEST: test_signal_conversions_use_exact_integer_steps — percent/RSSI conversions avoid float rounding")
+    from src.core.wifi_scanner import _percent_to_rssi, _rssi_to_percent
+
+    # 70 * 0.7 evaluates to 48.999..., which used to truncate to 48
+    assert _percent_to_rssi(70) == -51
+    assert _percent_to_rssi(100) == -30
+    assert _percent_to_rssi(0) == -100
+    assert [_rssi_to_percent(v) for v in (-20, -50, -75, -120)] == [100, 100, 50, 0]
+
+
+def test_parsers_trim_values_inside_the_regex():
+    print("TEST: test_parsers_trim_values_inside_the_regex — padded lines come out trimmed without a per-line strip")
+    scanner = WifiScanner()
+
+    nmcli = ["  Home :AA\\:BB\\:CC\\:DD\\:EE\\:01:6:75:WPA2 WPA3  \n", "Cafe\\: Free:AA\\:BB\\:CC\\:DD\\:EE\\:02:11:30:   \n"]
+    networks = scanner._parse_nmcli_output(iter(nmcli))
+    assert [(n["ssid"], n["security"]) for n in networks] == [("Home", "WPA2 WPA3"), ("Cafe: Free", "Open")]
+
+    netsh = ["SSID 1 : Casa: 5G   \n", "    Sinal             : 80%  \n", "    Canal : 36\n"]
+    assert scanner._parse_netsh_output(iter(netsh))[0]["ssid"] == "Casa: 5G"
+
+
+def test_stable_scans_double_the_cache_ttl(monkeypatch):
+    print("TEST: test_stable_scans_double_the_cache_ttl — unchanged BSSIDs/RSSI extend the cache window")
+    scanner = WifiScanner()
+    changed = [dict(SAMPLE_NETWORKS[0], rssi=-60)]
+    results = [SAMPLE_NETWORKS, SAMPLE_NETWORKS, changed, changed]
+    calls = []
+
+    def fake_scan(timeout=10):
+        calls.append(1)
+        return [dict(n) for n in results[len(calls) - 1]]
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+
+    def age_cache(factor):
+        scanner._last_scan_ts = time.monotonic() - factor * scanner._cache_ttl
+
+    scanner.scan_networks()
+    age_cache(1.5)
+    scanner.scan_networks()  # first scan only: TTL not extended yet
+    assert len(calls) == 2
+
+    age_cache(1.5)
+    scanner.scan_networks()  # same fingerprint twice: served from cache
+    assert len(calls) == 2
+
+    age_cache(2.5)
+    scanner.scan_networks()
+    assert len(calls) == 3
+    age_cache(1.5)
+    scanner.scan_networks()  # environment changed: back to the normal TTL
+    assert len(calls) == 4
+
+
+def test_scan_networks_diff_reports_only_changes(monkeypatch):
+    print("TEST: test_scan_networks_diff_reports_only_changes — added/removed/updated SSIDs between two scans")
+    scanner = WifiScanner()
+    scans = [
+        [{"ssid": "A", "rssi": -40}, {"ssid": "B", "rssi": -60}, {"ssid": "C", "rssi": -70}],
+        [{"ssid": "A", "rssi": -41}, {"ssid": "B", "rssi": -66}, {"ssid": "D", "rssi": -50}],
+    ]
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, lambda timeout=10: scans.pop(0))
+
+    added, removed, updated = scanner.scan_networks_diff()
+    assert [n["ssid"] for n in added] == ["A", "B", "C"]
+    assert removed == updated == []
+
+    # Cache hit: nothing changed
+    assert scanner.scan_networks_diff() == ([], [], [])
+
+    added, removed, updated = scanner.scan_networks_diff(force=True)
+    assert [n["ssid"] for n in added] == ["D"]
+    assert [n["ssid"] for n in removed] == ["C"]
+    assert [n["ssid"] for n in updated] == ["B"]
+
+
+def test_parsed_networks_are_slotted_but_dict_compatible():
+    print("TEST: test_parsed_networks_are_slotted_but_dict_compatible — WifiNetwork has no __dict__ yet reads like a dict")
+    from src.core.wifi_scanner import WifiNetwork
+
+    network = WifiScanner()._parse_netsh_output(NETSH_OUTPUT)[1]
+
+    assert isinstance(network, WifiNetwork)
+    assert not hasattr(network, "__dict__")
+    assert network.rssi == network["rssi"] == network.get("rssi") == -72
+    assert network.get("missing", "x") == "x"
+    assert network.to_dict() == dict(network) == network
+
+
+NETSH_BSS_LOAD_OUTPUT = """
+Interface name : Wi-Fi
+There are 1 networks currently visible.
+
+SSID 1 : Office
+    Network type            : Infrastructure
+    Authentication          : WPA2-Personal
+    Encryption              : CCMP
+    BSSID 1                 : aa:bb:cc:dd:ee:02
+         Signal             : 40%
+         Radio type         : 802.11ax
+         Band               : 5 GHz
+         Channel            : 36
+         Bss Load:
+             Connected Stations:        3
+             Channel Utilization:       20 (7 %)
+             Medium Available Capacity: 31250 (1000000 kbps)
+         Basic rates (Mbps) : 6 12 24
+         Other rates (Mbps) : 9 18 36 48 54
+"""
+
+
+def test_parse_netsh_output_ignores_bss_load_and_rate_lines():
+    print("TEST: test_parse_netsh_output_ignores_bss_load_and_rate_lines — label dispatch skips non-field lines")
+    networks = WifiScanner()._parse_netsh_output(NETSH_BSS_LOAD_OUTPUT)
+
+    assert networks == [
+        {"ssid": "Office", "bssid": "aa:bb:cc:dd:ee:02", "rssi": -72, "signal_percent": 40,
+         "channel": 36, "security": "WPA2-Personal"},
+    ]
+
+
+def test_background_scan_publishes_to_bounded_queue(monkeypatch):
+    print("TEST: test_background_scan_publishes_to_bounded_queue — periodic thread keeps only the newest results")
+    scanner = WifiScanner()
+    calls = []
+
+    def fake_scan(timeout=10):
+        calls.append(1)
+        return [{"ssid": f"Net{len(calls)}", "rssi": -50}]
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+    scanner._cache_ttl = 0  # every iteration performs a real scan
+
+    scanner.start_background(interval=0.01)
+    deadline = time.monotonic() + 2
+    while len(calls) < 5 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    scanner.stop_background(timeout=1)
+
+    assert len(calls) >= 5
+    assert not scanner._background_thread.is_alive()
+    assert scanner.result_q.qsize() <= 2
+    _, networks = scanner.result_q.get_nowait()
+    assert networks[0]["ssid"].startswith("Net")
+
+
+def test_concurrent_scans_share_one_os_scan(monkeypatch):
+    print("TEST: test_concurrent_scans_share_one_os_scan — callers arriving mid-scan wait and reuse its result")
+    scanner = WifiScanner()
+    calls = []
+
+    def fake_scan(timeout=10):
+        calls.append(1)
+        time.sleep(0.2)
+        return list(SAMPLE_NETWORKS)
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+
+    barrier = threading.Barrier(3)
+    results = []
+
+    def worker():
+        barrier.wait()
+        results.append(scanner.scan_networks(force=True))
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 3
+    assert all(result is results[0] for result in results)
+
+
+def test_concurrent_async_scans_share_one_os_scan(monkeypatch):
+    print("TEST: test_concurrent_async_scans_share_one_os_scan — async callers are serialised with the sync lock")
+    scanner = WifiScanner()
+    scanner.os_type = "Linux"
+    calls = []
+
+    async def fake_scan_async(timeout=10):
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return list(SAMPLE_NETWORKS)
+
+    monkeypatch.setattr(scanner, "_scan_linux_async", fake_scan_async)
+
+    async def main():
+        return await asyncio.gather(*(scanner.scan_networks_async(force=True) for _ in range(3)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not scanner._scan_lock.locked()
+
+
+def test_paused_background_scan_skips_os_scan(monkeypatch):
+    print("TEST: test_paused_background_scan_skips_os_scan — pause() stops periodic scans until resume()")
+    scanner = WifiScanner()
+    calls = []
+
+    def fake_scan(timeout=10):
+        calls.append(1)
+        return list(SAMPLE_NETWORKS)
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+    scanner._cache_ttl = 0
+
+    scanner.pause()
+    scanner.start_background(interval=0.01)
+    try:
+        time.sleep(0.1)
+        assert calls == []
+        assert scanner.result_q.empty()
+
+        scanner.resume()
+        deadline = time.monotonic() + 2
+        while not calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert calls
+    finally:
+        scanner.stop_background(timeout=1)
+
+
+def test_linux_wifi_enabled_reads_sysfs(tmp_path):
+    print("TEST: test_linux_wifi_enabled_reads_sysfs — no wireless interface or blocked rfkill means Wi-Fi off")
+    from src.core.wifi_scanner import _linux_wifi_enabled
+
+    (tmp_path / "net" / "eth0").mkdir(parents=True)
+    assert _linux_wifi_enabled(str(tmp_path)) is False
+
+    (tmp_path / "net" / "wlan0" / "wireless").mkdir(parents=True)
+    assert _linux_wifi_enabled(str(tmp_path)) is True
+
+    switch = tmp_path / "rfkill" / "rfkill0"
+    switch.mkdir(parents=True)
+    (switch / "type").write_text("wlan\n")
+    (switch / "soft").write_text("1\n")
+    (switch / "hard").write_text("0\n")
+    assert _linux_wifi_enabled(str(tmp_path)) is False
+
+    (switch / "soft").write_text("0\n")
+    assert _linux_wifi_enabled(str(tmp_path)) is True
+
+
+def test_scan_skips_command_when_radio_is_off(monkeypatch):
+    print("TEST: test_scan_skips_command_when_radio_is_off — disabled Wi-Fi returns [] without spawning a process")
+    scanner = WifiScanner()
+    checks = []
+
+    def radio_off():
+        checks.append(1)
+        return False
+
+    monkeypatch.setattr("src.core.wifi_scanner._linux_wifi_enabled", radio_off)
+    monkeypatch.setattr("src.core.wifi_scanner._windows_wifi_enabled", radio_off)
+    monkeypatch.setattr("src.core.wifi_scanner._macos_wifi_enabled", radio_off)
+
+    def no_process(*args, **kwargs):
+        raise AssertionError("scan command should not run")
+
+    monkeypatch.setattr(scanner, "_run_streaming", no_process)
+
+    for scan in (scanner._scan_windows, scanner._scan_linux, scanner._scan_macos):
+        assert scan() == []
+    # The radio state is cached between scans
+    assert len(checks) == 1
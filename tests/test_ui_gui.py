@@ -0,0 +1,124 @@
+import logging
+import queue
+import threading
+
+import pytest
+
+pytest.importorskip("tkinter")
+
+from src.core.wifi_scanner import WifiScanner
+from src.ui.gui import MonitorGUI
+
+
+SAMPLE_NETWORKS = (
+    {"ssid": "Net1", "bssid": "AA:BB:CC", "rssi": -40, "signal_percent": 86, "channel": 6, "security": "WPA2"},
+)
+
+
+class FakeRoot:
+    """Records after() callbacks instead of running a Tk event loop."""
+
+    def __init__(self):
+        self.calls = queue.Queue()
+
+    def after(self, delay, callback, *args):
+        self.calls.put((callback, args))
+
+
+class FakeVar:
+    def set(self, value):
+        pass
+
+
+class FakeButton:
+    def config(self, **kwargs):
+        pass
+
+
+def make_gui(scanner):
+    # Build the GUI object without __init__, so no display is needed
+    gui = object.__new__(MonitorGUI)
+    gui.logger = logging.getLogger("test_ui_gui")
+    gui.wifi_scanner = scanner
+    gui.root = FakeRoot()
+    gui._status_var = FakeVar()
+    gui._scan_lock = threading.Lock()
+    gui.is_scanning = False
+    gui._async_loop = None
+    gui._shown_networks = None
+    return gui
+
+
+def warm_scanner(monkeypatch):
+    scanner = WifiScanner()
+    calls = []
+
+    def fake_scan(*args):
+        calls.append(1)
+        return list(SAMPLE_NETWORKS)
+
+    async def fake_scan_async(*args):
+        return fake_scan()
+
+    for name in ("_scan_windows", "_scan_linux", "_scan_macos"):
+        monkeypatch.setattr(scanner, name, fake_scan)
+    monkeypatch.setattr(scanner, "_scan_linux_async", fake_scan_async)
+
+    scanner.scan_networks()  # warm the cache, as a previous scan does
+    assert len(calls) == 1
+    return scanner, calls
+
+
+def wait_for_display_update(gui):
+    while True:
+        callback, args = gui.root.calls.get(timeout=5)
+        if getattr(callback, "__name__", "") == "_update_wifi_display":
+            return args
+
+
+def test_wifi_button_worker_scan_misses_warm_cache(monkeypatch):
+    print("TEST: test_wifi_button_worker_scan_misses_warm_cache — the threaded button path forces an OS scan")
+    scanner, calls = warm_scanner(monkeypatch)
+    gui = make_gui(scanner)
+
+    gui.is_scanning = True
+    gui._scan_wifi_thread()
+
+    networks, rows = wait_for_display_update(gui)
+    assert len(calls) == 2
+    assert networks == list(SAMPLE_NETWORKS)
+    assert rows is not None
+    assert gui.is_scanning is False
+
+
+def test_wifi_button_async_scan_misses_warm_cache(monkeypatch):
+    print("TEST: test_wifi_button_async_scan_misses_warm_cache — the async button path forces an OS scan")
+    scanner, calls = warm_scanner(monkeypatch)
+    gui = make_gui(scanner)
+
+    try:
+        gui._on_scan_wifi()
+        networks, _ = wait_for_display_update(gui)
+    finally:
+        if gui._async_loop is not None:
+            gui._async_loop.call_soon_threadsafe(gui._async_loop.stop)
+
+    assert len(calls) == 2
+    assert networks == list(SAMPLE_NETWORKS)
+    assert scanner.get_cache_stats()["misses"] == 2
+
+
+def test_auto_refresh_toggle_pauses_background_scan():
+    print("TEST: test_auto_refresh_toggle_pauses_background_scan — pausing auto-refresh pauses the Wi-Fi scanner")
+    scanner = WifiScanner()
+    gui = make_gui(scanner)
+    gui.auto_refresh = True
+    gui.btn_auto_refresh = FakeButton()
+
+    gui._toggle_auto_refresh()
+    assert gui.auto_refresh is False
+    assert scanner._paused.is_set()
+
+    gui._toggle_auto_refresh()
+    assert gui.auto_refresh is True
+    assert not scanner._paused.is_set()